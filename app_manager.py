@@ -10,6 +10,7 @@ import queue
 import time
 import json, math, shutil
 import collections
+import heapq
 from datetime import datetime
 import hashlib # Add hashlib for generating unique icon filenames
 
@@ -40,7 +41,30 @@ try:
 except ImportError:
     cv2_module = None
 
+try:
+    import av as av_module # Optional: keyframe seeking for video thumbnails
+except ImportError:
+    av_module = None
+
+try:
+    from watchdog.observers import Observer as WatchdogObserver # Optional: live folder updates without polling
+except ImportError:
+    WatchdogObserver = None
+
 from app_manager_utils import ui_creator, file_operations, action_handlers
+from app_manager_utils.thumbnail_cache import ThumbnailDiskCache, decode_thumbnail
+from app_manager_utils.thumbnail_pool import ThumbnailWorkerPool
+from app_manager_utils.photo_image_cache import PhotoImageLRU, ResizedIconCache
+from app_manager_utils.preview_prefetch import PreviewPrefetcher
+from app_manager_utils.source_classifier import SourceTypeClassifier
+from app_manager_utils.thumbnail_prewarm import prewarm_thumbnails_core
+from app_manager_utils.folder_mosaics import build_folder_mosaics_core
+from app_manager_utils.folder_listing import list_folder_core, path_mtime_ns, FolderListingCache
+from app_manager_utils.folder_watcher import FolderWatcher
+from app_manager_utils.grid_layout import GridLayout
+from app_manager_utils.canvas_tiles import CanvasTileRenderer, build_tile_palette, FOLDER_CUSTOM_STYLE, TILE_NAME_AREA_HEIGHT
+from app_manager_utils.perf_stats import perf_log
+from app_manager_utils.operation_tokens import OperationTokens
 
 
 class PhotoVideoManagerApp:
@@ -76,6 +100,7 @@ class PhotoVideoManagerApp:
         self.vlc = vlc_module
         self.imagehash = imagehash_module
         self.cv2 = cv2_module
+        self.av = av_module
 
         self.IMAGE_EXTENSIONS = IMAGE_EXTENSIONS
         self.VIDEO_EXTENSIONS = VIDEO_EXTENSIONS
@@ -84,6 +109,8 @@ class PhotoVideoManagerApp:
         self.CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
         self.THEME_SETTINGS_FILE = os.path.join(self.CONFIG_DIR, THEME_SETTINGS_FILENAME)
         self.FOLDER_THUMB_DB_FILE = os.path.join(self.CONFIG_DIR, FOLDER_THUMB_DB_FILENAME)
+        self.FOLDER_MOSAIC_DB_FILE = os.path.join(self.CONFIG_DIR, FOLDER_MOSAIC_DB_FILENAME)
+        self.FOLDER_MOSAIC_DIR = os.path.join(self.CONFIG_DIR, FOLDER_MOSAIC_DIR_NAME)
         self.TRASH_DIR = os.path.join(self.CONFIG_DIR, TRASH_DIR_NAME)
         os.makedirs(self.TRASH_DIR, exist_ok=True)
 
@@ -91,32 +118,75 @@ class PhotoVideoManagerApp:
         self.CUSTOM_FOLDER_ICONS_DIR = os.path.join(self.CONFIG_DIR, CUSTOM_FOLDER_ICONS_DIR_NAME)
         os.makedirs(self.CUSTOM_FOLDER_ICONS_DIR, exist_ok=True)
 
+        self.THUMBNAIL_CACHE_DIR = os.path.join(self.CONFIG_DIR, THUMBNAIL_CACHE_DIR_NAME)
+        self.thumbnail_disk_cache = ThumbnailDiskCache(self.THUMBNAIL_CACHE_DIR, THUMBNAIL_CACHE_MAX_BYTES)
 
         self.current_folder = tk.StringVar(value="No folder selected")
         self.folder_history = []
-        self.items_in_view = {}
+        self.items_in_view = {} # Tiles currently bound to an item: path -> widget info (visible rows plus a margin)
+        self._free_tiles = {'file': [], 'folder': []} # Unbound tiles waiting to be recycled
+        self.grid_layout = GridLayout(self.thumbnail_size[0] + GRID_TILE_EXTRA_WIDTH,
+                                      self.thumbnail_size[1] + GRID_TILE_EXTRA_HEIGHT,
+                                      GRID_TILE_PADDING, GRID_FRAME_MARGIN)
+        self.errored_item_paths = set()
+        self._thumbnail_requested_paths = set()
 
         self.selected_item_paths = set()
+        self._dirty_visual_paths = set() # Bound tiles whose style is stale, restyled at idle
+        self._restyle_after_id = None
+        self._cursor_item_path = None # Keyboard navigation starts from here
+        self._navigation_direction = 1 # Direction of the last cursor move; previews are prefetched that way
         self.renaming_item_path = None
         self.name_edit_entry = None
         self.original_name_label = None
 
         self.thumbnail_queue = queue.Queue()
-        self.active_thumbnail_thread = None
-        self.cancel_long_operation = threading.Event()
+        self._thumbnail_drain_scheduled = threading.Event()
+        self.thumbnail_pool = ThumbnailWorkerPool(self.thumbnail_disk_cache, self._on_thumbnail_result,
+                                                  THUMBNAIL_WORKER_PROCESSES,
+                                                  video_worker_count=VIDEO_THUMBNAIL_WORKERS,
+                                                  video_timeout_s=VIDEO_THUMBNAIL_TIMEOUT_S,
+                                                  video_timeout_retry_s=VIDEO_TIMEOUT_RETRY_AFTER_S,
+                                                  thumbnail_sizes=[(size, size) for size in GRID_ZOOM_SIZES])
+        self.preview_prefetcher = PreviewPrefetcher(self._load_preview_source, self._on_preview_ready,
+                                                    PREVIEW_CACHE_MAX_ITEMS)
+        self.source_classifier = SourceTypeClassifier(self._classify_source_type, self._on_source_types_ready,
+                                                      SOURCE_TYPE_CACHE_MAX_ITEMS, SOURCE_TYPE_BATCH_SIZE)
+        self.folder_listing_cache = FolderListingCache(FOLDER_LISTING_CACHE_MAX_FOLDERS, FOLDER_LISTING_CACHE_MAX_ITEMS,
+                                                       FOLDER_SNAPSHOT_MAX_FOLDERS)
+        self._listing_mtime_ns = None # Directory mtime taken before the current folder was enumerated
+        self.prewarm_root_folder = None # Root chosen with select_root_folder; pre-warming always covers its tree
+        self.folder_watcher = FolderWatcher(self._on_folder_changes, FOLDER_WATCH_DEBOUNCE_S, FOLDER_WATCH_MAX_DELAY_S,
+                                            FOLDER_WATCH_POLL_INTERVAL_S, observer_class=WatchdogObserver)
+        self.tile_images = PhotoImageLRU(TILE_IMAGE_CACHE_MAX_COUNT, TILE_IMAGE_CACHE_MAX_BYTES,
+                                         self._release_tile_image)
+        self.operation_tokens = OperationTokens()
+        self.folder_load_token = self.operation_tokens.begin('folder')
 
         self.folder_thumb_db = self._load_folder_thumb_db()
+        self.folder_mosaic_db = self._load_folder_mosaic_db()
+        self._mosaic_cells_pending = {} # folder path -> thumbnails requested for its mosaic, not back yet
+        self.folder_icon_cache = ResizedIconCache(FOLDER_ICON_CACHE_MAX_ITEMS, self.Image, self.ImageTk)
 
         self.all_folder_items_raw = []
         self.all_folder_items = []
-        self.displayed_item_count = 0
-        self.current_grid_row = 0
-        self.current_grid_col = 0
+        self.item_index_by_path = {}
         self.is_loading_batch = False
+        self._is_listing_folder = False # A folder is still being enumerated in the background
+        self._load_batch_after_id = None
+        self._tile_bind_cost_ms = None # Moving average of binding one tile, sizes the idle batches
+
+        self._last_scroll_top = 0.0
+        self._scroll_direction = 1
+        self._reprioritize_after_id = None
+        self._last_scroll_time = 0.0
+        self._visible_fill_started_at = None
+        self._visible_paths_awaiting_thumbnail = set()
 
         self.rubber_band_rect = None
         self.rubber_band_start_x = 0
         self.rubber_band_start_y = 0
+        self._rubber_band_cells = None
 
         self.undo_stack = collections.deque(maxlen=UNDO_STACK_MAX_SIZE)
 
@@ -124,6 +194,11 @@ class PhotoVideoManagerApp:
         self.show_images_var = tk.BooleanVar(value=True)
         self.show_videos_var = tk.BooleanVar(value=True)
         self.show_only_screenshots_downloads_var = tk.BooleanVar(value=False) # New filter variable
+        self.prewarm_thumbnails_var = tk.BooleanVar(value=self.prewarm_thumbnails_enabled)
+        self.canvas_tile_renderer_var = tk.BooleanVar(value=self.canvas_tile_renderer_enabled)
+        self.thumbnail_size_var = tk.IntVar(value=self.thumbnail_size[0])
+        self.folder_mosaics_var = tk.BooleanVar(value=self.folder_mosaics_enabled)
+        self.tile_renderer = None # CanvasTileRenderer when tiles are drawn on the canvas, None for widget tiles
 
         self.similar_image_groups = []
         self.image_hashes_cache = {}
@@ -145,14 +220,20 @@ class PhotoVideoManagerApp:
         ui_creator.create_main_content_area(self)
         ui_creator.create_preview_area(self)
         ui_creator.create_action_bar(self)
+        self._set_tile_renderer()
 
-        self.root.after(100, self._process_thumbnail_queue)
         self.update_ui_state()
         self.show_initial_view()
 
 
         self.root.bind("<Delete>", self.on_delete_key_press)
         self.root.bind("<F2>", self.on_f2_key_press)
+        self.root.bind("<Control-plus>", lambda e: self.step_grid_zoom(1))
+        self.root.bind("<Control-equal>", lambda e: self.step_grid_zoom(1))
+        self.root.bind("<Control-minus>", lambda e: self.step_grid_zoom(-1))
+        self.root.bind("<Control-a>", self.select_all_items)
+        for navigation_key in ("<Left>", "<Right>", "<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.root.bind(navigation_key, self.on_grid_navigation_key)
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
         if self.vlc is None:
@@ -168,6 +249,10 @@ class PhotoVideoManagerApp:
 
     def _load_theme_settings(self):
         global PICSNEST_USER_ACCENT_COLOR
+        self.prewarm_thumbnails_enabled = False
+        self.canvas_tile_renderer_enabled = False
+        self.folder_mosaics_enabled = False
+        self.thumbnail_size = GRID_THUMBNAIL_SIZE
         try:
             theme_settings_path = os.path.join(self.CONFIG_DIR, THEME_SETTINGS_FILENAME)
             if os.path.exists(theme_settings_path):
@@ -176,6 +261,11 @@ class PhotoVideoManagerApp:
                     if content.strip():
                         settings = json.loads(content)
                         PICSNEST_USER_ACCENT_COLOR = settings.get("accent_color", PICSNEST_ACCENT_BLUE)
+                        self.prewarm_thumbnails_enabled = bool(settings.get("prewarm_thumbnails", False))
+                        self.canvas_tile_renderer_enabled = bool(settings.get("canvas_tile_renderer", False))
+                        self.folder_mosaics_enabled = bool(settings.get("folder_mosaics", False))
+                        saved_zoom = settings.get("grid_thumbnail_size")
+                        if saved_zoom in GRID_ZOOM_SIZES: self.thumbnail_size = (saved_zoom, saved_zoom)
                     else:
                         PICSNEST_USER_ACCENT_COLOR = PICSNEST_ACCENT_BLUE
             else:
@@ -193,7 +283,11 @@ class PhotoVideoManagerApp:
         try:
             theme_settings_path = os.path.join(self.CONFIG_DIR, THEME_SETTINGS_FILENAME)
             color_to_save = PICSNEST_USER_ACCENT_COLOR if PICSNEST_USER_ACCENT_COLOR else PICSNEST_ACCENT_BLUE
-            settings = {"accent_color": color_to_save}
+            settings = {"accent_color": color_to_save,
+                        "prewarm_thumbnails": self.prewarm_thumbnails_enabled,
+                        "canvas_tile_renderer": self.canvas_tile_renderer_enabled,
+                        "grid_thumbnail_size": self.thumbnail_size[0],
+                        "folder_mosaics": self.folder_mosaics_enabled}
             with open(theme_settings_path, 'w') as f:
                 json.dump(settings, f, indent=4)
         except Exception as e:
@@ -207,7 +301,10 @@ class PhotoVideoManagerApp:
             PICSNEST_USER_ACCENT_COLOR = new_color_tuple[1]
             self._save_theme_settings()
             ui_creator.apply_app_styles(self) 
-            self._refresh_all_item_visuals() 
+            if self.tile_renderer:
+                self.tile_renderer.apply_palette(build_tile_palette(get_current_accent_color()))
+            else:
+                self._refresh_all_item_visuals() 
             self.update_preview_and_info()
             messagebox.showinfo("Accent Color Changed",
                                 "Accent color updated. Some changes may require an application restart to fully apply.",
@@ -234,9 +331,11 @@ class PhotoVideoManagerApp:
 
     def on_closing(self):
         self._save_folder_thumb_db()
-        self.cancel_long_operation.set()
-        if self.active_thumbnail_thread and self.active_thumbnail_thread.is_alive():
-            self.active_thumbnail_thread.join(timeout=0.5)
+        self.operation_tokens.cancel_all()
+        self.thumbnail_pool.shutdown()
+        self.preview_prefetcher.shutdown()
+        self.source_classifier.shutdown()
+        self.folder_watcher.shutdown()
         self._empty_trash_permanently()
         self.root.destroy()
 
@@ -286,6 +385,23 @@ class PhotoVideoManagerApp:
             print(f"Error loading folder thumb DB: {e}")
             return {}
 
+    def _load_folder_mosaic_db(self):
+        try:
+            if os.path.exists(self.FOLDER_MOSAIC_DB_FILE):
+                with open(self.FOLDER_MOSAIC_DB_FILE, 'r') as f:
+                    db = json.load(f)
+                return {key: value for key, value in db.items() if isinstance(value, dict)}
+        except Exception as e:
+            print(f"Error loading folder mosaic DB: {e}")
+        return {}
+
+    def _save_folder_mosaic_db(self):
+        try:
+            with open(self.FOLDER_MOSAIC_DB_FILE, 'w') as f:
+                json.dump(self.folder_mosaic_db, f, indent=4)
+        except Exception as e:
+            print(f"Error saving folder mosaic DB: {e}")
+
     def _save_folder_thumb_db(self):
         try:
             db_to_save = {
@@ -297,9 +413,12 @@ class PhotoVideoManagerApp:
             print(f"Error saving folder thumb DB: {e}")
 
 
-    def on_frame_configure(self, event=None):
+    def on_canvas_configure(self, event=None):
         if hasattr(self, 'canvas') and self.canvas.winfo_exists():
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            if self.grid_layout.set_width(self.canvas.winfo_width()):
+                self._layout_virtual_grid()
+            else:
+                self._sync_visible_tiles()
 
     def _on_mousewheel(self, event, direction=None):
         if not (hasattr(self, 'canvas_content_frame') and self.canvas_content_frame.winfo_ismapped()):
@@ -310,26 +429,289 @@ class PhotoVideoManagerApp:
         elif sys.platform == "darwin": delta = event.delta
         if delta != 0:
             self.canvas.yview_scroll(delta, "units")
-            self.root.after_idle(self.on_scroll_check_lazy_load)
 
-    def on_scroll_check_lazy_load(self):
-        if self.is_loading_batch or self.displayed_item_count >= len(self.all_folder_items): return
-        if not (hasattr(self, 'canvas_content_frame') and self.canvas_content_frame.winfo_ismapped()):
-            return
-        self.canvas.update_idletasks()
-        scroll_info = self.canvas.yview()
-        if (scroll_info[1] > 0.85 or \
-           (scroll_info[0] == 0.0 and scroll_info[1] == 1.0 and self.item_frame.winfo_height() < self.canvas.winfo_height())) \
-           and self.displayed_item_count < len(self.all_folder_items):
-            self._load_next_batch_of_items()
+    def _on_canvas_yscroll(self, first, last):
+        self.canvas_vsb.set(first, last)
+        first = float(first)
+        if first == self._last_scroll_top: return
+        self._scroll_direction = 1 if first > self._last_scroll_top else -1
+        self._last_scroll_top = first
+        self._last_scroll_time = time.monotonic()
+        self._sync_visible_tiles()
+        if self._reprioritize_after_id:
+            self.root.after_cancel(self._reprioritize_after_id)
+        self._reprioritize_after_id = self.root.after(THUMBNAIL_REPRIORITIZE_DELAY_MS, self._on_scroll_settled)
+
+    def _on_scroll_settled(self):
+        self._reprioritize_after_id = None
+        self.thumbnail_pool.reprioritize(self._make_thumbnail_priority_fn(), only_group=self.folder_load_token)
+        self._request_read_ahead_thumbnails()
+        self._start_visible_fill_timer()
+
+    def _visible_index_range(self, margin_rows=0):
+        """Indexes into all_folder_items of the first and last tile in the viewport (last < first when empty)."""
+        if not self.all_folder_items or not hasattr(self, 'canvas'): return 0, -1
+        y_top = self.canvas.canvasy(0)
+        return self.grid_layout.index_range(y_top, y_top + self.canvas.winfo_height(),
+                                            len(self.all_folder_items), margin_rows)
+
+    def _make_thumbnail_priority_fn(self):
+        """
+        Ranks thumbnail jobs against the current viewport: visible tiles first (0), then a
+        read-ahead band in the scroll direction, then everything else by distance, with tiles
+        behind the scroll direction ranked lowest. Items no longer listed are dropped (None).
+        """
+        first_idx, last_idx = self._visible_index_range()
+        scrolling_down = self._scroll_direction > 0
+        band_size = THUMBNAIL_READ_AHEAD_ROWS * self.grid_layout.columns
+        index_by_path = self.item_index_by_path
+
+        def priority_fn(item_data):
+            idx = index_by_path.get(item_data['path'])
+            if idx is None: return None
+            if first_idx <= idx <= last_idx: return 0
+            is_ahead = idx > last_idx if scrolling_down else idx < first_idx
+            distance = idx - last_idx if idx > last_idx else first_idx - idx
+            if is_ahead:
+                return distance if distance <= band_size else band_size + distance
+            return band_size + distance * 4
+        return priority_fn
+
+    def _start_visible_fill_timer(self):
+        first_idx, last_idx = self._visible_index_range()
+        awaiting = set()
+        for item_data in self.all_folder_items[first_idx:last_idx + 1]:
+            info = self.items_in_view.get(item_data['path'])
+            if info and info['type'] == 'file' and not info.get('is_error') and \
+               item_data['path'] not in self.tile_images:
+                awaiting.add(item_data['path'])
+        self._visible_paths_awaiting_thumbnail = awaiting
+        self._visible_fill_started_at = time.perf_counter() if awaiting else None
+
+    def _note_visible_thumbnail_filled(self, item_path):
+        if self._visible_fill_started_at is None: return
+        self._visible_paths_awaiting_thumbnail.discard(item_path)
+        if not self._visible_paths_awaiting_thumbnail:
+            elapsed_ms = (time.perf_counter() - self._visible_fill_started_at) * 1000.0
+            perf_log(f"All visible tiles have thumbnails {elapsed_ms:.0f} ms after scroll")
+            self._visible_fill_started_at = None
+
+    def _release_tile_image(self, item_path):
+        # PhotoImageLRU callback: the item is far off-screen, so normally no tile shows it any more
+        widget_info = self.items_in_view.get(item_path)
+        if widget_info:
+            self._show_tile_placeholder(widget_info)
+
+    def _request_thumbnails(self, items):
+        """Queues thumbnail jobs for file items that have no image, error or pending job yet."""
+        to_request = []
+        for item_data in items:
+            item_path = item_data['path']
+            if item_data['type'] != 'file' or item_path in self.tile_images or \
+               item_path in self.errored_item_paths or item_path in self._thumbnail_requested_paths:
+                continue
+            self._thumbnail_requested_paths.add(item_path)
+            to_request.append(item_data)
+        if to_request:
+            self.thumbnail_pool.submit(self.folder_load_token, to_request, self.thumbnail_size,
+                                       self._make_thumbnail_priority_fn())
+
+    def _request_read_ahead_thumbnails(self):
+        first_idx, last_idx = self._visible_index_range()
+        if last_idx < first_idx: return
+        band_size = THUMBNAIL_READ_AHEAD_ROWS * self.grid_layout.columns
+        if self._scroll_direction > 0:
+            self._request_thumbnails(self.all_folder_items[last_idx + 1:last_idx + 1 + band_size])
+        else:
+            self._request_thumbnails(self.all_folder_items[max(0, first_idx - band_size):first_idx])
+
+    def _trim_tile_images(self):
+        first_idx, last_idx = self._visible_index_range()
+        keep_margin = TILE_IMAGE_KEEP_ROWS * self.grid_layout.columns
+        keep_first, keep_last = first_idx - keep_margin, last_idx + keep_margin
+        index_by_path = self.item_index_by_path
+        self.tile_images.touch(item['path'] for item in self.all_folder_items[first_idx:last_idx + 1])
+
+        def keep_fn(item_path):
+            idx = index_by_path.get(item_path)
+            return idx is not None and keep_first <= idx <= keep_last
+        released = self.tile_images.trim(keep_fn)
+        if released:
+            image_count, image_bytes = self.tile_images.stats()
+            perf_log(f"Released {released} off-screen tile images; {image_count} kept, ~{image_bytes / (1024*1024):.1f} MB")
+
+    def _rebuild_item_index(self):
+        self.item_index_by_path = {item['path']: idx for idx, item in enumerate(self.all_folder_items)}
+
+    @staticmethod
+    def _media_kind(name):
+        ext_lower = os.path.splitext(name)[1].lower()
+        if ext_lower in IMAGE_EXTENSIONS: return 'image'
+        if ext_lower in VIDEO_EXTENSIONS: return 'video'
+        return None
+
+    def _make_item_data(self, path, name, item_type, mtime_ns=None):
+        """
+        media_kind and the file mtime are worked out once per listing (in the lister thread), so filter
+        passes never touch the file name or the disk again. Called off the Tk thread: no Tk calls.
+        """
+        if item_type == 'file' and mtime_ns is None:
+            mtime_ns = path_mtime_ns(path)
+        return {'path': path, 'name': name, 'type': item_type, 'is_error': False,
+                'media_kind': self._media_kind(name) if item_type == 'file' else None,
+                'mtime_ns': mtime_ns}
+
+    @staticmethod
+    def _item_sort_key(item_data):
+        return (item_data['type'] != 'folder', item_data['name'].lower())
+
+    def _sorted_insert_index(self, items, item_data):
+        # Binary search over items in _item_sort_key order (bisect only takes key= from Python 3.10)
+        sort_key = self._item_sort_key(item_data)
+        low, high = 0, len(items)
+        while low < high:
+            mid = (low + high) // 2
+            if self._item_sort_key(items[mid]) > sort_key: high = mid
+            else: low = mid + 1
+        return low
+
+    def _merge_items_into_view(self, sorted_items):
+        """Merges sorted_items (already through the filters) into the view in one pass; returns the first changed index or None."""
+        if not sorted_items: return None
+        first_changed_idx = self._sorted_insert_index(self.all_folder_items, sorted_items[0])
+        self.all_folder_items = list(heapq.merge(self.all_folder_items, sorted_items, key=self._item_sort_key))
+        return first_changed_idx
+
+    def _reflow_grid_from(self, first_changed_idx):
+        """Re-indexes the items from first_changed_idx on and moves only their bound tiles; earlier tiles keep their cells."""
+        for idx in range(first_changed_idx, len(self.all_folder_items)):
+            self.item_index_by_path[self.all_folder_items[idx]['path']] = idx
+        if not hasattr(self, 'canvas') or not self.canvas.winfo_exists(): return
+        self.canvas.configure(scrollregion=self.grid_layout.scroll_region(len(self.all_folder_items)))
+        for item_path, widget_info in list(self.items_in_view.items()):
+            index = self.item_index_by_path.get(item_path)
+            if index is None:
+                self._unbind_tile(item_path)
+            elif index >= first_changed_idx:
+                self._place_tile(widget_info, index)
+        self._sync_visible_tiles()
+
+    def _remove_items_from_grid(self, item_paths):
+        """Drops item_paths from the item lists and closes the gap; other items keep their tiles and thumbnails."""
+        item_paths = set(item_paths)
+        removed_indexes = [self.item_index_by_path.pop(path) for path in item_paths if path in self.item_index_by_path]
+        for item_path in item_paths:
+            self._unbind_tile(item_path)
+            self.tile_images.discard(item_path)
+            self.errored_item_paths.discard(item_path)
+            self._thumbnail_requested_paths.discard(item_path)
+        self.all_folder_items_raw = [item for item in self.all_folder_items_raw if item['path'] not in item_paths]
+        if removed_indexes:
+            self.all_folder_items = [item for item in self.all_folder_items if item['path'] not in item_paths]
+            self._reflow_grid_from(min(removed_indexes))
+        self._refresh_listing_mtime()
+
+    def _refresh_listing_mtime(self):
+        # The item lists now match the folder again, so a snapshot taken when leaving it stays usable
+        if self._is_listing_folder or self._listing_mtime_ns is None: return
+        self._listing_mtime_ns = path_mtime_ns(self.current_folder.get())
+
+    def _insert_items_into_grid(self, new_items):
+        """Adds new_items at their sorted positions (if they pass the filters) and shifts only the tiles after them."""
+        known_paths = {item['path'] for item in self.all_folder_items_raw}
+        added_items = []
+        for item_data in new_items:
+            if item_data['path'] in known_paths: continue
+            known_paths.add(item_data['path'])
+            added_items.append(item_data)
+        if not added_items: return
+        added_items.sort(key=self._item_sort_key)
+        self.all_folder_items_raw = list(heapq.merge(self.all_folder_items_raw, added_items, key=self._item_sort_key))
+        filter_flags = self._filter_flags()
+        first_changed_idx = self._merge_items_into_view(
+            [item_data for item_data in added_items if self._item_passes_filters(item_data, filter_flags)])
+        if first_changed_idx is not None:
+            self._reflow_grid_from(first_changed_idx)
+        self._refresh_listing_mtime()
+
+    def _rename_item_in_grid(self, old_path, new_path):
+        """Moves a renamed item to its new sorted position, carrying its thumbnail, selection and marks along."""
+        tk_image = self.tile_images.get(old_path)
+        self._unbind_tile(old_path)
+        self.tile_images.discard(old_path)
+        if tk_image is not None: self.tile_images.add(new_path, tk_image)
+        self._thumbnail_requested_paths.discard(old_path)
+        for path_set in [self.selected_item_paths, self.marked_similar_paths,
+                         self.marked_screenshot_download_paths, self.errored_item_paths] + self.similar_image_groups:
+            if old_path in path_set:
+                path_set.discard(old_path)
+                path_set.add(new_path)
+        if old_path in self.image_hashes_cache:
+            self.image_hashes_cache[new_path] = self.image_hashes_cache.pop(old_path)
+
+        item_data = next((item for item in self.all_folder_items_raw if item['path'] == old_path), None)
+        if item_data is None: return
+        self._refresh_listing_mtime()
+        self.all_folder_items_raw.remove(item_data)
+        item_data['path'], item_data['name'] = new_path, os.path.basename(new_path)
+        if item_data['type'] == 'file': item_data['media_kind'] = self._media_kind(item_data['name'])
+        self.all_folder_items_raw.insert(self._sorted_insert_index(self.all_folder_items_raw, item_data), item_data)
+
+        old_idx = self.item_index_by_path.pop(old_path, None)
+        if old_idx is None: return
+        self.all_folder_items.pop(old_idx)
+        if self.show_only_similar_var.get() and not self.show_only_screenshots_downloads_var.get():
+            new_idx = old_idx # Similar groups are not in name order; keep the item in its group
+        else:
+            new_idx = self._sorted_insert_index(self.all_folder_items, item_data)
+        self.all_folder_items.insert(new_idx, item_data)
+        self._reflow_grid_from(min(old_idx, new_idx))
+
+    def _layout_virtual_grid(self):
+        """Recomputes the scroll region from the item count and moves every bound tile to its cell."""
+        if not hasattr(self, 'canvas') or not self.canvas.winfo_exists(): return
+        self.grid_layout.set_width(self.canvas.winfo_width())
+        self.canvas.configure(scrollregion=self.grid_layout.scroll_region(len(self.all_folder_items)))
+        for item_path, widget_info in list(self.items_in_view.items()):
+            index = self.item_index_by_path.get(item_path)
+            if index is None:
+                self._unbind_tile(item_path)
+            else:
+                self._place_tile(widget_info, index)
+        self._sync_visible_tiles()
+
+    def _sync_visible_tiles(self):
+        """
+        Binds tiles to the items in the viewport right away and unbinds tiles that scrolled out
+        of the margin; the margin rows around the viewport are bound in idle batches.
+        """
+        if not hasattr(self, 'canvas') or not self.all_folder_items: return
+        first_idx, last_idx = self._visible_index_range()
+        keep_first, keep_last = self._visible_index_range(self._margin_rows())
+        for item_path in list(self.items_in_view):
+            index = self.item_index_by_path.get(item_path)
+            if index is None or not keep_first <= index <= keep_last:
+                self._unbind_tile(item_path)
+        visible_unbound = [(idx, self.all_folder_items[idx]) for idx in range(first_idx, last_idx + 1)
+                           if self.all_folder_items[idx]['path'] not in self.items_in_view]
+        if visible_unbound:
+            self._populate_grid_with_batch(visible_unbound)
+        if self._load_batch_after_id is None:
+            self._load_batch_after_id = self.root.after_idle(self._load_next_batch_of_items)
 
     def _on_canvas_press_for_rubber_band(self, event):
         clicked_widget = event.widget
+        if clicked_widget == self.canvas and self.tile_renderer:
+            index = self._tile_index_at_event(event)
+            if index is not None:
+                self._on_item_click_for_selection(event, self.all_folder_items[index]['path'], None)
+                return
         if clicked_widget == self.canvas:
             self._clear_all_selection_visuals()
             self.selected_item_paths.clear()
             self.rubber_band_start_x = self.canvas.canvasx(event.x)
             self.rubber_band_start_y = self.canvas.canvasy(event.y)
+            self._rubber_band_cells = None
             if self.rubber_band_rect:
                 self.canvas.delete(self.rubber_band_rect)
             self.rubber_band_rect = self.canvas.create_rectangle(
@@ -345,37 +727,30 @@ class PhotoVideoManagerApp:
             cur_x = self.canvas.canvasx(event.x)
             cur_y = self.canvas.canvasy(event.y)
             self.canvas.coords(self.rubber_band_rect, self.rubber_band_start_x, self.rubber_band_start_y, cur_x, cur_y)
+            self._update_rubber_band_selection(cur_x, cur_y)
+
+    def _update_rubber_band_selection(self, cur_x, cur_y):
+        """Selects every item whose tile the band overlaps, bound or not, and restyles only the bound tiles that changed."""
+        sel_x1, sel_x2 = sorted((self.rubber_band_start_x, cur_x))
+        sel_y1, sel_y2 = sorted((self.rubber_band_start_y, cur_y))
+        if sel_x2 - sel_x1 < 5 and sel_y2 - sel_y1 < 5:
+            cells = None
+        else:
+            cells = self.grid_layout.cells_in_rect(sel_x1, sel_y1, sel_x2, sel_y2, len(self.all_folder_items))
+        if cells == self._rubber_band_cells: return
+        self._rubber_band_cells = cells
+        newly_selected_paths = {self.all_folder_items[idx]['path']
+                                for idx in self.grid_layout.indexes_in_cells(cells, len(self.all_folder_items))}
+        changed_paths = newly_selected_paths.symmetric_difference(self.selected_item_paths)
+        self.selected_item_paths = newly_selected_paths
+        self._mark_visuals_dirty(changed_paths)
 
     def _on_canvas_release_for_rubber_band(self, event):
         if self.rubber_band_rect:
-            self.canvas.itemconfigure("rubber_band_tag", state='hidden')
-            end_x = self.canvas.canvasx(event.x)
-            end_y = self.canvas.canvasy(event.y)
-            sel_x1 = min(self.rubber_band_start_x, end_x)
-            sel_y1 = min(self.rubber_band_start_y, end_y)
-            sel_x2 = max(self.rubber_band_start_x, end_x)
-            sel_y2 = max(self.rubber_band_start_y, end_y)
-            if abs(sel_x1 - sel_x2) < 5 and abs(sel_y1 - sel_y2) < 5:
-                self.canvas.delete(self.rubber_band_rect)
-                self.rubber_band_rect = None
-                self.update_preview_and_info()
-                self.update_ui_state()
-                return
-            newly_selected_paths = set()
-            for item_path, info in self.items_in_view.items():
-                widget = info['widget']
-                if not widget.winfo_exists(): continue
-                x, y = widget.winfo_x(), widget.winfo_y()
-                w, h = widget.winfo_width(), widget.winfo_height()
-                if not (sel_x2 < x or sel_x1 > x + w or sel_y2 < y or sel_y1 > y + h):
-                    newly_selected_paths.add(item_path)
-            if newly_selected_paths:
-                self.selected_item_paths = newly_selected_paths
-                for path in self.selected_item_paths:
-                    if path in self.items_in_view and self.items_in_view[path]['widget'].winfo_exists():
-                        self._refresh_single_item_visual(path) 
+            self._update_rubber_band_selection(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
             self.canvas.delete(self.rubber_band_rect)
             self.rubber_band_rect = None
+            self._rubber_band_cells = None
             self.update_preview_and_info()
             self.update_ui_state()
 
@@ -383,7 +758,128 @@ class PhotoVideoManagerApp:
         folder_path = filedialog.askdirectory(parent=self.root)
         if folder_path:
             self.folder_history = []
+            self.prewarm_root_folder = folder_path
             self.load_items(folder_path)
+            if self.prewarm_thumbnails_enabled:
+                self._start_thumbnail_prewarm(folder_path)
+
+    def toggle_thumbnail_prewarm(self):
+        self.prewarm_thumbnails_enabled = self.prewarm_thumbnails_var.get()
+        self._save_theme_settings()
+        if not self.prewarm_thumbnails_enabled:
+            self._stop_thumbnail_prewarm()
+        else:
+            self._restart_thumbnail_prewarm()
+
+    def _restart_thumbnail_prewarm(self):
+        """Pre-warms the selected root's tree again (or the current folder's, if no root was chosen)."""
+        root_folder = self.prewarm_root_folder if self.prewarm_root_folder and os.path.isdir(self.prewarm_root_folder) \
+            else self.current_folder.get()
+        if os.path.isdir(root_folder):
+            self._start_thumbnail_prewarm(root_folder)
+
+    def _start_thumbnail_prewarm(self, root_folder):
+        self._stop_thumbnail_prewarm()
+        cancel_token = self.operation_tokens.begin('prewarm', root_folder)
+
+        def worker():
+            started_at = time.perf_counter()
+            seen_count, submitted_count = prewarm_thumbnails_core(
+                root_folder, self.thumbnail_pool, self.thumbnail_disk_cache, self.thumbnail_size,
+                [self.CONFIG_DIR, self.TRASH_DIR], cancel_token, self._is_foreground_busy)
+            perf_log(f"Thumbnail pre-warm of {root_folder}: {submitted_count} of {seen_count} files queued "
+                     f"in {time.perf_counter() - started_at:.1f} s{' (cancelled)' if cancel_token.is_set() else ''}")
+        threading.Thread(target=worker, daemon=True).start()
+
+    def toggle_folder_mosaics(self):
+        self.folder_mosaics_enabled = self.folder_mosaics_var.get()
+        self._save_theme_settings()
+        if self.folder_mosaics_enabled:
+            self._start_folder_mosaics()
+        else:
+            self.operation_tokens.cancel('mosaic')
+        for item_path, widget_info in list(self.items_in_view.items()):
+            if widget_info['type'] == 'folder':
+                self._refresh_single_item_visual(item_path)
+
+    def _start_folder_mosaics(self):
+        """Builds missing or outdated cover mosaics of the listed folders in a background thread."""
+        if not self.folder_mosaics_enabled or self.Image is None: return
+        folder_paths = [item['path'] for item in self.all_folder_items_raw
+                        if item['type'] == 'folder' and not self.folder_thumb_db.get(item['path'], {}).get('item_icon_path')]
+        cancel_token = self.operation_tokens.begin('mosaic', self.current_folder.get())
+        self._mosaic_cells_pending = {}
+        if folder_paths:
+            self._build_folder_mosaics(folder_paths, cancel_token, request_missing=True)
+
+    def _build_folder_mosaics(self, folder_paths, cancel_token, request_missing):
+        # Thumbnails missing from the cache are made by the pool; the folder is built again once they are back
+        known_mosaics = dict(self.folder_mosaic_db)
+        thumbnail_size = self.thumbnail_size
+
+        def on_mosaic(folder_path, entry):
+            try:
+                self.root.after(0, lambda: self._apply_folder_mosaic(folder_path, entry, cancel_token))
+            except (RuntimeError, tk.TclError):
+                pass # Main loop is shutting down
+
+        def request_thumbnails(folder_path, items):
+            try:
+                self.root.after(0, lambda: self._request_mosaic_cells(folder_path, items, cancel_token))
+            except (RuntimeError, tk.TclError):
+                pass
+
+        def worker():
+            built_count = build_folder_mosaics_core(
+                folder_paths, self.FOLDER_MOSAIC_DIR, known_mosaics, self.thumbnail_disk_cache, thumbnail_size,
+                self.Image, cancel_token, on_mosaic, request_thumbnails if request_missing else None)
+            if built_count:
+                try:
+                    self.root.after(0, self._save_folder_mosaic_db)
+                except (RuntimeError, tk.TclError):
+                    pass
+            perf_log(f"Folder mosaics: {built_count} of {len(folder_paths)} folders (re)built")
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _request_mosaic_cells(self, folder_path, items, cancel_token):
+        if not self.operation_tokens.is_current(cancel_token): return
+        folder_priority = self._make_thumbnail_priority_fn()({'path': folder_path}) # Ranked like the folder's tile
+        if folder_priority is None: return
+        self._mosaic_cells_pending[folder_path] = len(items)
+        self.thumbnail_pool.submit(cancel_token, [dict(item, mosaic_folder=folder_path) for item in items],
+                                   self.thumbnail_size, lambda _item: folder_priority)
+
+    def _on_mosaic_cell_ready(self, folder_path, cancel_token):
+        if not self.operation_tokens.is_current(cancel_token) or folder_path not in self._mosaic_cells_pending: return
+        self._mosaic_cells_pending[folder_path] -= 1
+        if self._mosaic_cells_pending[folder_path] > 0: return
+        del self._mosaic_cells_pending[folder_path]
+        self._build_folder_mosaics([folder_path], cancel_token, request_missing=False) # Thumbnails that failed stay missing
+
+    def _apply_folder_mosaic(self, folder_path, entry, cancel_token):
+        self.folder_mosaic_db[folder_path] = entry
+        if entry['mosaic_path']:
+            self.folder_icon_cache.invalidate(entry['mosaic_path'])
+        if not cancel_token.is_set() and folder_path in self.items_in_view:
+            self._refresh_single_item_visual(folder_path)
+
+    def _folder_icon_path(self, folder_path):
+        """The folder's custom icon, else its cover mosaic (when enabled), else None for the glyph."""
+        custom_icon_path = self.folder_thumb_db.get(folder_path, {}).get('item_icon_path')
+        if custom_icon_path or not self.folder_mosaics_enabled:
+            return custom_icon_path
+        return self.folder_mosaic_db.get(folder_path, {}).get('mosaic_path')
+
+    def _stop_thumbnail_prewarm(self):
+        prewarm_token = self.operation_tokens.current('prewarm')
+        if prewarm_token:
+            self.thumbnail_pool.cancel_group(prewarm_token)
+            self.operation_tokens.cancel('prewarm')
+
+    def _is_foreground_busy(self):
+        # Polled from the pre-warm thread: only reads plain attributes
+        return (time.monotonic() - self._last_scroll_time < PREWARM_IDLE_AFTER_SCROLL_S or
+                self.is_loading_batch or self._is_listing_folder or self._visible_fill_started_at is not None)
 
     def navigate_to_folder(self, folder_path):
         if os.path.isdir(folder_path) and self.current_folder.get() != folder_path:
@@ -411,6 +907,9 @@ class PhotoVideoManagerApp:
 
         if not os.path.isdir(folder_path):
             messagebox.showerror("Error", "Cannot access folder.", parent=self.root)
+            self.folder_watcher.watch(None)
+            self.operation_tokens.cancel('folder') # Drops the chunks of a listing still running
+            self._is_listing_folder = False
             if is_new_folder_context: self.current_folder.set("No folder selected")
             self.all_folder_items_raw = []
             self.all_folder_items = []
@@ -419,94 +918,202 @@ class PhotoVideoManagerApp:
             self.show_initial_view()
             return
 
-        if self.active_thumbnail_thread and self.active_thumbnail_thread.is_alive():
-            self.cancel_long_operation.set()
-        self.cancel_long_operation.clear()
-
-        while not self.thumbnail_queue.empty():
-            try: self.thumbnail_queue.get_nowait()
-            except queue.Empty: break
+        # Thumbnail jobs and a similarity scan of the folder being left are now useless
+        self.thumbnail_pool.cancel_group(self.folder_load_token)
+        self.folder_load_token = self.operation_tokens.begin('folder', folder_path)
+        if is_new_folder_context:
+            self.operation_tokens.cancel('similarity')
+            self.source_classifier.clear_pending()
 
+        if self.current_folder.get() != folder_path:
+            self._snapshot_current_folder()
+        self._is_listing_folder = False # Chunks of a listing still running are dropped by its token
         self.current_folder.set(folder_path)
+        self.folder_watcher.watch(folder_path)
         self.clear_view()
+        self.all_folder_items_raw = []
+        self.all_folder_items = []
+        self.item_index_by_path = {}
+        self._listing_started_at = time.perf_counter()
+        self._listing_mtime_ns = path_mtime_ns(folder_path) # Taken first: a change during listing invalidates it
 
-        current_raw_items = []
-        try:
-            for entry in os.scandir(folder_path):
-                try:
-                    is_dir, is_file = entry.is_dir(), entry.is_file()
-                except OSError: continue
-                item_type = 'folder' if is_dir else ('file' if is_file else 'other')
-                if item_type == 'other': continue
-                current_raw_items.append({'path': entry.path, 'name': entry.name, 'type': item_type, 'is_error': False})
-        except OSError as e:
-            messagebox.showerror("Error", f"Error reading folder: {e}", parent=self.root)
+        cached_listing = self.folder_listing_cache.take(folder_path)
+        if cached_listing is not None:
+            self._restore_folder_snapshot(cached_listing)
+            return
+
+        # Enumerated off the Tk thread; sorted runs are merged in as they arrive
+        self._is_listing_folder = True
+        listing_token = self.folder_load_token
+
+        def on_chunk(items, is_last, error):
+            try:
+                self.root.after(0, lambda: self._on_folder_listing_chunk(listing_token, items, is_last, error))
+            except (RuntimeError, tk.TclError):
+                pass # Main loop is shutting down
+
+        threading.Thread(target=list_folder_core,
+                         args=(folder_path, self._make_item_data, self._item_sort_key, listing_token, on_chunk,
+                               FOLDER_LISTING_FIRST_CHUNK, FOLDER_LISTING_MAX_CHUNK),
+                         daemon=True).start()
+
+    def _on_folder_listing_chunk(self, listing_token, items, is_last, error):
+        if not self.operation_tokens.is_current(listing_token): return # A newer load_items took over
+        if error is not None:
+            self._is_listing_folder = False
+            messagebox.showerror("Error", f"Error reading folder: {error}", parent=self.root)
             self.current_folder.set("Error reading folder")
             self.all_folder_items_raw = []
             self.all_folder_items = []
+            self.clear_view()
             self.update_ui_state()
             self.show_initial_view()
             return
 
-        current_raw_items.sort(key=lambda x: (x['type'] != 'folder', x['name'].lower()))
-        self.all_folder_items_raw = current_raw_items
-        self._apply_type_filters_to_items_list()
-
+        if items or is_last:
+            self._merge_listed_items(items)
+        if not is_last:
+            self.status_label.config(text=f"Listing folder... ({len(self.all_folder_items_raw)} items)")
+            return
+        self._is_listing_folder = False
+        if self.status_label.cget('text').startswith("Listing folder"):
+            self.status_label.config(text="")
+        perf_log(f"Listed {len(self.all_folder_items_raw)} items in "
+                 f"{(time.perf_counter() - self._listing_started_at) * 1000:.0f} ms")
+        self.update_ui_state()
+        self._start_folder_mosaics()
+
+    def _snapshot_current_folder(self):
+        """Keeps the folder being left (listing, scroll position, loaded thumbnails) for a quick return."""
+        folder_path = self.current_folder.get()
+        if self._is_listing_folder or self._listing_mtime_ns is None or not os.path.isdir(folder_path): return
+        scroll_y = self.canvas.yview()[0] if hasattr(self, 'canvas') and self.canvas.winfo_exists() else 0.0
+        self.folder_listing_cache.put(folder_path, self._listing_mtime_ns, self.all_folder_items_raw, scroll_y,
+                                      self.thumbnail_size, self.tile_images.items())
+
+    def _restore_folder_snapshot(self, cached_listing):
+        if cached_listing['thumbnail_size'] == self.thumbnail_size and cached_listing['tile_images']:
+            # An edit in place leaves the directory mtime alone: keep only thumbnails whose file is unchanged
+            listed_mtimes = {item['path']: item.get('mtime_ns') for item in cached_listing['items']}
+            for item_path, tk_image in cached_listing['tile_images']:
+                if listed_mtimes.get(item_path) is not None and listed_mtimes[item_path] == path_mtime_ns(item_path):
+                    self.tile_images.add(item_path, tk_image)
+        self._merge_listed_items(cached_listing['items'])
         if self.all_folder_items:
-            self.show_initial_view()
-            self._load_next_batch_of_items()
-        else:
-            if hasattr(self, 'item_frame'): self.item_frame.update_idletasks()
-            if hasattr(self, 'canvas'): self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-            self.show_initial_view()
-
+            self.canvas.yview_moveto(cached_listing['scroll_y'])
+            self._sync_visible_tiles()
+        perf_log(f"Restored {len(self.all_folder_items_raw)} cached items in "
+                 f"{(time.perf_counter() - self._listing_started_at) * 1000:.1f} ms")
         self.update_ui_state()
+        self._start_folder_mosaics()
+
+    def _on_folder_changes(self, folder_path, present_paths, absent_paths, renamed_pairs, modified_paths):
+        # Called from the folder watcher thread
+        try:
+            self.root.after(0, lambda: self._apply_folder_changes(folder_path, present_paths, absent_paths,
+                                                                  renamed_pairs, modified_paths))
+        except (RuntimeError, tk.TclError):
+            pass # Main loop is shutting down
+
+    def _apply_folder_changes(self, folder_path, present_paths, absent_paths, renamed_pairs, modified_paths):
+        """
+        Applies a batch of outside changes to the current folder incrementally: renames move their
+        tiles, removed items close their gap, new entries are merged in as one sorted run, and
+        rewritten files drop their thumbnail so it is rebuilt. Our own operations show up here too;
+        they are already applied, so they match nothing.
+        """
+        if folder_path != self.current_folder.get(): return
+        if self._is_listing_folder:
+            # The listing may or may not contain these yet; look again once it is done
+            self.root.after(int(FOLDER_WATCH_DEBOUNCE_S * 1000), lambda: self._apply_folder_changes(
+                folder_path, present_paths, absent_paths, renamed_pairs, modified_paths))
+            return
+        start_time = time.perf_counter()
+        known_paths = {item['path'] for item in self.all_folder_items_raw}
+        renamed_new_paths = set()
+        for old_path, new_path in renamed_pairs:
+            if old_path in known_paths and new_path not in known_paths:
+                self._rename_item_in_grid(old_path, new_path)
+                known_paths.discard(old_path)
+                known_paths.add(new_path)
+                renamed_new_paths.add(new_path)
+
+        removed_paths = absent_paths & known_paths
+        if removed_paths:
+            self._remove_items_from_grid(removed_paths)
+            self._forget_removed_paths(removed_paths)
+
+        added_items = []
+        for item_path in present_paths - known_paths:
+            try:
+                is_dir, is_file = os.path.isdir(item_path), os.path.isfile(item_path)
+            except OSError: continue
+            if not is_dir and not is_file: continue
+            added_items.append(self._make_item_data(item_path, os.path.basename(item_path), 'folder' if is_dir else 'file'))
+        if added_items:
+            added_items.sort(key=self._item_sort_key)
+            self._merge_listed_items(added_items)
+
+        # A rename keeps the file's mtime, so our own renames (already applied) and moves do not count as rewrites
+        rewritten_paths = set()
+        candidate_paths = (modified_paths & known_paths) - renamed_new_paths
+        if candidate_paths:
+            for item_data in self.all_folder_items_raw:
+                if item_data['path'] not in candidate_paths: continue
+                mtime_ns = path_mtime_ns(item_data['path'])
+                if item_data.get('mtime_ns') is not None and mtime_ns == item_data['mtime_ns']: continue
+                item_data['mtime_ns'] = mtime_ns
+                rewritten_paths.add(item_data['path'])
+        for item_path in rewritten_paths:
+            self.tile_images.discard(item_path)
+            self.errored_item_paths.discard(item_path)
+            self._thumbnail_requested_paths.discard(item_path)
+            self.preview_prefetcher.discard(item_path)
+            if item_path in self.items_in_view: self._unbind_tile(item_path)
+        if rewritten_paths:
+            self._sync_visible_tiles()
+
+        if removed_paths or added_items or renamed_new_paths:
+            self.update_preview_and_info()
+            self.update_ui_state()
+        self._refresh_listing_mtime()
+        perf_log(f"Folder changes: +{len(added_items)} -{len(removed_paths)} renamed {len(renamed_new_paths)} "
+                 f"rewritten {len(rewritten_paths)} in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+    def _forget_removed_paths(self, item_paths):
+        """Drops items that vanished from disk from the selection, the marks and the similar groups."""
+        self.selected_item_paths -= item_paths
+        self.marked_screenshot_download_paths -= item_paths
+        if self._cursor_item_path in item_paths: self._cursor_item_path = None
+        if not self.marked_similar_paths & item_paths: return
+        self.similar_image_groups = [group - item_paths for group in self.similar_image_groups
+                                     if len(group - item_paths) > 1]
+        self.marked_similar_paths = set().union(*self.similar_image_groups)
+        for item_path in item_paths:
+            self.image_hashes_cache.pop(item_path, None)
+        self._refresh_all_item_visuals() # Items left alone in a group lose their outline
+
+    def _merge_listed_items(self, sorted_items):
+        """Merges one sorted run from the lister into the listing; only tiles after the first changed cell move."""
+        self.all_folder_items_raw = list(heapq.merge(self.all_folder_items_raw, sorted_items, key=self._item_sort_key))
+        previous_items = self.all_folder_items
+        self._apply_type_filters_to_items_list()
+        first_changed_idx = next((idx for idx, (old_item, new_item) in enumerate(zip(previous_items, self.all_folder_items))
+                                  if old_item is not new_item), len(previous_items))
+        was_grid_shown = self.canvas_content_frame.winfo_ismapped()
+        self._reflow_grid_from(first_changed_idx)
+        if not was_grid_shown or not self.all_folder_items:
+            self.show_initial_view()
+            if self.all_folder_items:
+                self.canvas.update_idletasks() # Canvas must be mapped to know its size
+            self._layout_virtual_grid()
 
     def _apply_type_filters_to_items_list(self):
-        temp_filtered_items = []
         self.marked_screenshot_download_paths.clear()
+        filter_flags = self._filter_flags()
+        self.all_folder_items = [item for item in self.all_folder_items_raw if self._item_passes_filters(item, filter_flags)]
 
-        for item in self.all_folder_items_raw:
-            if item['type'] == 'folder':
-                if not self.show_only_similar_var.get() and not self.show_only_screenshots_downloads_var.get():
-                    temp_filtered_items.append(item)
-                elif self.show_only_similar_var.get() and not self.show_only_screenshots_downloads_var.get():
-                     temp_filtered_items.append(item)
-                continue
-
-            if item['type'] == 'file':
-                _, ext = os.path.splitext(item['name'])
-                ext_lower = ext.lower()
-                is_image = ext_lower in IMAGE_EXTENSIONS
-                is_video = ext_lower in VIDEO_EXTENSIONS
-
-                passes_basic_type_filter = (self.show_images_var.get() and is_image) or \
-                                           (self.show_videos_var.get() and is_video)
-                if not passes_basic_type_filter:
-                    continue
-
-                is_ss_or_dl = None
-                if is_image:
-                    is_ss_or_dl = file_operations.is_likely_screenshot_or_downloaded(
-                        item['path'], self.Image, self.UnidentifiedImageError
-                    )
-                    if is_ss_or_dl:
-                        self.marked_screenshot_download_paths.add(item['path'])
-                        item['source_type'] = is_ss_or_dl
-
-                if self.show_only_screenshots_downloads_var.get():
-                    if not is_ss_or_dl:
-                        continue
-
-                if self.show_only_similar_var.get() and not self.show_only_screenshots_downloads_var.get():
-                    if not (is_image and item['path'] in self.marked_similar_paths):
-                        continue
-
-                temp_filtered_items.append(item)
-
-        self.all_folder_items = temp_filtered_items
-
-        if self.show_only_similar_var.get() and not self.show_only_screenshots_downloads_var.get():
+        if filter_flags[3]:
             folders_in_view = [item_data for item_data in self.all_folder_items if item_data['type'] == 'folder']
             path_to_item_data_map = {item_data['path']: item_data for item_data in self.all_folder_items if item_data['type'] == 'file'}
             grouped_similar_items_display_list = []
@@ -524,76 +1131,280 @@ class PhotoVideoManagerApp:
                     grouped_similar_items_display_list.extend(current_group_batch)
             self.all_folder_items = folders_in_view + grouped_similar_items_display_list
 
+        self._rebuild_item_index()
+
+    def _filter_flags(self):
+        """(show images, show videos, only screenshots/downloads, only similar), read from the Tk variables once."""
+        show_only_screenshots = self.show_only_screenshots_downloads_var.get()
+        return (self.show_images_var.get(), self.show_videos_var.get(), show_only_screenshots,
+                self.show_only_similar_var.get() and not show_only_screenshots)
+
+    def _item_passes_filters(self, item, filter_flags=None):
+        """
+        Type, screenshot/download and similar-only filters for one raw item; marks screenshots as a side effect.
+        Images not classified yet are queued for the classifier and left out until their result streams in.
+        """
+        show_images, show_videos, show_only_screenshots, show_only_similar = filter_flags or self._filter_flags()
+        if item['type'] == 'folder':
+            return not show_only_screenshots
+        if item['type'] != 'file': return False
+
+        media_kind = item['media_kind'] if 'media_kind' in item else self._media_kind(item['name'])
+        is_image = media_kind == 'image'
+        if not ((show_images and is_image) or (show_videos and media_kind == 'video')):
+            return False
+
+        if show_only_screenshots:
+            if not is_image: return False
+            is_known, is_ss_or_dl = self.source_classifier.peek(item['path'], item.get('mtime_ns'))
+            if not is_known:
+                self.source_classifier.request([item['path']])
+                return False
+            if not is_ss_or_dl: return False
+            self.marked_screenshot_download_paths.add(item['path'])
+            item['source_type'] = is_ss_or_dl
+
+        if show_only_similar and not (is_image and item['path'] in self.marked_similar_paths):
+            return False
+        return True
+
+    def _margin_rows(self):
+        # Half a screen ahead is bound while idle, so a page scroll lands on bound tiles
+        visible_rows = self.grid_layout.visible_rows(self.canvas.winfo_height())
+        return max(VIRTUAL_GRID_MARGIN_ROWS, visible_rows // 2)
+
+    def _lazy_load_batch_size(self):
+        """Tiles to bind in one idle step: what fits in LAZY_LOAD_FRAME_BUDGET_MS at the measured cost per tile."""
+        if not self._tile_bind_cost_ms:
+            return LAZY_LOAD_BATCH_SIZE
+        return max(1, int(LAZY_LOAD_FRAME_BUDGET_MS / self._tile_bind_cost_ms))
+
+    def _note_tile_bind_cost(self, tile_count, elapsed_ms):
+        cost_ms = elapsed_ms / tile_count
+        if self._tile_bind_cost_ms is None:
+            self._tile_bind_cost_ms = cost_ms
+        else:
+            self._tile_bind_cost_ms = 0.7 * self._tile_bind_cost_ms + 0.3 * cost_ms
 
     def _load_next_batch_of_items(self):
-        if self.is_loading_batch or self.displayed_item_count >= len(self.all_folder_items): return
+        # Idle callback: binds one budget-sized batch of the margin rows, nearest the viewport first
+        self._load_batch_after_id = None
+        if self.is_loading_batch or not self.all_folder_items: return
+        keep_first, keep_last = self._visible_index_range(self._margin_rows())
+        unbound = [idx for idx in range(keep_first, keep_last + 1)
+                   if self.all_folder_items[idx]['path'] not in self.items_in_view]
+        if not unbound: return
+        first_idx, last_idx = self._visible_index_range()
+        unbound.sort(key=lambda idx: (idx < first_idx) if self._scroll_direction > 0 else (idx > last_idx))
+        batch_size = self._lazy_load_batch_size()
         self.is_loading_batch = True
-        start_index = self.displayed_item_count
-        end_index = min(len(self.all_folder_items), start_index + LAZY_LOAD_BATCH_SIZE)
-        items_for_this_batch = self.all_folder_items[start_index:end_index]
-        if not items_for_this_batch:
+        try:
+            elapsed_ms = self._populate_grid_with_batch([(idx, self.all_folder_items[idx]) for idx in unbound[:batch_size]])
+        finally:
             self.is_loading_batch = False
+        perf_log(f"Idle tile batch: bound {min(batch_size, len(unbound))} in {elapsed_ms:.1f} ms "
+                 f"(~{self._tile_bind_cost_ms:.2f} ms/tile), {max(0, len(unbound) - batch_size)} left in margin")
+        if len(unbound) > batch_size:
+            self._load_batch_after_id = self.root.after_idle(self._load_next_batch_of_items)
+
+    def _populate_grid_with_batch(self, indexed_items):
+        """Binds a (recycled or new) tile to each (index, item_data) and requests missing thumbnails. Returns the time taken in ms."""
+        started_at = time.perf_counter()
+        for index, item_data in indexed_items:
+            self._bind_tile(index, item_data)
+        self._request_thumbnails([item_data for _, item_data in indexed_items])
+        elapsed_ms = (time.perf_counter() - started_at) * 1000.0
+        if indexed_items:
+            self._note_tile_bind_cost(len(indexed_items), elapsed_ms)
+        return elapsed_ms
+
+    def _bind_tile(self, index, item_data):
+        item_path, item_type = item_data['path'], item_data['type']
+        if self.tile_renderer:
+            widget_info = {'slot': self.tile_renderer.acquire()}
+        else:
+            free_tiles = self._free_tiles[item_type]
+            widget_info = free_tiles.pop() if free_tiles else self._create_placeholder_widget(item_type)
+        widget_info.update({
+            'path': item_path,
+            'type': item_type,
+            'is_error': item_path in self.errored_item_paths,
+            'source_type': item_data.get('source_type')
+        })
+        self.items_in_view[item_path] = widget_info
+        self._place_tile(widget_info, index)
+        if self.tile_renderer:
+            self.tile_renderer.set_name(widget_info['slot'], item_data['name'])
+        else:
+            widget_info['name_label'].configure(text=item_data['name'])
+
+        if item_type == 'folder':
+            self._apply_initial_folder_customizations(item_path)
+        else:
+            tk_image = self.tile_images.get(item_path)
+            if widget_info['is_error']:
+                self._show_tile_error(widget_info)
+            elif tk_image is not None:
+                self.tile_images.touch([item_path])
+                self._show_tile_image(widget_info, tk_image)
+            else:
+                self._show_tile_placeholder(widget_info)
+            self._apply_file_item_style(item_path)
+        return widget_info
+
+    def _unbind_tile(self, item_path):
+        if self.renaming_item_path == item_path: self._cancel_rename()
+        widget_info = self.items_in_view.pop(item_path, None)
+        if not widget_info: return
+        if 'slot' in widget_info:
+            self.tile_renderer.release(widget_info['slot'])
             return
-        self._populate_grid_with_batch(items_for_this_batch)
-        self.displayed_item_count = end_index
-        files_to_process_this_batch = [item for item in items_for_this_batch if item['type'] == 'file']
-        if files_to_process_this_batch:
-            thumb_thread = threading.Thread(target=self._thumbnail_generator_thread_runner,
-                                      args=(files_to_process_this_batch, self.cancel_long_operation),
-                                      daemon=True)
-            self.active_thumbnail_thread = thumb_thread
-            thumb_thread.start()
-        self.is_loading_batch = False
-        self.root.after_idle(self.on_scroll_check_lazy_load)
-
-    def _populate_grid_with_batch(self, items_in_batch):
-        for item_data in items_in_batch:
-            widget_info = self._create_placeholder_widget(self.item_frame, item_data)
-            widget_info['widget'].grid(row=self.current_grid_row, column=self.current_grid_col, padx=7, pady=7, sticky="nsew")
-
-            for widget_element in [widget_info['widget'], widget_info['thumb_label'], widget_info['name_label']]:
-                widget_element.bind("<Button-1>", lambda e, p=item_data['path'], wf=widget_info['widget']:
-                    self._on_item_click_for_selection(e, p, wf))
-                if item_data['type'] == 'folder':
-                    widget_element.bind("<Double-Button-1>", lambda e, p=item_data['path']: self.navigate_to_folder(p))
-                    widget_element.bind("<Button-3>", lambda e, p=item_data['path']: self._on_folder_right_click(e, p)) 
-                elif item_data['type'] == 'file':
-                    if item_data['path'].lower().endswith(IMAGE_EXTENSIONS):
-                        widget_element.bind("<Double-Button-1>", lambda e, p=item_data['path']: self._open_image_viewer_action(p))
-                    elif item_data['path'].lower().endswith(VIDEO_EXTENSIONS):
-                        widget_element.bind("<Double-Button-1>", lambda e, p=item_data['path']:
-                            self._open_video_viewer_action(p) if self.vlc else self._open_with_system(p))
-            
-            self.items_in_view[item_data['path']] = {
-                **widget_info,
-                'type': item_data['type'],
-                'is_error': False,
-                'source_type': item_data.get('source_type')
-            }
-            
-            self._apply_initial_folder_customizations(item_data['path'])
-
-            self.current_grid_col += 1
-            if self.current_grid_col >= GRID_COLUMNS:
-                self.current_grid_col = 0
-                self.current_grid_row += 1
-        for c_idx in range(GRID_COLUMNS): self.item_frame.grid_columnconfigure(c_idx, weight=1)
-        self.item_frame.update_idletasks()
-        if hasattr(self, 'canvas') and self.canvas.winfo_exists():
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.canvas.itemconfigure(widget_info['window_id'], state='hidden')
+        widget_info['thumb_label'].image_ref = None # The image itself stays in tile_images
+        widget_info['thumb_label'].config(image='')
+        widget_info['path'] = None
+        self._free_tiles[widget_info['type']].append(widget_info)
+
+    def _place_tile(self, widget_info, index):
+        bbox = self.grid_layout.tile_bbox(index)
+        if self.tile_renderer:
+            self.tile_renderer.place(widget_info['slot'], bbox)
+            return
+        x1, y1, x2, y2 = bbox
+        self.canvas.coords(widget_info['window_id'], x1, y1)
+        self.canvas.itemconfigure(widget_info['window_id'], width=x2 - x1, height=y2 - y1, state='normal')
+
+    def _show_tile_image(self, widget_info, tk_image):
+        if self.tile_renderer:
+            self.tile_renderer.show_image(widget_info['slot'], tk_image)
+            return
+        widget_info['thumb_label'].image_ref = tk_image
+        widget_info['thumb_label'].config(image=tk_image, text="", style="PicsNest.ItemThumb.TLabel")
+
+    def _show_tile_placeholder(self, widget_info):
+        placeholder_text = PICSNEST_LOADING_TEXT_GRID
+        ext_lower = os.path.splitext(widget_info['path'] or '')[1].lower()
+        if ext_lower in VIDEO_EXTENSIONS:
+            placeholder_text = PICSNEST_VIDEO_ICON
+        elif ext_lower in IMAGE_EXTENSIONS:
+            placeholder_text = PICSNEST_IMAGE_ICON
+        if self.tile_renderer:
+            self.tile_renderer.show_glyph(widget_info['slot'], placeholder_text)
+            return
+        thumb_label = widget_info['thumb_label']
+        thumb_label.config(image='', text=placeholder_text, font=("Segoe UI Symbol", 36), style="PicsNest.ItemThumb.TLabel")
+        thumb_label.image_ref = None
+
+    def _show_tile_error(self, widget_info):
+        if self.tile_renderer:
+            self.tile_renderer.show_glyph(widget_info['slot'], PICSNEST_ERROR_ICON_GRID, ("Arial", 28), PICSNEST_ACCENT_RED)
+            return
+        widget_info['thumb_label'].config(image='', text=PICSNEST_ERROR_ICON_GRID, font=("Arial", 28), style="PicsNest.ErrorIcon.TLabel")
+        widget_info['thumb_label'].image_ref = None
+
+    def _tile_index_at_event(self, event):
+        return self.grid_layout.index_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y),
+                                         len(self.all_folder_items))
+
+    def _on_canvas_double_click(self, event):
+        # Tiles drawn by the canvas renderer (widget tiles handle their own clicks)
+        index = self._tile_index_at_event(event)
+        if index is not None: self._on_tile_double_click(self.all_folder_items[index]['path'])
+
+    def _on_canvas_right_click(self, event):
+        index = self._tile_index_at_event(event)
+        if index is not None and self.all_folder_items[index]['type'] == 'folder':
+            self._on_folder_right_click(event, self.all_folder_items[index]['path'])
+
+    def toggle_canvas_tile_renderer(self):
+        self.canvas_tile_renderer_enabled = self.canvas_tile_renderer_var.get()
+        self._save_theme_settings()
+        for item_path in list(self.items_in_view):
+            self._unbind_tile(item_path)
+        self._set_tile_renderer()
+        self._layout_virtual_grid()
+
+    def step_grid_zoom(self, step):
+        zoom_index = GRID_ZOOM_SIZES.index(self.thumbnail_size[0]) if self.thumbnail_size[0] in GRID_ZOOM_SIZES else 0
+        zoom_index = min(max(0, zoom_index + step), len(GRID_ZOOM_SIZES) - 1)
+        self.set_grid_thumbnail_size(GRID_ZOOM_SIZES[zoom_index])
+
+    def set_grid_thumbnail_size(self, size=None):
+        """Switches the grid zoom level; thumbnails of the new size come from (or are shrunk from) the disk cache."""
+        size = size or self.thumbnail_size_var.get()
+        self.thumbnail_size_var.set(size)
+        if (size, size) == self.thumbnail_size: return
+        first_visible_idx, _ = self._visible_index_range()
+        self.thumbnail_size = (size, size)
+        self._save_theme_settings()
+
+        # Queued jobs, decoded images and idle widget tiles are all for the old size
+        self.thumbnail_pool.cancel_group(self.folder_load_token)
+        self.folder_load_token = self.operation_tokens.begin('folder', self.current_folder.get())
+        for item_path in list(self.items_in_view):
+            self._unbind_tile(item_path)
+        for free_tiles in self._free_tiles.values():
+            for widget_info in free_tiles:
+                self.canvas.delete(widget_info['window_id'])
+                widget_info['widget'].destroy()
+            free_tiles.clear()
+        self.tile_images.clear()
+        self._thumbnail_requested_paths.clear()
+
+        self.grid_layout.set_cell_size(size + GRID_TILE_EXTRA_WIDTH, size + GRID_TILE_EXTRA_HEIGHT)
+        self._layout_virtual_grid()
+        if self.all_folder_items:
+            # Keep the first item that was visible at the top of the viewport
+            self.canvas.yview_moveto(self.grid_layout.row_top(first_visible_idx) / self.grid_layout.total_height(len(self.all_folder_items)))
+        if self.prewarm_thumbnails_enabled:
+            self._restart_thumbnail_prewarm()
+        self._start_folder_mosaics() # Mosaics are built per size
+
+    def _set_tile_renderer(self):
+        if not self.canvas_tile_renderer_enabled:
+            self.tile_renderer = None
+        elif self.tile_renderer is None:
+            self.tile_renderer = CanvasTileRenderer(self.canvas, build_tile_palette(get_current_accent_color()))
+
+    def _get_item_data(self, item_path):
+        index = self.item_index_by_path.get(item_path)
+        return self.all_folder_items[index] if index is not None else None
+
+    def _ensure_item_visible(self, item_path):
+        """Scrolls the canvas so the item's row is in view (and its tile bound). Returns its widget info or None."""
+        index = self.item_index_by_path.get(item_path)
+        if index is None: return None
+        if item_path not in self.items_in_view or not self._is_index_fully_visible(index):
+            total_height = self.grid_layout.total_height(len(self.all_folder_items))
+            row_top = self.grid_layout.row_top(index)
+            view_top = self.canvas.canvasy(0)
+            if row_top < view_top:
+                target_top = row_top
+            else:
+                target_top = row_top + self.grid_layout.cell_height - self.canvas.winfo_height()
+            self.canvas.yview_moveto(max(0.0, target_top) / max(1, total_height))
+            self._sync_visible_tiles()
+        return self.items_in_view.get(item_path)
+
+    def _is_index_fully_visible(self, index):
+        view_top = self.canvas.canvasy(0)
+        row_top = self.grid_layout.row_top(index)
+        return view_top <= row_top and row_top + self.grid_layout.cell_height <= view_top + self.canvas.winfo_height()
 
 # In class PhotoVideoManagerApp:
 
     def _apply_initial_folder_customizations(self, item_path):
         if item_path in self.items_in_view:
             widget_info = self.items_in_view[item_path]
-            if widget_info['type'] == 'folder':
+            if widget_info['type'] == 'folder' and 'slot' in widget_info:
+                self._apply_canvas_folder_tile(item_path, widget_info)
+            elif widget_info['type'] == 'folder':
                 widget_frame = widget_info['widget']
                 thumb_label = widget_info['thumb_label']
                 name_label = widget_info['name_label']
 
                 custom_data = self.folder_thumb_db.get(item_path, {})
-                custom_icon_path = custom_data.get('item_icon_path')
+                custom_icon_path = self._folder_icon_path(item_path)
                 custom_bg_color_from_db = custom_data.get('item_bg_color')
                 is_selected = item_path in self.selected_item_paths
 
@@ -618,32 +1429,18 @@ class PhotoVideoManagerApp:
                 name_label.configure(background=current_bg_to_apply, foreground=PICSNEST_TEXT_LIGHT)
 
                 # Icon loading logic (same as before, but ensures it's applied after background)
-                loaded_custom_icon = False
-                if custom_icon_path and os.path.exists(custom_icon_path):
-                    try:
-                        img_pil = self.Image.open(custom_icon_path)
-                        widget_frame.update_idletasks()
-                        name_label_h = name_label.winfo_height() if name_label.winfo_ismapped() else 20
-                        
-                        icon_width_limit = GRID_THUMBNAIL_SIZE[0] - 10
-                        icon_height_limit = GRID_THUMBNAIL_SIZE[1] - name_label_h - 10
-
-                        img_pil.thumbnail((icon_width_limit, max(10, icon_height_limit)), self.Image.Resampling.LANCZOS)
-                        tk_image = self.ImageTk.PhotoImage(img_pil)
-                        thumb_label.config(image=tk_image, text="", font=None)
-                        thumb_label.custom_icon_ref = tk_image
-                        loaded_custom_icon = True
-                    except Exception as e:
-                        print(f"Error applying initial custom folder icon {custom_icon_path}: {e}")
-                
-                if not loaded_custom_icon:
+                tk_image = self.folder_icon_cache.get(custom_icon_path, self._widget_folder_icon_box()) if custom_icon_path else None
+                if tk_image is not None:
+                    thumb_label.config(image=tk_image, text="", font=None)
+                    thumb_label.custom_icon_ref = tk_image
+                else:
                     icon_font = ("Segoe UI Symbol", 36)
                     thumb_label.config(image='', text=PICSNEST_FOLDER_ICON, font=icon_font)
                     if hasattr(thumb_label, 'custom_icon_ref'): del thumb_label.custom_icon_ref
 
-    def _create_placeholder_widget(self, parent_frame, item_data):
-        item_path, item_name, item_type = item_data['path'], item_data['name'], item_data['type']
-        initial_style_info = {'type': item_type, 'is_error': False, 'source_type': item_data.get('source_type')}
+    def _create_placeholder_widget(self, item_type):
+        """Creates one recyclable tile on the canvas (hidden until _bind_tile gives it an item)."""
+        parent_frame = self.canvas
         
         # --- FRAME CREATION MODIFICATION ---
         if item_type == 'folder':
@@ -653,13 +1450,12 @@ class PhotoVideoManagerApp:
             # Initial background will be set by _apply_initial_folder_customizations
         else:
             # For files, continue using ttk.Frame with its style
-            style_name = self._get_item_style(item_path, initial_style_info)
-            widget_frame = ttk.Frame(parent_frame, style=style_name, padding=5)
+            widget_frame = ttk.Frame(parent_frame, style="PicsNest.ItemPlaceholder.TFrame", padding=5)
         # --- END FRAME CREATION MODIFICATION ---
 
         thumb_label = ttk.Label(widget_frame, anchor='center', style="PicsNest.ItemThumb.TLabel")
-        name_label = ttk.Label(widget_frame, text=item_name, anchor='center',
-                               wraplength=GRID_THUMBNAIL_SIZE[0] - 10, 
+        name_label = ttk.Label(widget_frame, text="", anchor='center',
+                               wraplength=self.thumbnail_size[0] - 10, 
                                style="PicsNest.ItemName.TLabel",
                                justify=tk.CENTER)
         
@@ -676,97 +1472,192 @@ class PhotoVideoManagerApp:
             thumb_label.pack(side=tk.TOP, fill=tk.BOTH, expand=True, pady=(4, 1))
 
         elif item_type == 'file':
-            placeholder_text = PICSNEST_LOADING_TEXT_GRID
-            ext_lower = os.path.splitext(item_name)[1].lower()
-            if ext_lower in VIDEO_EXTENSIONS:
-                placeholder_text = PICSNEST_VIDEO_ICON
-            elif ext_lower in IMAGE_EXTENSIONS:
-                placeholder_text = PICSNEST_IMAGE_ICON
-            
-            thumb_label.config(text=placeholder_text, font=icon_font)
+            thumb_label.config(text=PICSNEST_LOADING_TEXT_GRID, font=icon_font)
             thumb_label.pack(fill=tk.BOTH, expand=True, pady=(0, 3))
             name_label.pack(fill=tk.X, side=tk.BOTTOM, pady=(1,0))
-        
-        return {'widget': widget_frame, 'thumb_label': thumb_label, 'name_label': name_label}
-    def _thumbnail_generator_thread_runner(self, items_to_process_batch, cancel_event_ref):
-        for item_data in items_to_process_batch:
-            if cancel_event_ref.is_set(): break
-            thumb_image, error_flag = file_operations.generate_single_thumbnail(
-                item_data, GRID_THUMBNAIL_SIZE, self.Image,
-                self.UnidentifiedImageError, self.cv2
-            )
-            self.thumbnail_queue.put({
-                'path': item_data['path'], 'image': thumb_image,
-                'error': error_flag, 'type': item_data['type']
-            })
+
+        window_id = self.canvas.create_window(0, 0, window=widget_frame, anchor="nw", state='hidden')
+        widget_info = {'widget': widget_frame, 'thumb_label': thumb_label, 'name_label': name_label,
+                       'window_id': window_id, 'path': None, 'type': item_type}
+
+        # Bound once per tile; the handlers read the item the tile is currently bound to
+        for widget_element in [widget_frame, thumb_label, name_label]:
+            widget_element.bind("<Button-1>", lambda e, t=widget_info: self._on_item_click_for_selection(e, t['path'], t['widget']))
+            widget_element.bind("<Double-Button-1>", lambda e, t=widget_info: self._on_tile_double_click(t['path']))
+            if item_type == 'folder':
+                widget_element.bind("<Button-3>", lambda e, t=widget_info: self._on_folder_right_click(e, t['path']))
+        return widget_info
+
+    def _on_tile_double_click(self, item_path):
+        if not item_path: return
+        if os.path.isdir(item_path):
+            self.navigate_to_folder(item_path)
+        elif item_path.lower().endswith(IMAGE_EXTENSIONS):
+            self._open_image_viewer_action(item_path)
+        elif item_path.lower().endswith(VIDEO_EXTENSIONS):
+            if self.vlc: self._open_video_viewer_action(item_path)
+            else: self._open_with_system(item_path)
+    def _on_thumbnail_result(self, group, item_data, encoded_bytes, error_flag):
+        if group.scope == 'prewarm': return # Only needed in the disk cache
+        if group.scope == 'mosaic':
+            try:
+                self.root.after(0, lambda: self._on_mosaic_cell_ready(item_data['mosaic_folder'], group))
+            except (RuntimeError, tk.TclError):
+                pass
+            return
+        # Called from thumbnail pool threads: decode the small thumbnail here, hand it to Tk via the queue
+        thumb_image = None
+        if encoded_bytes and not error_flag:
+            try:
+                thumb_image = decode_thumbnail(encoded_bytes, self.Image)
+            except Exception as e:
+                print(f"Could not decode thumbnail for {item_data['path']}: {e}")
+                error_flag = True
+        self.thumbnail_queue.put({
+            'path': item_data['path'], 'image': thumb_image,
+            'error': error_flag, 'type': item_data['type'],
+            'generation': group.generation
+        })
+        self._wake_thumbnail_drain()
+
+    def _wake_thumbnail_drain(self):
+        # Called from thumbnail pool threads: schedule one drain on the Tk thread, not one per result
+        if self._thumbnail_drain_scheduled.is_set(): return
+        self._thumbnail_drain_scheduled.set()
+        try:
+            self.root.after(0, self._process_thumbnail_queue)
+        except (RuntimeError, tk.TclError):
+            self._thumbnail_drain_scheduled.clear() # Nothing was scheduled; let the next result try again
 
     def _process_thumbnail_queue(self):
-        max_updates_per_cycle = 10
-        processed_count = 0
+        """
+        Applies queued thumbnail results for at most THUMBNAIL_DRAIN_BUDGET_MS, then restyles the
+        touched tiles in one pass. If results remain, the next drain is scheduled after the frame.
+        """
+        self._thumbnail_drain_scheduled.clear()
+        tick_start = time.perf_counter()
+        deadline = tick_start + THUMBNAIL_DRAIN_BUDGET_MS / 1000.0
+        paths_to_restyle = set()
         try:
-            while not self.thumbnail_queue.empty() and processed_count < max_updates_per_cycle:
-                result = self.thumbnail_queue.get_nowait()
-                processed_count += 1
-                item_path = result['path']
-                if item_path in self.items_in_view:
-                    widget_info = self.items_in_view[item_path]
-                    widget_frame = widget_info['widget']
-                    thumb_display_label = widget_info['thumb_label']
-                    widget_info['is_error'] = result['error']
-
-                    if widget_frame.winfo_exists() and thumb_display_label.winfo_exists():
-                        self._refresh_single_item_visual(item_path) # Handles style and folder custom BG/Icon
-
-                        if result['type'] == 'file': # Only update thumb_display_label for files from this queue
-                            if result['error']:
-                                thumb_display_label.config(image='', text=PICSNEST_ERROR_ICON_GRID, font=("Arial", 28), style="PicsNest.ErrorIcon.TLabel")
-                                if hasattr(thumb_display_label, 'image_ref'): thumb_display_label.image_ref = None
-                            elif result['image']:
-                                try:
-                                     tk_image = self.ImageTk.PhotoImage(result['image'])
-                                     thumb_display_label.image_ref = tk_image
-                                     thumb_display_label.config(image=tk_image, text="", style="PicsNest.ItemThumb.TLabel")
-                                except Exception as e_tk:
-                                     print(f"Tkinter PhotoImage error for {item_path}: {e_tk}")
-                                     thumb_display_label.config(image='', text=PICSNEST_ERROR_ICON_GRID, font=("Arial", 18), style="PicsNest.ErrorIcon.TLabel")
-                                     widget_info['is_error'] = True
-                                     self._refresh_single_item_visual(item_path) 
-                                     if hasattr(thumb_display_label, 'image_ref'): thumb_display_label.image_ref = None
-                            # else: File placeholder icon already set by _create_placeholder_widget
-        except queue.Empty: pass
+            while time.perf_counter() < deadline:
+                try:
+                    result = self.thumbnail_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if result['generation'] != self.folder_load_token.generation:
+                    continue # Stale result from a folder load that has been replaced
+                if self._apply_thumbnail_result(result):
+                    paths_to_restyle.add(result['path'])
+            for item_path in paths_to_restyle:
+                self._apply_file_item_style(item_path)
+            if paths_to_restyle: self._trim_tile_images()
         except Exception as e:
             print(f"Error processing thumbnail queue: {e}")
             import traceback
             traceback.print_exc()
         finally:
-            self.root.after(100, self._process_thumbnail_queue)
+            remaining = self.thumbnail_queue.qsize()
+            if remaining and not self._thumbnail_drain_scheduled.is_set():
+                self._thumbnail_drain_scheduled.set()
+                self.root.after(1, self._process_thumbnail_queue) # Let Tk draw a frame first
+            if paths_to_restyle:
+                tick_ms = (time.perf_counter() - tick_start) * 1000.0
+                perf_log(f"Thumbnail drain: applied {len(paths_to_restyle)} in {tick_ms:.1f} ms, queue depth {remaining}")
+
+    def _apply_thumbnail_result(self, result):
+        """
+        Stores one worker result (image in tile_images, or the error) and shows it if the item's tile
+        is bound. Returns True if a tile was updated (and needs restyling).
+        """
+        item_path = result['path']
+        self._thumbnail_requested_paths.discard(item_path) # Also when hidden, so showing it again re-requests it
+        if result['type'] != 'file' or item_path not in self.item_index_by_path: return False
+        tk_image = None
+        is_error = result['error']
+        if not is_error and result['image']:
+            try:
+                tk_image = self.ImageTk.PhotoImage(result['image'])
+                self.tile_images.add(item_path, tk_image)
+            except Exception as e_tk:
+                print(f"Tkinter PhotoImage error for {item_path}: {e_tk}")
+                is_error = True
+        if is_error: self.errored_item_paths.add(item_path)
+
+        widget_info = self.items_in_view.get(item_path)
+        if not widget_info: return False
+        widget_info['is_error'] = is_error
+        if is_error:
+            self._show_tile_error(widget_info)
+        elif tk_image:
+            self._show_tile_image(widget_info, tk_image)
+        # else: No decoder for this file, the placeholder icon stays
+        self._note_visible_thumbnail_filled(item_path)
+        return True
+
+    def _apply_file_item_style(self, item_path):
+        """Style-only refresh of a file tile: no text, icon or layout work."""
+        widget_info = self.items_in_view.get(item_path)
+        if not widget_info or widget_info['type'] != 'file': return
+        if self.tile_renderer:
+            self.tile_renderer.set_style(widget_info['slot'], self._get_item_style(item_path, widget_info))
+        elif widget_info['widget'].winfo_exists():
+            widget_info['widget'].configure(style=self._get_item_style(item_path, widget_info))
 
     def clear_view(self):
         for item_path_in_view in list(self.items_in_view.keys()):
-            widget_info = self.items_in_view.pop(item_path_in_view, None)
-            if widget_info and widget_info['widget'].winfo_exists():
-                widget_info['widget'].destroy()
-        self.items_in_view.clear()
+            self._unbind_tile(item_path_in_view)
+        self.tile_images.clear()
+        self.errored_item_paths.clear()
+        self._thumbnail_requested_paths.clear()
         self.selected_item_paths.clear()
         self.reset_preview()
-        self.displayed_item_count = 0
-        self.current_grid_row = 0
-        self.current_grid_col = 0
         self.is_loading_batch = False
+        # Thumbnails still awaited for the old view will never arrive (their jobs are cancelled)
+        self._visible_fill_started_at = None
+        self._visible_paths_awaiting_thumbnail = set()
 
         if hasattr(self, 'canvas') and self.canvas.winfo_exists():
             self.canvas.yview_moveto(0)
             self.canvas.xview_moveto(0)
-        if hasattr(self, 'item_frame'):
-            self.item_frame.update_idletasks()
-        if hasattr(self, 'canvas') and self.canvas.winfo_exists():
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            self.canvas.configure(scrollregion=(0, 0, 0, 0))
 
     def _clear_all_selection_visuals(self):
-        paths_to_restyle = list(self.selected_item_paths)
-        for path_to_clear_sel in paths_to_restyle:
-            if path_to_clear_sel in self.items_in_view:
-                self._refresh_single_item_visual(path_to_clear_sel) 
+        previously_selected_paths = self.selected_item_paths
+        self.selected_item_paths = set()
+        self._mark_visuals_dirty(previously_selected_paths)
+
+    def _mark_visuals_dirty(self, item_paths):
+        """
+        Queues a style-only refresh of item_paths after a selection/mark change. Only bound tiles
+        are tracked (a tile styles itself when it gets bound), and one idle callback applies them all.
+        """
+        self._dirty_visual_paths.update(self.items_in_view.keys() & item_paths)
+        if self._dirty_visual_paths and self._restyle_after_id is None:
+            self._restyle_after_id = self.root.after_idle(self._flush_dirty_visuals)
+
+    def _flush_dirty_visuals(self):
+        self._restyle_after_id = None
+        dirty_paths, self._dirty_visual_paths = self._dirty_visual_paths, set()
+        for item_path in self.items_in_view.keys() & dirty_paths:
+            self._apply_item_style(item_path)
+
+    def _apply_item_style(self, item_path):
+        """Style delta of one bound tile: colours only, no icon reload, no layout pass."""
+        widget_info = self.items_in_view[item_path]
+        if widget_info['type'] == 'file':
+            self._apply_file_item_style(item_path)
+        elif 'slot' in widget_info:
+            self._apply_canvas_folder_style(item_path, widget_info['slot'])
+        elif widget_info['widget'].winfo_exists():
+            self._apply_widget_folder_style(item_path, widget_info)
+
+    def select_all_items(self, event=None):
+        if self.renaming_item_path or isinstance(self.root.focus_get(), (tk.Entry, ttk.Entry, tk.Text)): return
+        self.selected_item_paths = set(self.item_index_by_path)
+        self._mark_visuals_dirty(self.selected_item_paths)
+        self.update_preview_and_info()
+        self.update_ui_state()
+        return "break"
 
     def _get_item_style(self, item_path, item_info, force_deselected=False):
         is_selected = (item_path in self.selected_item_paths) and not force_deselected
@@ -787,10 +1678,7 @@ class PhotoVideoManagerApp:
 
         if item_type == 'file':
             if is_error: return "PicsNest.Error.TFrame"
-            has_thumb_image_displayed = False
-            if 'thumb_label' in item_info and item_info['thumb_label'].winfo_exists():
-                if hasattr(item_info['thumb_label'], 'image_ref') and item_info['thumb_label'].image_ref:
-                    has_thumb_image_displayed = True
+            has_thumb_image_displayed = item_path in self.tile_images
             item_ext = os.path.splitext(item_path)[1].lower()
             if item_ext in VIDEO_EXTENSIONS:
                  return "PicsNest.VideoItem.TFrame" if has_thumb_image_displayed else "PicsNest.VideoPlaceholder.TFrame"
@@ -803,8 +1691,8 @@ class PhotoVideoManagerApp:
 
         self._clear_all_selection_visuals() 
         self.selected_item_paths = {item_path_clicked}
-        if item_path_clicked in self.items_in_view and widget_frame_clicked.winfo_exists():
-            self._refresh_single_item_visual(item_path_clicked) 
+        self._cursor_item_path = item_path_clicked
+        self._mark_visuals_dirty(self.selected_item_paths)
         self.update_preview_and_info()
         self.update_ui_state()
 
@@ -823,7 +1711,7 @@ class PhotoVideoManagerApp:
 
         if len(self.selected_item_paths) == 1:
             item_path = list(self.selected_item_paths)[0]
-            item_info_from_view = self.items_in_view.get(item_path)
+            item_info_from_view = self._get_item_data(item_path)
 
             if not item_info_from_view or not os.path.exists(item_path):
                 self.reset_preview()
@@ -837,12 +1725,11 @@ class PhotoVideoManagerApp:
 
             source_text = "-"
             if item_type == 'file' and item_path.lower().endswith(IMAGE_EXTENSIONS):
-                source_type_val = item_info_from_view.get('source_type')
-                if not source_type_val:
-                     source_type_val = file_operations.is_likely_screenshot_or_downloaded(
-                        item_path, self.Image, self.UnidentifiedImageError
-                    )
-                if source_type_val:
+                is_known, source_type_val = self.source_classifier.peek(item_path)
+                if not is_known:
+                    source_text = "..." # Filled in by _apply_source_types
+                    self.source_classifier.request([item_path], urgent=True)
+                elif source_type_val:
                     source_text = source_type_val.capitalize()
             self.info_source_label.config(text=f"Source: {source_text}")
 
@@ -853,67 +1740,26 @@ class PhotoVideoManagerApp:
                     size_bytes = os.path.getsize(item_path)
                     size_mb = size_bytes / (1024*1024); size_kb = size_bytes / 1024
                     self.info_size_label.config(text=f"Size: {size_mb:.2f} MB" if size_mb >= 1.0 else f"{size_kb:.1f} KB")
-                    preview_text_content = "No preview"
-                    generated_preview_image = None
-                    if item_path.lower().endswith(IMAGE_EXTENSIONS):
-                        img_pil_preview = self.Image.open(item_path)
-                        img_pil_preview.thumbnail(PREVIEW_THUMBNAIL_SIZE, self.Image.Resampling.LANCZOS)
-                        if img_pil_preview.mode not in ('RGB','RGBA'): img_pil_preview = img_pil_preview.convert('RGB')
-                        generated_preview_image = self.ImageTk.PhotoImage(img_pil_preview)
-                        preview_text_content = ""
-                    elif item_path.lower().endswith(VIDEO_EXTENSIONS) and self.cv2:
-                        cap = None
-                        try:
-                            cap = self.cv2.VideoCapture(item_path)
-                            if cap.isOpened():
-                                frame_count = int(cap.get(self.cv2.CAP_PROP_FRAME_COUNT))
-                                frame_no = min(frame_count // 10, 100) if frame_count > 10 else 0
-                                cap.set(self.cv2.CAP_PROP_POS_FRAMES, frame_no); ret, frame = cap.read()
-                                if ret:
-                                    frame_rgb = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2RGB)
-                                    img_pil_video_thumb = self.Image.fromarray(frame_rgb)
-                                    img_pil_video_thumb.thumbnail(PREVIEW_THUMBNAIL_SIZE, self.Image.Resampling.LANCZOS)
-                                    generated_preview_image = self.ImageTk.PhotoImage(img_pil_video_thumb)
-                                    preview_text_content = ""
-                                else: preview_text_content = "Video (thumb failed)"
-                            else: preview_text_content = "Video (cannot open)"
-                        except Exception as e_vid_prev:
-                            print(f"Video preview error for {item_path}: {e_vid_prev}")
-                            preview_text_content = "Video (thumb error)"
-                            self.preview_label.config(style="PicsNest.PreviewError.TLabel")
-                        finally:
-                            if cap: cap.release()
-                    self.preview_label.config(text=preview_text_content)
-                    if generated_preview_image:
-                        self.preview_label.config(image=generated_preview_image)
-                        self.preview_label.image_ref = generated_preview_image
-                    else:
-                        self.preview_label.config(image='')
-                        if hasattr(self.preview_label, 'image_ref'): self.preview_label.image_ref = None
-                        if not item_path.lower().endswith(IMAGE_EXTENSIONS) and not item_path.lower().endswith(VIDEO_EXTENSIONS):
-                             self.preview_label.config(text="No preview for this file type.", style="PicsNest.PreviewPlaceholder.TLabel")
-                        elif preview_text_content == "No preview":
-                             self.preview_label.config(style="PicsNest.PreviewPlaceholder.TLabel")
-                except self.UnidentifiedImageError:
-                    self.preview_label.config(image='', text="Preview Error (Format?)", style="PicsNest.PreviewError.TLabel")
-                    if hasattr(self.preview_label, 'image_ref'): self.preview_label.image_ref = None
-                except Exception as e_prev:
-                    print(f"Error updating preview for {item_path}: {e_prev}")
-                    self.preview_label.config(image='', text="Preview Error", style="PicsNest.PreviewError.TLabel")
+                except OSError:
+                    self.info_size_label.config(text="Size: -")
+                # Decoded off the Tk thread; the neighbours in the direction of travel are fetched right after
+                preview_result = self.preview_prefetcher.get(item_path)
+                self.preview_prefetcher.request(self._preview_prefetch_paths(item_path))
+                if preview_result is not None:
+                    self._show_preview_result(item_path, preview_result)
+                else:
+                    self.preview_label.config(image='', text="Loading preview...", style="PicsNest.PreviewPlaceholder.TLabel")
                     if hasattr(self.preview_label, 'image_ref'): self.preview_label.image_ref = None
             elif item_type == 'folder':
                 self.info_size_label.config(text="Size: -")
                 self.info_source_label.config(text="Source: -") 
-                custom_data = self.folder_thumb_db.get(item_path, {})
-                custom_icon_path = custom_data.get('item_icon_path')
+                custom_icon_path = self._folder_icon_path(item_path)
                 if custom_icon_path and os.path.exists(custom_icon_path):
-                    try:
-                        img_pil_preview = self.Image.open(custom_icon_path)
-                        img_pil_preview.thumbnail(PREVIEW_THUMBNAIL_SIZE, self.Image.Resampling.LANCZOS)
-                        tk_image_preview = self.ImageTk.PhotoImage(img_pil_preview)
+                    tk_image_preview = self.folder_icon_cache.get(custom_icon_path, PREVIEW_THUMBNAIL_SIZE)
+                    if tk_image_preview is not None:
                         self.preview_label.config(image=tk_image_preview, text="")
                         self.preview_label.image_ref = tk_image_preview
-                    except Exception:
+                    else:
                         self.preview_label.config(image='', text="Folder (custom icon error)", style="PicsNest.PreviewPlaceholder.TLabel")
                         if hasattr(self.preview_label, 'image_ref'): self.preview_label.image_ref = None
                 else:
@@ -928,6 +1774,155 @@ class PhotoVideoManagerApp:
             self.info_source_label.config(text="Source: -")
 
 
+    def _load_preview_source(self, item_path):
+        """PreviewPrefetcher load_fn, runs in its loader thread (no Tk calls): decodes one file's side-panel preview."""
+        result = {'image': None, 'text': "No preview", 'style': None, 'video_metadata': None}
+        try:
+            if item_path.lower().endswith(IMAGE_EXTENSIONS):
+                img_pil_preview = self.Image.open(item_path)
+                img_pil_preview.thumbnail(PREVIEW_THUMBNAIL_SIZE, self.Image.Resampling.LANCZOS)
+                if img_pil_preview.mode not in ('RGB','RGBA'): img_pil_preview = img_pil_preview.convert('RGB')
+                result['image'], result['text'] = img_pil_preview, ""
+            elif item_path.lower().endswith(VIDEO_EXTENSIONS) and (self.cv2 or self.av):
+                # Decoded in an isolated, timed worker process (or reused from the thumbnail cache)
+                encoded_bytes, error_flag, video_metadata = self.thumbnail_pool.load_video_preview(
+                    {'path': item_path, 'name': os.path.basename(item_path), 'type': 'file'}, PREVIEW_THUMBNAIL_SIZE)
+                if encoded_bytes and not error_flag:
+                    result['image'], result['text'] = decode_thumbnail(encoded_bytes, self.Image), ""
+                elif video_metadata is None:
+                    result['text'] = "Video (cannot open)"
+                else:
+                    result['text'] = "Video (thumb failed)"
+                result['video_metadata'] = video_metadata
+        except self.UnidentifiedImageError:
+            result['text'], result['style'] = "Preview Error (Format?)", "PicsNest.PreviewError.TLabel"
+        except Exception as e_prev:
+            print(f"Error updating preview for {item_path}: {e_prev}")
+            result['text'], result['style'] = "Preview Error", "PicsNest.PreviewError.TLabel"
+        return result
+
+    def _classify_source_type(self, item_path):
+        # Called from the classifier thread
+        return file_operations.is_likely_screenshot_or_downloaded(item_path, self.Image, self.UnidentifiedImageError)
+
+    def _on_source_types_ready(self, results):
+        # Called from the classifier thread
+        try:
+            self.root.after(0, lambda r=results: self._apply_source_types(r))
+        except (RuntimeError, tk.TclError):
+            pass # Main loop is shutting down
+
+    def _apply_source_types(self, results):
+        """Streams classifier results into the Source label and, with the screenshot filter on, into the grid."""
+        current_folder_path = self.current_folder.get()
+        is_filter_active = self.show_only_screenshots_downloads_var.get()
+        newly_matching_mtimes = {}
+        for item_path, source_type, mtime_ns in results:
+            if os.path.dirname(item_path) != current_folder_path: continue
+            if self.selected_item_paths == {item_path}:
+                self.info_source_label.config(text=f"Source: {source_type.capitalize() if source_type else '-'}")
+            if source_type and is_filter_active and item_path not in self.item_index_by_path:
+                newly_matching_mtimes[item_path] = mtime_ns
+
+        first_changed_idx = None
+        if newly_matching_mtimes:
+            filter_flags = self._filter_flags()
+            newly_matching_items = []
+            for item_data in self.all_folder_items_raw:
+                if item_data['path'] not in newly_matching_mtimes: continue
+                item_data['mtime_ns'] = newly_matching_mtimes[item_data['path']] # The file may have changed since it was listed
+                if self._item_passes_filters(item_data, filter_flags): newly_matching_items.append(item_data)
+            first_changed_idx = self._merge_items_into_view(newly_matching_items)
+        if first_changed_idx is not None:
+            was_grid_shown = self.canvas_content_frame.winfo_ismapped()
+            self._reflow_grid_from(first_changed_idx)
+            if not was_grid_shown:
+                self.show_initial_view()
+                self.canvas.update_idletasks() # Canvas must be mapped to know its size
+                self._layout_virtual_grid()
+            self.update_ui_state()
+
+        if is_filter_active and hasattr(self, 'status_label') and self.status_label:
+            pending_count = self.source_classifier.pending_count()
+            self.status_label.config(text=f"Checking for screenshots/downloads ({pending_count} left)..." if pending_count else "")
+
+    def _on_preview_ready(self, item_path):
+        # Called from the preview loader thread
+        try:
+            self.root.after(0, lambda p=item_path: self._apply_ready_preview(p))
+        except (RuntimeError, tk.TclError):
+            pass # Main loop is shutting down
+
+    def _apply_ready_preview(self, item_path):
+        if self.selected_item_paths != {item_path}: return # Speculative, or the user moved on
+        preview_result = self.preview_prefetcher.get(item_path)
+        if preview_result is not None:
+            self._show_preview_result(item_path, preview_result)
+
+    def _show_preview_result(self, item_path, preview_result):
+        video_summary = file_operations.format_video_metadata(preview_result['video_metadata'])
+        if video_summary:
+            self.info_type_label.config(text=f"Type: File ({video_summary})")
+        self.preview_label.config(text=preview_result['text'], style=preview_result['style'] or "PicsNest.PreviewImage.TLabel")
+        if preview_result['image'] is not None:
+            generated_preview_image = self.ImageTk.PhotoImage(preview_result['image'])
+            self.preview_label.config(image=generated_preview_image)
+            self.preview_label.image_ref = generated_preview_image
+            return
+        self.preview_label.config(image='')
+        if hasattr(self.preview_label, 'image_ref'): self.preview_label.image_ref = None
+        if not item_path.lower().endswith(IMAGE_EXTENSIONS) and not item_path.lower().endswith(VIDEO_EXTENSIONS):
+             self.preview_label.config(text="No preview for this file type.", style="PicsNest.PreviewPlaceholder.TLabel")
+        elif preview_result['text'] == "No preview":
+             self.preview_label.config(style="PicsNest.PreviewPlaceholder.TLabel")
+
+    def _preview_prefetch_paths(self, item_path):
+        """item_path followed by the next PREVIEW_PREFETCH_COUNT media files in the direction of travel."""
+        paths = [item_path]
+        index = self.item_index_by_path.get(item_path)
+        if index is None: return paths
+        index += self._navigation_direction
+        while 0 <= index < len(self.all_folder_items) and len(paths) <= PREVIEW_PREFETCH_COUNT:
+            item_data = self.all_folder_items[index]
+            if item_data['type'] == 'file' and item_data['path'].lower().endswith(IMAGE_EXTENSIONS + VIDEO_EXTENSIONS):
+                paths.append(item_data['path'])
+            index += self._navigation_direction
+        return paths
+
+    def on_grid_navigation_key(self, event):
+        """Arrow keys, Page Up/Down, Home and End move the single-item cursor over all_folder_items."""
+        if self.renaming_item_path or not self.all_folder_items: return
+        if isinstance(self.root.focus_get(), (tk.Entry, ttk.Entry, tk.Text)): return # Typing in a field
+        item_count = len(self.all_folder_items)
+        columns = self.grid_layout.columns
+        page_step = max(1, self.grid_layout.visible_rows(self.canvas.winfo_height()) - 1) * columns
+        current_idx = self.item_index_by_path.get(self._cursor_item_path)
+        if current_idx is None and len(self.selected_item_paths) == 1:
+            current_idx = self.item_index_by_path.get(next(iter(self.selected_item_paths)))
+
+        if event.keysym == 'Home': target_idx = 0
+        elif event.keysym == 'End': target_idx = item_count - 1
+        elif current_idx is None: target_idx = 0
+        else:
+            step = {'Left': -1, 'Right': 1, 'Up': -columns, 'Down': columns,
+                    'Prior': -page_step, 'Next': page_step}.get(event.keysym, 0)
+            target_idx = min(max(0, current_idx + step), item_count - 1)
+        if current_idx is not None and target_idx != current_idx:
+            self._navigation_direction = 1 if target_idx > current_idx else -1
+        self._select_index(target_idx)
+        return "break"
+
+    def _select_index(self, index):
+        item_path = self.all_folder_items[index]['path']
+        if self.selected_item_paths != {item_path}:
+            self._clear_all_selection_visuals()
+            self.selected_item_paths = {item_path}
+            self._mark_visuals_dirty({item_path})
+        self._cursor_item_path = item_path
+        self._ensure_item_visible(item_path)
+        self.update_preview_and_info()
+        self.update_ui_state()
+
     def update_ui_state(self):
         self.up_button.config(state=tk.NORMAL if self.folder_history else tk.DISABLED)
         num_selected = len(self.selected_item_paths)
@@ -988,7 +1983,7 @@ class PhotoVideoManagerApp:
     def open_selected_item_action(self):
         if not self.selected_item_paths or len(self.selected_item_paths) != 1: return
         item_path = list(self.selected_item_paths)[0]
-        item_info_from_view = self.items_in_view.get(item_path)
+        item_info_from_view = self._get_item_data(item_path)
         if not item_info_from_view or not os.path.exists(item_path):
             messagebox.showerror("Error", "Selected item not found or no longer exists.", parent=self.root)
             return
@@ -1024,18 +2019,23 @@ class PhotoVideoManagerApp:
         if not self.selected_item_paths or len(self.selected_item_paths) != 1:
             return
 
-        self.renaming_item_path = list(self.selected_item_paths)[0]
-        if self.renaming_item_path not in self.items_in_view:
+        item_widget_info = self._ensure_item_visible(list(self.selected_item_paths)[0])
+        if not item_widget_info:
             return
+        self.renaming_item_path = item_widget_info['path']
+        original_name = os.path.basename(self.renaming_item_path)
+        if 'slot' in item_widget_info:
+            # Canvas-drawn tile: the entry floats over the name text as a canvas window
+            self.original_name_label = None
+            self.name_edit_entry = ttk.Entry(self.canvas, style="PicsNest.Rename.TEntry")
+            self.tile_renderer.begin_rename(item_widget_info['slot'], self.name_edit_entry)
+            return self._start_rename_entry(original_name)
 
-        item_widget_info = self.items_in_view[self.renaming_item_path]
         self.original_name_label = item_widget_info['name_label']
         item_frame = item_widget_info['widget']
 
         if not self.original_name_label.winfo_exists(): return
 
-        original_name = os.path.basename(self.renaming_item_path)
-
         # For F2, ensure the name_label is visible before trying to hide it for the entry
         # This is important if it was previously hidden or not packed correctly
         if not self.original_name_label.winfo_ismapped():
@@ -1046,11 +2046,13 @@ class PhotoVideoManagerApp:
         self.original_name_label.pack_forget()
 
         self.name_edit_entry = ttk.Entry(item_frame, style="PicsNest.Rename.TEntry")
-        self.name_edit_entry.insert(0, original_name)
         # Pack the entry where the name label was, ensuring it's after the thumb_label
         # If thumb_label was packed TOP, entry should be packed BOTTOM.
         self.name_edit_entry.pack(side=tk.BOTTOM, fill=tk.X, pady=(1,1), ipady=1) 
-        
+        return self._start_rename_entry(original_name)
+
+    def _start_rename_entry(self, original_name):
+        self.name_edit_entry.insert(0, original_name)
         self.name_edit_entry.select_range(0, tk.END)
         self.name_edit_entry.focus_set()
 
@@ -1065,6 +2067,7 @@ class PhotoVideoManagerApp:
         new_name = self.name_edit_entry.get().strip()
         self.name_edit_entry.destroy()
         self.name_edit_entry = None
+        self._end_canvas_tile_rename()
 
         if self.original_name_label and self.original_name_label.winfo_exists():
              self.original_name_label.pack(side=tk.BOTTOM, fill=tk.X, pady=(1,1), ipady=1)
@@ -1097,7 +2100,9 @@ class PhotoVideoManagerApp:
                 self.folder_thumb_db[new_path] = self.folder_thumb_db.pop(self.renaming_item_path)
                 self._save_folder_thumb_db()
 
-            self.load_items(self.current_folder.get()) 
+            renamed_from_path, self.renaming_item_path = self.renaming_item_path, None
+            self._rename_item_in_grid(renamed_from_path, new_path)
+            self.update_preview_and_info()
 
         except OSError as e:
             messagebox.showerror("Rename Error", f"Could not rename: {e}", parent=self.root)
@@ -1110,6 +2115,7 @@ class PhotoVideoManagerApp:
         if self.name_edit_entry and self.name_edit_entry.winfo_exists():
             self.name_edit_entry.destroy()
             self.name_edit_entry = None
+        self._end_canvas_tile_rename()
         if self.original_name_label and self.original_name_label.winfo_exists():
             if not self.original_name_label.winfo_ismapped(): # Repack if it was forgotten
                  self.original_name_label.pack(side=tk.BOTTOM, fill=tk.X, pady=(1,1), ipady=1)
@@ -1117,6 +2123,11 @@ class PhotoVideoManagerApp:
         self.original_name_label = None
         return "break"
 
+    def _end_canvas_tile_rename(self):
+        widget_info = self.items_in_view.get(self.renaming_item_path)
+        if widget_info and 'slot' in widget_info:
+            self.tile_renderer.end_rename(widget_info['slot'])
+
     def _cancel_rename_on_focus_out(self, event=None):
         focused_widget = self.root.focus_get()
         if self.name_edit_entry and focused_widget != self.name_edit_entry:
@@ -1147,6 +2158,10 @@ class PhotoVideoManagerApp:
 
 
     def apply_all_filters_and_refresh(self):
+        """
+        Re-projects the already listed items through the filters, without rescanning the folder.
+        Items that stay visible keep their tiles and thumbnails; hidden ones are unbound and deselected.
+        """
         if self.show_only_screenshots_downloads_var.get() and self.show_only_similar_var.get():
             self.show_only_similar_var.set(False)
 
@@ -1158,32 +2173,42 @@ class PhotoVideoManagerApp:
 
         current_folder_path = self.current_folder.get()
 
-        if os.path.isdir(current_folder_path) and current_folder_path != "No folder selected":
-            self.load_items(current_folder_path)
-        else:
+        if not os.path.isdir(current_folder_path) or current_folder_path == "No folder selected":
             self.all_folder_items = []
             self.clear_view()
             self.update_ui_state()
             self.show_initial_view()
+        elif not self.all_folder_items_raw and not self._is_listing_folder:
+            self.load_items(current_folder_path)
+        else:
+            start_time = time.perf_counter()
+            self._apply_type_filters_to_items_list()
+            self.selected_item_paths &= self.item_index_by_path.keys()
+            self._thumbnail_requested_paths &= self.item_index_by_path.keys() # Jobs for hidden items are dropped
+            self.show_initial_view()
+            if self.all_folder_items:
+                self.canvas.update_idletasks() # Canvas must be mapped to know its size
+            self._layout_virtual_grid()
+            self._refresh_all_item_visuals() # Screenshot/download outlines depend on the filter
+            self.update_preview_and_info()
+            self.update_ui_state()
+            perf_log(f"Filter projection: {len(self.all_folder_items)} of {len(self.all_folder_items_raw)} items "
+                     f"in {(time.perf_counter() - start_time) * 1000:.1f} ms")
 
         if hasattr(self, 'canvas_content_frame') and self.canvas_content_frame.winfo_ismapped():
             self.canvas.update_idletasks()
             self.canvas.yview_moveto(current_scroll_y)
             self.canvas.xview_moveto(current_scroll_x)
+            self._sync_visible_tiles()
 
         self._was_filter_active_before_style_refresh = self.show_only_similar_var.get() or self.show_only_screenshots_downloads_var.get()
 
 
     def _refresh_all_item_visuals(self):
-        for path, item_info_dict in self.items_in_view.items():
-            if item_info_dict['widget'].winfo_exists():
-                self._refresh_single_item_visual(path)
+        self._mark_visuals_dirty(self.items_in_view.keys())
 
     def _get_errored_item_paths(self):
-        return [
-            path for path, info in self.items_in_view.items()
-            if info.get('is_error', False) and os.path.exists(path)
-        ]
+        return [path for path in self.errored_item_paths if os.path.exists(path)]
 
     def _on_folder_right_click(self, event, item_path):
         if self.renaming_item_path:
@@ -1191,8 +2216,7 @@ class PhotoVideoManagerApp:
 
         self._clear_all_selection_visuals()
         self.selected_item_paths = {item_path}
-        if item_path in self.items_in_view:
-            self._refresh_single_item_visual(item_path) 
+        self._mark_visuals_dirty(self.selected_item_paths)
         self.update_preview_and_info()
         self.update_ui_state()
 
@@ -1212,7 +2236,7 @@ class PhotoVideoManagerApp:
             context_menu.grab_release()
 
     def _rename_folder_item_action(self, item_path):
-        if item_path not in self.items_in_view:
+        if item_path not in self.item_index_by_path:
             return
         self.on_f2_key_press()
 
@@ -1233,6 +2257,7 @@ class PhotoVideoManagerApp:
             persistent_icon_path = os.path.join(self.CUSTOM_FOLDER_ICONS_DIR, custom_icon_filename)
 
             shutil.copy2(new_icon_path_original, persistent_icon_path)
+            self.folder_icon_cache.invalidate(persistent_icon_path) # copy2 keeps the source mtime, so the key alone may not change
 
             if item_path not in self.folder_thumb_db:
                 self.folder_thumb_db[item_path] = {}
@@ -1274,6 +2299,8 @@ class PhotoVideoManagerApp:
         else:
             self.folder_thumb_db[item_path] = custom_data 
 
+        if icon_path_to_delete:
+            self.folder_icon_cache.invalidate(icon_path_to_delete)
         if icon_path_to_delete and os.path.exists(icon_path_to_delete):
             try:
                 os.remove(icon_path_to_delete)
@@ -1285,8 +2312,65 @@ class PhotoVideoManagerApp:
         self.update_preview_and_info() 
         messagebox.showinfo("Customizations Reset", "Folder icon and color have been reset.", parent=self.root)
 
+    def _apply_canvas_folder_style(self, item_path, slot):
+        custom_bg_color_from_db = self.folder_thumb_db.get(item_path, {}).get('item_bg_color')
+        if item_path in self.selected_item_paths:
+            self.tile_renderer.set_style(slot, "PicsNest.Selected.TFrame")
+        elif custom_bg_color_from_db:
+            self.tile_renderer.set_style(slot, FOLDER_CUSTOM_STYLE, fill=custom_bg_color_from_db)
+        else:
+            self.tile_renderer.set_style(slot, "PicsNest.Folder.TFrame")
+
+    def _apply_canvas_folder_tile(self, item_path, widget_info):
+        slot = widget_info['slot']
+        custom_icon_path = self._folder_icon_path(item_path)
+        self._apply_canvas_folder_style(item_path, slot)
+
+        widget_info['icon_ref'] = None
+        if custom_icon_path:
+            x1, y1, x2, y2 = slot['bbox']
+            widget_info['icon_ref'] = self.folder_icon_cache.get(
+                custom_icon_path, (x2 - x1 - 10, max(10, y2 - y1 - TILE_NAME_AREA_HEIGHT - 10)))
+            if widget_info['icon_ref'] is not None:
+                self.tile_renderer.show_image(slot, widget_info['icon_ref'])
+                return
+        self.tile_renderer.show_glyph(slot, PICSNEST_FOLDER_ICON)
+
+    def _widget_folder_icon_box(self):
+        # Thumbnail area of a widget folder tile, leaving room for a one-line name
+        return (self.thumbnail_size[0] - 10, max(10, self.thumbnail_size[1] - 30))
+
+    def _apply_widget_folder_style(self, item_path, widget_info):
+        custom_bg_color_from_db = self.folder_thumb_db.get(item_path, {}).get('item_bg_color')
+        current_bg_to_apply = PICSNEST_FOLDER_REPRESENTATION_BG
+        current_border_color = PICSNEST_BORDER_LIGHT 
+        current_borderwidth = 1
+
+        if item_path in self.selected_item_paths:
+            current_bg_to_apply = get_current_accent_color()
+            current_border_color = PICSNEST_TEXT_LIGHT 
+            current_borderwidth = 2
+        elif custom_bg_color_from_db:
+            current_bg_to_apply = custom_bg_color_from_db
+            current_border_color = get_current_accent_color() # Or a fixed border for custom colored folders
+
+        widget_info['widget'].configure(
+            background=current_bg_to_apply, 
+            highlightbackground=current_border_color, 
+            highlightcolor=current_border_color, # For focus
+            highlightthickness=current_borderwidth,
+            borderwidth=current_borderwidth # Ensure borderwidth is also set if relief is SOLID
+        )
+        widget_info['thumb_label'].configure(background=current_bg_to_apply)
+        widget_info['name_label'].configure(background=current_bg_to_apply, foreground=PICSNEST_TEXT_LIGHT)
+
     def _refresh_single_item_visual(self, item_path):
-        if item_path in self.items_in_view:
+        if item_path in self.items_in_view and 'slot' in self.items_in_view[item_path]:
+            if self.items_in_view[item_path]['type'] == 'folder':
+                self._apply_initial_folder_customizations(item_path)
+            else:
+                self._apply_file_item_style(item_path)
+        elif item_path in self.items_in_view:
             widget_info = self.items_in_view[item_path]
             widget_frame = widget_info['widget']
             thumb_label = widget_info['thumb_label']
@@ -1300,55 +2384,15 @@ class PhotoVideoManagerApp:
 
             if widget_info['type'] == 'folder':
                 # This is now a tk.Frame, so we configure it directly
-                custom_data = self.folder_thumb_db.get(item_path, {})
-                custom_icon_path = custom_data.get('item_icon_path')
-                custom_bg_color_from_db = custom_data.get('item_bg_color')
-                is_selected = item_path in self.selected_item_paths
-                # is_similar and is_ss_dl are not typically applied to folders, but check if needed
-                
-                current_bg_to_apply = PICSNEST_FOLDER_REPRESENTATION_BG
-                current_border_color = PICSNEST_BORDER_LIGHT 
-                current_borderwidth = 1
-
-                if is_selected:
-                    current_bg_to_apply = get_current_accent_color()
-                    current_border_color = PICSNEST_TEXT_LIGHT 
-                    current_borderwidth = 2
-                elif custom_bg_color_from_db:
-                    current_bg_to_apply = custom_bg_color_from_db
-                    current_border_color = get_current_accent_color() # Or a fixed border for custom colored folders
-                    current_borderwidth = 1 
-                # else: default folder bg and border already set
-
-                widget_frame.configure(
-                    background=current_bg_to_apply, 
-                    highlightbackground=current_border_color, 
-                    highlightcolor=current_border_color, # For focus
-                    highlightthickness=current_borderwidth,
-                    borderwidth=current_borderwidth # Ensure borderwidth is also set if relief is SOLID
-                )
-                thumb_label.configure(background=current_bg_to_apply)
-                name_label.configure(background=current_bg_to_apply, foreground=PICSNEST_TEXT_LIGHT)
+                custom_icon_path = self._folder_icon_path(item_path)
+                self._apply_widget_folder_style(item_path, widget_info)
 
                 # Icon loading logic
-                loaded_custom_icon = False
-                if custom_icon_path and os.path.exists(custom_icon_path):
-                    try:
-                        img_pil = self.Image.open(custom_icon_path)
-                        widget_frame.update_idletasks()
-                        name_label_h = name_label.winfo_height() if name_label.winfo_ismapped() else 20
-                        
-                        target_h = GRID_THUMBNAIL_SIZE[1] - name_label_h - 10 
-                        target_w = GRID_THUMBNAIL_SIZE[0] - 10
-                        img_pil.thumbnail((target_w, max(10, target_h)), self.Image.Resampling.LANCZOS)
-                        tk_image = self.ImageTk.PhotoImage(img_pil)
-                        thumb_label.configure(image=tk_image, text="", font=None)
-                        thumb_label.custom_icon_ref = tk_image
-                        loaded_custom_icon = True
-                    except Exception as e:
-                        print(f"Error refreshing custom folder icon {custom_icon_path}: {e}")
-                
-                if not loaded_custom_icon:
+                tk_image = self.folder_icon_cache.get(custom_icon_path, self._widget_folder_icon_box()) if custom_icon_path else None
+                if tk_image is not None:
+                    thumb_label.configure(image=tk_image, text="", font=None)
+                    thumb_label.custom_icon_ref = tk_image
+                else:
                     icon_font_size = 36
                     icon_font = ("Segoe UI Symbol", icon_font_size)
                     thumb_label.configure(image='', text=PICSNEST_FOLDER_ICON, font=icon_font)
@@ -1365,8 +2409,6 @@ class PhotoVideoManagerApp:
                 # Typically, "PicsNest.ItemThumb.TLabel" and "PicsNest.ItemName.TLabel"
                 # would have `background="parent"` or a specific color from the theme.
 
-            widget_frame.update_idletasks()
-
     def delete_selected_items_action_entry(self, items_to_delete_override=None, from_viewer=False):
         return action_handlers.handle_delete_items(self, items_to_delete_override, from_viewer)
     def _undo_last_action(self):
@@ -30,11 +30,8 @@ def handle_delete_items(app_instance, items_to_delete_override=None, from_viewer
         return 0 # Return 0 if no paths to process
 
     deleted_for_undo = []
+    removed_paths = [] # Trashed, or already gone from disk; failed moves stay in the grid
     actually_deleted_count = 0
-    items_visually_removed = False
-
-    current_scroll_y = app_instance.canvas.yview()[0]
-    current_scroll_x = app_instance.canvas.xview()[0]
 
     for item_path in list(paths_to_process): # Iterate over a copy
         if os.path.exists(item_path):
@@ -55,45 +52,26 @@ def handle_delete_items(app_instance, items_to_delete_override=None, from_viewer
                 messagebox.showerror("Delete Error", f"Could not move '{item_name}' to trash:\n{e}", parent=app_instance.root)
                 continue # Continue with the next item
 
-        # Visual removal and state update (even if file didn't exist, remove from view)
-        if item_path in app_instance.items_in_view:
-            widget_info = app_instance.items_in_view.pop(item_path, None) # Use pop with default
-            if widget_info and widget_info['widget'].winfo_exists():
-                widget_info['widget'].destroy()
-            items_visually_removed = True
-
+        # State update (even if file didn't exist, remove from view)
+        removed_paths.append(item_path)
         if item_path in app_instance.selected_item_paths:
             app_instance.selected_item_paths.discard(item_path)
 
-        app_instance.all_folder_items_raw = [item for item in app_instance.all_folder_items_raw if item['path'] != item_path]
-        app_instance.all_folder_items = [item for item in app_instance.all_folder_items if item['path'] != item_path]
-
         if item_path in app_instance.marked_similar_paths:
             app_instance.marked_similar_paths.discard(item_path)
         for group in app_instance.similar_image_groups:
             group.discard(item_path) # discard works on sets
         app_instance.similar_image_groups = [g for g in app_instance.similar_image_groups if len(g) > 1] # Re-filter groups
 
+    # One pass over the item lists; only tiles after the first removed item move up
+    app_instance._remove_items_from_grid(removed_paths)
+
     if deleted_for_undo:
         app_instance._add_to_undo_stack('delete_items', items=deleted_for_undo)
         if TRASH_MAX_ITEMS > 0: # Only manage trash size if it's limited
             _manage_trash_size(app_instance.TRASH_DIR) # Manage trash size after adding to undo
 
     if not from_viewer:
-        if items_visually_removed:
-            # Recalculate displayed_item_count based on items_in_view
-            app_instance.displayed_item_count = len(app_instance.items_in_view)
-
-            # If items were removed, the grid might need repacking/reindexing if we were to fill gaps.
-            # For simplicity, load_items or a more complex re-grid would be needed to fill gaps.
-            # Current approach: items are destroyed, scroll region updates. Lazy load handles adding more if space.
-            app_instance.item_frame.update_idletasks()
-            app_instance.on_frame_configure()
-
-            app_instance.canvas.yview_moveto(current_scroll_y)
-            app_instance.canvas.xview_moveto(current_scroll_x)
-            app_instance.root.after_idle(app_instance.on_scroll_check_lazy_load)
-
         app_instance.update_preview_and_info()
         app_instance.update_ui_state()
 
@@ -138,12 +116,11 @@ def handle_undo_action(app_instance):
     if not app_instance.undo_stack:
         return
 
-    current_scroll_y = app_instance.canvas.yview()[0]
-    current_scroll_x = app_instance.canvas.xview()[0]
-
     last_action = app_instance.undo_stack.pop()
     action_type = last_action['action_type']
     restored_count = 0
+    restored_items = []
+    current_folder = os.path.normpath(app_instance.current_folder.get())
     try:
         if action_type == 'delete_items':
             for original_path, trashed_path in last_action['items']:
@@ -151,6 +128,10 @@ def handle_undo_action(app_instance):
                     os.makedirs(os.path.dirname(original_path), exist_ok=True)
                     shutil.move(trashed_path, original_path)
                     restored_count += 1
+                    if os.path.normpath(os.path.dirname(original_path)) == current_folder:
+                        restored_items.append(app_instance._make_item_data(
+                            original_path, os.path.basename(original_path),
+                            'folder' if os.path.isdir(original_path) else 'file'))
                 else:
                     print(f"Undo warning: Trashed file {trashed_path} not found. May have been permanently deleted by trash management or app closure.")
             if restored_count > 0:
@@ -160,14 +141,8 @@ def handle_undo_action(app_instance):
     except Exception as e:
         messagebox.showerror("Undo Error", f"Could not undo: {e}", parent=app_instance.root)
 
-    # Refresh view for current folder
-    app_instance.load_items(app_instance.current_folder.get())
-
-    # Attempt to restore scroll position after reload
-    app_instance.canvas.update_idletasks()
-    app_instance.canvas.yview_moveto(current_scroll_y)
-    app_instance.canvas.xview_moveto(current_scroll_x)
-
+    # Restored items slot back into the current view; everything else keeps its tile, thumbnail and scroll position
+    app_instance._insert_items_into_grid(restored_items)
     app_instance.update_ui_state()
 
 
@@ -197,7 +172,7 @@ def trigger_find_similar_images(app_instance, triggered_by_filter_toggle=False):
 
     app_instance.is_finding_similar = True
     app_instance.status_label.config(text="Finding similar images...")
-    app_instance.cancel_long_operation.clear()
+    cancel_token = app_instance.operation_tokens.begin('similarity', app_instance.current_folder.get())
 
     # Prepare callback for status updates
     def status_update(text):
@@ -206,12 +181,12 @@ def trigger_find_similar_images(app_instance, triggered_by_filter_toggle=False):
 
     thread = threading.Thread(
         target=find_similar_images_worker_thread_entry,
-        args=(app_instance, image_items, triggered_by_filter_toggle, status_update),
+        args=(app_instance, image_items, triggered_by_filter_toggle, status_update, cancel_token),
         daemon=True
     )
     thread.start()
 
-def find_similar_images_worker_thread_entry(app_instance, image_items, triggered_by_filter_toggle, status_callback):
+def find_similar_images_worker_thread_entry(app_instance, image_items, triggered_by_filter_toggle, status_callback, cancel_token):
     """Wrapper to call the core logic and handle results."""
     app_instance.image_hashes_cache.clear() # Clear old cache
 
@@ -220,11 +195,11 @@ def find_similar_images_worker_thread_entry(app_instance, image_items, triggered
         app_instance.similarity_threshold,
         app_instance.Image, # Pass Pillow Image
         app_instance.imagehash, # Pass imagehash module
-        app_instance.cancel_long_operation,
+        cancel_token,
         status_callback
     )
 
-    if app_instance.cancel_long_operation.is_set():
+    if cancel_token.is_set():
         app_instance.is_finding_similar = False
         # Status already updated by core function or callback
         return
@@ -320,7 +295,7 @@ def prompt_and_consolidate_media(app_instance):
 
         app_instance.status_label.config(text=f"{action.capitalize()}ing {media_types_display}...")
         app_instance.root.config(cursor="watch")
-        app_instance.cancel_long_operation.clear()
+        cancel_token = app_instance.operation_tokens.begin('consolidate', current_root_folder)
 
         def status_update(text):
             if app_instance.root.winfo_exists():
@@ -329,7 +304,7 @@ def prompt_and_consolidate_media(app_instance):
         thread = threading.Thread(
             target=consolidate_media_worker_thread_entry,
             args=(app_instance, current_root_folder, destination_folder, action, conflict_resolution,
-                  include_images, include_videos, status_update),
+                  include_images, include_videos, status_update, cancel_token),
             daemon=True
         )
         thread.start()
@@ -343,10 +318,10 @@ def prompt_and_consolidate_media(app_instance):
     y = app_instance.root.winfo_y() + (app_instance.root.winfo_height() - dialog.winfo_height()) // 2
     dialog.geometry(f"+{x}+{y}")
 
-def consolidate_media_worker_thread_entry(app_instance, root_dir, dest_dir, action, conflict_res, incl_img, incl_vid, status_cb):
+def consolidate_media_worker_thread_entry(app_instance, root_dir, dest_dir, action, conflict_res, incl_img, incl_vid, status_cb, cancel_token):
     action_count, skipped_count, error_count, total_found = consolidate_media_core(
         root_dir, dest_dir, action, conflict_res, incl_img, incl_vid,
-        app_instance.cancel_long_operation, status_cb
+        cancel_token, status_cb
     )
 
     if app_instance.root.winfo_exists():
@@ -437,7 +412,7 @@ def prompt_and_organize_media_by_date(app_instance):
 
         app_instance.status_label.config(text=f"{action.capitalize()}ing & organizing {media_types_display}...")
         app_instance.root.config(cursor="watch")
-        app_instance.cancel_long_operation.clear()
+        cancel_token = app_instance.operation_tokens.begin('organize', current_root_folder)
 
         def status_update(text):
             if app_instance.root.winfo_exists():
@@ -446,7 +421,7 @@ def prompt_and_organize_media_by_date(app_instance):
         thread = threading.Thread(
             target=organize_media_by_date_worker_thread_entry,
             args=(app_instance, current_root_folder, destination_base_folder, action, conflict_resolution,
-                  include_images, include_videos, status_update),
+                  include_images, include_videos, status_update, cancel_token),
             daemon=True
         )
         thread.start()
@@ -461,11 +436,11 @@ def prompt_and_organize_media_by_date(app_instance):
     dialog.geometry(f"+{x}+{y}")
 
 
-def organize_media_by_date_worker_thread_entry(app_instance, root_dir, base_dest_dir, action, conflict_res, incl_img, incl_vid, status_cb):
+def organize_media_by_date_worker_thread_entry(app_instance, root_dir, base_dest_dir, action, conflict_res, incl_img, incl_vid, status_cb, cancel_token):
     action_count, skipped_count, error_count, unknown_date_count, total_found = organize_media_by_date_core(
         root_dir, base_dest_dir, action, conflict_res, incl_img, incl_vid,
         app_instance.Image, app_instance.UnidentifiedImageError, # Pass Pillow modules/exceptions
-        app_instance.cancel_long_operation, status_cb
+        cancel_token, status_cb
     )
 
     if app_instance.root.winfo_exists():
@@ -672,7 +647,7 @@ def prompt_and_separate_files(app_instance):
 
         app_instance.status_label.config(text=f"{action.capitalize()}ing {types_display}...")
         app_instance.root.config(cursor="watch")
-        app_instance.cancel_long_operation.clear()
+        cancel_token = app_instance.operation_tokens.begin('separate', current_root_folder)
 
         def status_update(text):
             if app_instance.root.winfo_exists():
@@ -681,7 +656,7 @@ def prompt_and_separate_files(app_instance):
         thread = threading.Thread(
             target=separate_files_worker_thread_entry,
             args=(app_instance, current_root_folder, dest_dir_screenshots, dest_dir_videos,
-                  action, conflict_resolution, do_separate_screenshots, do_separate_videos, status_update),
+                  action, conflict_resolution, do_separate_screenshots, do_separate_videos, status_update, cancel_token),
             daemon=True
         )
         thread.start()
@@ -697,12 +672,12 @@ def prompt_and_separate_files(app_instance):
 
 
 def separate_files_worker_thread_entry(app_instance, root_dir, dest_screenshots, dest_videos,
-                                       action, conflict_res, sep_ss, sep_vid, status_cb):
+                                       action, conflict_res, sep_ss, sep_vid, status_cb, cancel_token):
     action_ss, action_vid, skipped, errors, total_found = separate_files_core(
         root_dir, dest_screenshots, dest_videos, action, conflict_res,
         sep_ss, sep_vid,
         app_instance.Image, app_instance.UnidentifiedImageError, # For screenshot detection
-        app_instance.cancel_long_operation, status_cb
+        cancel_token, status_cb
     )
 
     if app_instance.root.winfo_exists():
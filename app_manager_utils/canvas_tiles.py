@@ -0,0 +1,119 @@
+# app_manager_utils/canvas_tiles.py
+from constants import (
+    PICSNEST_BG_MEDIUM, PICSNEST_TEXT_LIGHT, PICSNEST_BORDER_LIGHT, PICSNEST_ACCENT_BLUE,
+    PICSNEST_SIMILAR_BG, PICSNEST_ERROR_BG, PICSNEST_FOLDER_REPRESENTATION_BG,
+    PICSNEST_ITEM_PLACEHOLDER_BG, PICSNEST_ITEM_LOADED_BG
+)
+
+TILE_NAME_AREA_HEIGHT = 36 # Two lines of the 9pt name font below the thumbnail
+TILE_NAME_CHAR_WIDTH = 6.5 # Rough average glyph width of the name font, used to cut names to two lines
+TILE_STYLE_TAG_PREFIX = "tilestyle:"
+FOLDER_CUSTOM_STYLE = "PicsNest.FolderCustom" # Folder with a user colour: fill is per tile, outline follows the accent
+
+
+def build_tile_palette(accent_color):
+    """Canvas equivalents of the item TFrame styles in ui_creator.apply_app_styles: style name -> rectangle options."""
+    return {
+        "PicsNest.Item.TFrame": {'fill': PICSNEST_ITEM_PLACEHOLDER_BG, 'outline': PICSNEST_BORDER_LIGHT, 'width': 1},
+        "PicsNest.ItemPlaceholder.TFrame": {'fill': PICSNEST_ITEM_PLACEHOLDER_BG, 'outline': PICSNEST_BORDER_LIGHT, 'width': 1},
+        "PicsNest.ItemLoaded.TFrame": {'fill': PICSNEST_ITEM_LOADED_BG, 'outline': PICSNEST_BORDER_LIGHT, 'width': 1},
+        "PicsNest.VideoItem.TFrame": {'fill': PICSNEST_ITEM_LOADED_BG, 'outline': PICSNEST_BORDER_LIGHT, 'width': 1},
+        "PicsNest.VideoPlaceholder.TFrame": {'fill': PICSNEST_ITEM_PLACEHOLDER_BG, 'outline': PICSNEST_BORDER_LIGHT, 'width': 1},
+        "PicsNest.Folder.TFrame": {'fill': PICSNEST_FOLDER_REPRESENTATION_BG, 'outline': PICSNEST_BORDER_LIGHT, 'width': 1},
+        FOLDER_CUSTOM_STYLE: {'outline': accent_color, 'width': 1},
+        "PicsNest.Selected.TFrame": {'fill': accent_color, 'outline': PICSNEST_TEXT_LIGHT, 'width': 2},
+        "PicsNest.Similar.TFrame": {'fill': PICSNEST_BG_MEDIUM, 'outline': PICSNEST_SIMILAR_BG, 'width': 2},
+        "PicsNest.ScreenshotDownloaded.TFrame": {'fill': PICSNEST_BG_MEDIUM, 'outline': PICSNEST_ACCENT_BLUE, 'width': 2},
+        "PicsNest.Error.TFrame": {'fill': PICSNEST_ERROR_BG, 'outline': PICSNEST_TEXT_LIGHT, 'width': 1},
+    }
+
+
+class CanvasTileRenderer:
+    """
+    Draws grid tiles straight onto the canvas: a background rectangle, a thumbnail image,
+    a glyph (placeholder, error or folder icon) and the name. Nothing here is a widget, so a
+    tile costs four canvas items instead of a frame, two labels and their bindings.
+
+    Each background rectangle carries one style tag (TILE_STYLE_TAG_PREFIX + style name), so
+    apply_palette() recolours every tile of a style with a single itemconfigure. Slots are
+    recycled like the widget tiles; hit testing is done by the caller with GridLayout.
+    """
+
+    def __init__(self, canvas, palette):
+        self.canvas = canvas
+        self.palette = palette
+        self._free_slots = []
+
+    def _create_slot(self):
+        canvas = self.canvas
+        return {
+            'bg': canvas.create_rectangle(0, 0, 0, 0, state='hidden', tags=("tile", "tilebg")),
+            'image': canvas.create_image(0, 0, anchor='center', state='hidden', tags=("tile",)),
+            'glyph': canvas.create_text(0, 0, anchor='center', state='hidden', tags=("tile",),
+                                        font=("Segoe UI Symbol", 36), fill=PICSNEST_TEXT_LIGHT),
+            'name': canvas.create_text(0, 0, anchor='n', state='hidden', tags=("tile",), justify='center',
+                                       font=('Segoe UI', 9), fill=PICSNEST_TEXT_LIGHT),
+            'rename_window': None,
+        }
+
+    def acquire(self):
+        return self._free_slots.pop() if self._free_slots else self._create_slot()
+
+    def release(self, slot):
+        self.end_rename(slot)
+        for key in ('bg', 'image', 'glyph', 'name'):
+            self.canvas.itemconfigure(slot[key], state='hidden')
+        self.canvas.itemconfigure(slot['image'], image='')
+        self._free_slots.append(slot)
+
+    def place(self, slot, bbox):
+        x1, y1, x2, y2 = bbox
+        center_x = (x1 + x2) / 2
+        thumb_center_y = (y1 + y2 - TILE_NAME_AREA_HEIGHT) / 2
+        canvas = self.canvas
+        canvas.coords(slot['bg'], x1, y1, x2, y2)
+        canvas.coords(slot['image'], center_x, thumb_center_y)
+        canvas.coords(slot['glyph'], center_x, thumb_center_y)
+        canvas.coords(slot['name'], center_x, y2 - TILE_NAME_AREA_HEIGHT + 2)
+        canvas.itemconfigure(slot['name'], width=max(10, x2 - x1 - 10))
+        canvas.itemconfigure(slot['bg'], state='normal')
+        canvas.itemconfigure(slot['name'], state='normal')
+        slot['bbox'] = bbox
+
+    def set_name(self, slot, text):
+        # Canvas text cannot clip, so long names are shortened to fit the two-line name area
+        x1, _, x2, _ = slot['bbox']
+        max_chars = max(4, int(2 * (x2 - x1 - 10) / TILE_NAME_CHAR_WIDTH))
+        if len(text) > max_chars: text = text[:max_chars - 1] + "…"
+        self.canvas.itemconfigure(slot['name'], text=text)
+
+    def show_image(self, slot, tk_image):
+        self.canvas.itemconfigure(slot['glyph'], state='hidden')
+        self.canvas.itemconfigure(slot['image'], image=tk_image, state='normal')
+
+    def show_glyph(self, slot, text, font=("Segoe UI Symbol", 36), color=PICSNEST_TEXT_LIGHT):
+        self.canvas.itemconfigure(slot['image'], image='', state='hidden')
+        self.canvas.itemconfigure(slot['glyph'], text=text, font=font, fill=color, state='normal')
+
+    def set_style(self, slot, style_name, fill=None):
+        options = dict(self.palette.get(style_name, self.palette["PicsNest.Item.TFrame"]))
+        if fill: options['fill'] = fill
+        self.canvas.itemconfigure(slot['bg'], tags=("tile", "tilebg", TILE_STYLE_TAG_PREFIX + style_name), **options)
+
+    def apply_palette(self, palette):
+        """Recolours all tiles (bound or not) for a new palette: one canvas call per style."""
+        self.palette = palette
+        for style_name, options in palette.items():
+            self.canvas.itemconfigure(TILE_STYLE_TAG_PREFIX + style_name, **options)
+
+    def begin_rename(self, slot, entry_widget):
+        x1, _, x2, y2 = slot['bbox']
+        self.canvas.itemconfigure(slot['name'], state='hidden')
+        slot['rename_window'] = self.canvas.create_window(
+            x1 + 4, y2 - TILE_NAME_AREA_HEIGHT + 2, window=entry_widget, anchor='nw', width=x2 - x1 - 8)
+
+    def end_rename(self, slot):
+        if slot.get('rename_window') is None: return
+        self.canvas.delete(slot['rename_window'])
+        slot['rename_window'] = None
+        self.canvas.itemconfigure(slot['name'], state='normal')
@@ -3,6 +3,8 @@
 # This file can be empty. It makes 'app_manager_utils' a Python package.
 # app_manager_utils/file_operations.py
 import os
+import io
+import struct
 import shutil
 from datetime import datetime
 import threading # Only for type hinting if needed, actual threading is in app_manager
@@ -15,12 +17,13 @@ import threading # Only for type hinting if needed, actual threading is in app_m
 from constants import (
     IMAGE_EXTENSIONS, VIDEO_EXTENSIONS,
     SCREENSHOT_FILENAME_PATTERNS, DOWNLOADED_FILENAME_PATTERNS,
-    EXIF_SOFTWARE_TAGS_PATTERNS
+    EXIF_SOFTWARE_TAGS_PATTERNS, VIDEO_THUMBNAIL_SEEK_LIMIT_S
 )
+from .thumbnail_cache import encode_thumbnail, decode_thumbnail
 
 
 def generate_single_thumbnail(item_data, grid_thumbnail_size,
-                              PillowImage, PillowUnidentifiedImageError, cv2_module):
+                              PillowImage, PillowUnidentifiedImageError, cv2_module, av_module=None):
     """
     Generates a thumbnail for a single image or video file.
     item_data: dict {'path': str, 'name': str, 'type': str}
@@ -34,39 +37,32 @@ def generate_single_thumbnail(item_data, grid_thumbnail_size,
 
             if ext_lower in IMAGE_EXTENSIONS: # Uses imported constant
                 img = PillowImage.open(item_data['path'])
+                orientation = None
                 try:
                     exif = img.getexif()
-                    orientation_tag = 274
-                    if orientation_tag in exif:
-                        orientation = exif[orientation_tag]
-                        if orientation == 3: img = img.rotate(180, expand=True)
-                        elif orientation == 6: img = img.rotate(-90, expand=True)
-                        elif orientation == 8: img = img.rotate(90, expand=True)
+                    orientation = exif.get(274) # Orientation tag
                 except Exception: pass # Ignore EXIF errors
 
-                img.thumbnail(grid_thumbnail_size, PillowImage.Resampling.LANCZOS)
-                if img.mode not in ('RGB', 'RGBA'): img = img.convert('RGB')
+                # Source chain: embedded EXIF preview first, full (reduced-resolution) decode otherwise.
+                # Downscale before rotating, so the rotation never touches the full-resolution raster.
+                embedded_img = extract_embedded_exif_thumbnail(img, item_data['path'], grid_thumbnail_size,
+                                                               orientation, PillowImage)
+                if embedded_img is not None:
+                    img = embedded_img
+                else:
+                    img = decode_reduced_image(img, grid_thumbnail_size, PillowImage)
+                img = _apply_exif_orientation(img, orientation)
                 thumb_image = img
 
-            elif ext_lower in VIDEO_EXTENSIONS and cv2_module: # Uses imported constant
-                cap = None
+            elif ext_lower in VIDEO_EXTENSIONS and (av_module or cv2_module): # Uses imported constant
                 try:
-                    cap = cv2_module.VideoCapture(item_data['path'])
-                    if cap.isOpened():
-                        frame_count = int(cap.get(cv2_module.CAP_PROP_FRAME_COUNT))
-                        frame_no = min(frame_count // 10, 100) if frame_count > 10 else 0
-                        cap.set(cv2_module.CAP_PROP_POS_FRAMES, frame_no)
-                        ret, frame = cap.read()
-                        if ret:
-                            frame_rgb = cv2_module.cvtColor(frame, cv2_module.COLOR_BGR2RGB)
-                            img = PillowImage.fromarray(frame_rgb)
-                            img.thumbnail(grid_thumbnail_size, PillowImage.Resampling.LANCZOS)
-                            thumb_image = img
+                    frame_img, _ = extract_video_frame(item_data['path'], PillowImage, cv2_module, av_module)
+                    if frame_img is not None:
+                        frame_img.thumbnail(grid_thumbnail_size, PillowImage.Resampling.LANCZOS)
+                        thumb_image = frame_img
                 except Exception as e_vid:
                     print(f"Video thumbnail error for {item_data['path']}: {e_vid}")
                     error_flag = True
-                finally:
-                    if cap: cap.release()
 
     except PillowUnidentifiedImageError:
         error_flag = True
@@ -77,6 +73,243 @@ def generate_single_thumbnail(item_data, grid_thumbnail_size,
     return thumb_image, error_flag
 
 
+def generate_encoded_thumbnail(item_data, grid_thumbnail_size):
+    """
+    Worker-process entry point of the thumbnail pool. Modules cannot be passed across
+    processes, so PIL and cv2 are imported here.
+    Returns: (encoded thumbnail bytes or None, error_flag_boolean)
+    """
+    from PIL import Image, UnidentifiedImageError
+    try:
+        import cv2
+    except ImportError:
+        cv2 = None
+    thumb_image, error_flag = generate_single_thumbnail(item_data, grid_thumbnail_size,
+                                                        Image, UnidentifiedImageError, cv2)
+    if thumb_image is None:
+        return None, error_flag
+    return encode_thumbnail(thumb_image), error_flag
+
+
+def downscale_encoded_thumbnail(encoded_bytes, grid_thumbnail_size):
+    """
+    Worker-process entry point: shrinks an already cached, larger thumbnail to a smaller zoom
+    level instead of decoding the original file again.
+    Returns: (encoded thumbnail bytes or None, error_flag_boolean)
+    """
+    from PIL import Image
+    try:
+        img = decode_thumbnail(encoded_bytes, Image)
+        img.thumbnail(grid_thumbnail_size, Image.Resampling.LANCZOS)
+        return encode_thumbnail(img), False
+    except Exception as e:
+        print(f"Could not downscale cached thumbnail: {e}")
+        return None, True
+
+
+def generate_encoded_video_thumbnail(item_data, grid_thumbnail_size):
+    """
+    Runs in the isolated video worker process (see thumbnail_pool.py), which is killed if a
+    file takes too long. Returns: (encoded thumbnail bytes or None, error_flag, metadata dict or None)
+    """
+    from PIL import Image
+    try:
+        import av
+    except ImportError:
+        av = None
+    try:
+        import cv2
+    except ImportError:
+        cv2 = None
+    if av is None and cv2 is None:
+        return None, False, None # No decoder available: keep the placeholder icon
+
+    try:
+        frame_img, metadata = extract_video_frame(item_data['path'], Image, cv2, av)
+    except Exception as e:
+        print(f"Video thumbnail error for {item_data['path']}: {e}")
+        return None, True, {'error': str(e) or type(e).__name__}
+    if frame_img is None:
+        return None, True, dict(metadata or {}, error='no frame decoded')
+    frame_img.thumbnail(grid_thumbnail_size, Image.Resampling.LANCZOS)
+    return encode_thumbnail(frame_img), False, metadata
+
+
+def extract_video_frame(video_path, PillowImage, cv2_module, av_module=None, seek_limit_s=VIDEO_THUMBNAIL_SEEK_LIMIT_S):
+    """
+    Grabs one representative frame: at 10% of the duration, but no later than seek_limit_s,
+    so the seek lands near the start where the first keyframes are. PyAV (if installed) seeks
+    to the keyframe at or before that time and decodes only keyframes; OpenCV seeks by time.
+    Returns: (PIL.Image or None, {'duration_s': float or None, 'width': int, 'height': int})
+    """
+    if av_module is not None:
+        container = av_module.open(video_path)
+        try:
+            stream = container.streams.video[0]
+            stream.codec_context.skip_frame = "NONKEY"
+            duration_s = None
+            if stream.duration and stream.time_base:
+                duration_s = float(stream.duration * stream.time_base)
+            elif container.duration:
+                duration_s = container.duration / av_module.time_base
+            metadata = {'duration_s': duration_s,
+                        'width': stream.codec_context.width, 'height': stream.codec_context.height}
+            target_s = min(duration_s * 0.1, seek_limit_s) if duration_s else 0
+            if target_s > 0 and stream.time_base:
+                container.seek(int(target_s / stream.time_base), stream=stream, backward=True, any_frame=False)
+            for frame in container.decode(stream):
+                return frame.to_image(), metadata
+            return None, metadata
+        finally:
+            container.close()
+
+    cap = cv2_module.VideoCapture(video_path)
+    try:
+        if not cap.isOpened(): return None, None
+        fps = cap.get(cv2_module.CAP_PROP_FPS) or 0
+        frame_count = cap.get(cv2_module.CAP_PROP_FRAME_COUNT) or 0
+        duration_s = frame_count / fps if fps > 0 and frame_count > 0 else None
+        metadata = {'duration_s': duration_s,
+                    'width': int(cap.get(cv2_module.CAP_PROP_FRAME_WIDTH)),
+                    'height': int(cap.get(cv2_module.CAP_PROP_FRAME_HEIGHT))}
+        target_s = min(duration_s * 0.1, seek_limit_s) if duration_s else 0
+        if target_s > 0:
+            cap.set(cv2_module.CAP_PROP_POS_MSEC, target_s * 1000.0)
+        ret, frame = cap.read()
+        if not ret and target_s > 0: # Some containers cannot seek; fall back to the first frame
+            cap.set(cv2_module.CAP_PROP_POS_MSEC, 0)
+            ret, frame = cap.read()
+        if not ret: return None, metadata
+        frame_rgb = cv2_module.cvtColor(frame, cv2_module.COLOR_BGR2RGB)
+        return PillowImage.fromarray(frame_rgb), metadata
+    finally:
+        cap.release()
+
+
+def format_video_metadata(metadata):
+    """'0:42, 1920x1080' style summary of extract_video_frame metadata, or '' if unknown."""
+    if not metadata or metadata.get('error'): return ""
+    parts = []
+    duration_s = metadata.get('duration_s')
+    if duration_s:
+        minutes, seconds = divmod(int(round(duration_s)), 60)
+        hours, minutes = divmod(minutes, 60)
+        parts.append(f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}")
+    if metadata.get('width') and metadata.get('height'):
+        parts.append(f"{metadata['width']}x{metadata['height']}")
+    return ", ".join(parts)
+
+
+def _apply_exif_orientation(img, orientation):
+    if orientation == 3: img = img.rotate(180, expand=True)
+    elif orientation == 6: img = img.rotate(-90, expand=True)
+    elif orientation == 8: img = img.rotate(90, expand=True)
+    return img
+
+
+def decode_reduced_image(img, target_size, PillowImage, first_pass_gap=2):
+    """
+    Decodes a freshly opened (not yet loaded) image straight down to target_size.
+    JPEGs are asked for a DCT-scaled draft close to the target; other formats are shrunk with
+    an integer reduce() and a cheap bilinear pass. Only the final step uses LANCZOS.
+    Returns an RGB or RGBA image that fits inside target_size.
+    """
+    draft_size = (target_size[0] * first_pass_gap, target_size[1] * first_pass_gap)
+    try:
+        img.draft('RGB', draft_size) # No-op for formats without DCT scaling
+    except Exception: pass
+    img.load()
+    if img.mode not in ('RGB', 'RGBA'): img = img.convert('RGB')
+
+    reduce_factor = min(img.width // draft_size[0], img.height // draft_size[1])
+    if reduce_factor >= 2:
+        img = img.reduce(reduce_factor)
+
+    if img.width > draft_size[0] or img.height > draft_size[1]:
+        img.thumbnail(draft_size, PillowImage.Resampling.BILINEAR, reducing_gap=None)
+    img.thumbnail(target_size, PillowImage.Resampling.LANCZOS, reducing_gap=None)
+    return img
+
+
+def _read_ifd1_jpeg_bytes(fp, tiff_base):
+    """
+    Walks a TIFF structure (the EXIF block of a JPEG, or a TIFF file itself) to IFD1 and returns
+    the embedded JPEG thumbnail bytes, or None. Only the IFD headers and the thumbnail are read.
+    """
+    fp.seek(tiff_base)
+    header = fp.read(8)
+    if len(header) < 8: return None
+    if header[:2] == b'II': endian = '<'
+    elif header[:2] == b'MM': endian = '>'
+    else: return None
+    magic, ifd0_offset = struct.unpack(endian + 'HI', header[2:8])
+    if magic != 42 or ifd0_offset == 0: return None
+
+    fp.seek(tiff_base + ifd0_offset)
+    raw_count = fp.read(2)
+    if len(raw_count) < 2: return None
+    ifd0_entry_count = struct.unpack(endian + 'H', raw_count)[0]
+    fp.seek(ifd0_entry_count * 12, os.SEEK_CUR)
+    raw_next = fp.read(4)
+    if len(raw_next) < 4: return None
+    ifd1_offset = struct.unpack(endian + 'I', raw_next)[0]
+    if ifd1_offset == 0: return None
+
+    fp.seek(tiff_base + ifd1_offset)
+    raw_count = fp.read(2)
+    if len(raw_count) < 2: return None
+    ifd1_entry_count = struct.unpack(endian + 'H', raw_count)[0]
+    entries = fp.read(ifd1_entry_count * 12)
+    thumb_offset, thumb_length = None, None
+    for i in range(len(entries) // 12):
+        entry = entries[i * 12:(i + 1) * 12]
+        tag, value_type = struct.unpack(endian + 'HH', entry[:4])
+        if tag not in (0x0201, 0x0202): continue # JPEGInterchangeFormat / JPEGInterchangeFormatLength
+        if value_type == 3: value = struct.unpack(endian + 'H', entry[8:10])[0] # SHORT
+        else: value = struct.unpack(endian + 'I', entry[8:12])[0] # LONG
+        if tag == 0x0201: thumb_offset = value
+        else: thumb_length = value
+
+    if not thumb_offset or not thumb_length or thumb_length > 512 * 1024: return None
+    fp.seek(tiff_base + thumb_offset)
+    data = fp.read(thumb_length)
+    if len(data) != thumb_length or data[:2] != b'\xff\xd8': return None
+    return data
+
+
+def extract_embedded_exif_thumbnail(img, file_path, target_size, orientation, PillowImage):
+    """
+    Returns the EXIF IFD1 preview of a freshly opened image, downscaled to fit target_size,
+    or None when there is no usable preview. The preview is only used if it has the same
+    aspect ratio as the main image (no letterboxing) and is at least as large as the
+    thumbnail a full decode would produce. Orientation is left for the caller to apply.
+    """
+    try:
+        if img.format == 'JPEG':
+            raw_exif = img.info.get('exif') # Already read with the JPEG header
+            if not raw_exif or not raw_exif.startswith(b'Exif\x00\x00'): return None
+            thumb_bytes = _read_ifd1_jpeg_bytes(io.BytesIO(raw_exif), 6)
+        elif img.format == 'TIFF':
+            with open(file_path, 'rb') as fp:
+                thumb_bytes = _read_ifd1_jpeg_bytes(fp, 0)
+        else:
+            return None
+        if not thumb_bytes: return None
+
+        thumb = PillowImage.open(io.BytesIO(thumb_bytes))
+        thumb_w, thumb_h = thumb.size
+        main_w, main_h = img.size
+        if not thumb_w or not thumb_h or not main_w or not main_h: return None
+        if abs((thumb_w / thumb_h) / (main_w / main_h) - 1.0) > 0.03: return None
+
+        oriented_w, oriented_h = (thumb_h, thumb_w) if orientation in (6, 8) else (thumb_w, thumb_h)
+        if min(target_size[0] / oriented_w, target_size[1] / oriented_h) > 1.0:
+            return None # Too small: would need upscaling to reach the grid size
+        return decode_reduced_image(thumb, target_size, PillowImage)
+    except Exception:
+        return None # Malformed EXIF just means falling back to the full decode
+
+
 def get_media_creation_date(file_path, PillowImage, PillowUnidentifiedImageError):
     """
     Tries to get the creation date from EXIF for images, otherwise filesystem mtime.
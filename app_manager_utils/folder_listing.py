@@ -0,0 +1,96 @@
+# app_manager_utils/folder_listing.py
+import os
+import collections
+
+
+def list_folder_core(folder_path, make_item_data, sort_key, cancel_token, on_chunk,
+                     first_chunk_size, max_chunk_size):
+    """
+    Enumerates folder_path and hands sorted runs of item dicts to on_chunk(items, is_last, error).
+    The first run is small so the first screenful can be shown while a slow (network) folder is
+    still being read; later runs double in size up to max_chunk_size. Each run is sorted with
+    sort_key here and the caller merges them, so the final order is the same as one full sort.
+    error is the OSError that stopped the listing (with is_last True), or None.
+    Runs in its own thread. Returns the number of items listed.
+    """
+    chunk, chunk_size, listed_count = [], first_chunk_size, 0
+    try:
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if cancel_token.is_set(): return listed_count
+                try:
+                    is_dir, is_file = entry.is_dir(), entry.is_file()
+                except OSError: continue
+                if not is_dir and not is_file: continue
+                try:
+                    mtime_ns = entry.stat().st_mtime_ns if is_file else None # Free with the entry on Windows
+                except OSError:
+                    mtime_ns = None
+                chunk.append(make_item_data(entry.path, entry.name, 'folder' if is_dir else 'file', mtime_ns))
+                if len(chunk) >= chunk_size:
+                    chunk.sort(key=sort_key)
+                    on_chunk(chunk, False, None)
+                    listed_count += len(chunk)
+                    chunk, chunk_size = [], min(max_chunk_size, chunk_size * 2)
+    except OSError as e:
+        on_chunk([], True, e)
+        return listed_count
+    chunk.sort(key=sort_key)
+    on_chunk(chunk, True, None)
+    return listed_count + len(chunk)
+
+
+def path_mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class FolderListingCache:
+    """
+    Recently left folders, so going back or up does not enumerate them again.
+
+    An entry holds the sorted item dicts (with the type, classification bits and each file's
+    mtime as listed), the directory mtime taken before it was listed, and a grid snapshot: the
+    scroll position and the Tk thumbnail images of the tiles that were loaded. take() only
+    returns an entry whose directory mtime is unchanged (anything added, removed or renamed in it
+    bumps that) and removes it, since the folder becomes the live listing again. Files edited in
+    place do not bump it, so the caller checks each thumbnail against its item's mtime. At most
+    max_folders folders and max_items items are kept; only the newest max_snapshot_folders keep
+    their thumbnail images. Tk-thread only.
+    """
+
+    def __init__(self, max_folders, max_items, max_snapshot_folders):
+        self.max_folders = max_folders
+        self.max_items = max_items
+        self.max_snapshot_folders = max_snapshot_folders
+        self._entries = collections.OrderedDict() # folder path -> entry dict
+        self._total_items = 0
+
+    def put(self, folder_path, mtime_ns, items, scroll_y, thumbnail_size, tile_images):
+        self.discard(folder_path)
+        if mtime_ns is None or len(items) > self.max_items: return
+        self._entries[folder_path] = {'mtime_ns': mtime_ns, 'items': items, 'scroll_y': scroll_y,
+                                      'thumbnail_size': thumbnail_size, 'tile_images': tile_images}
+        self._total_items += len(items)
+        while len(self._entries) > self.max_folders or self._total_items > self.max_items:
+            _, entry = self._entries.popitem(last=False)
+            self._total_items -= len(entry['items'])
+        stale_snapshot_count = len(self._entries) - self.max_snapshot_folders
+        for entry in list(self._entries.values())[:max(0, stale_snapshot_count)]:
+            entry['tile_images'] = []
+
+    def take(self, folder_path):
+        entry = self._entries.get(folder_path)
+        if entry is None: return None
+        self.discard(folder_path)
+        return entry if entry['mtime_ns'] == path_mtime_ns(folder_path) else None
+
+    def discard(self, folder_path):
+        entry = self._entries.pop(folder_path, None)
+        if entry is not None: self._total_items -= len(entry['items'])
+
+    def clear(self):
+        self._entries.clear()
+        self._total_items = 0
@@ -0,0 +1,111 @@
+# app_manager_utils/folder_mosaics.py
+import os
+import hashlib
+
+from constants import IMAGE_EXTENSIONS
+
+# PIL is passed in as an argument (same convention as file_operations.py)
+
+MOSAIC_GRID = 2 # Cells per side: a 2x2 mosaic of the folder's first images
+MOSAIC_FILE_EXT = ".jpg"
+
+
+def mosaic_file_path(mosaic_dir, folder_path, thumbnail_size):
+    folder_hash = hashlib.md5(os.path.abspath(folder_path).encode('utf-8', 'surrogatepass')).hexdigest()
+    return os.path.join(mosaic_dir, f"mosaic_{folder_hash}_{thumbnail_size[0]}x{thumbnail_size[1]}{MOSAIC_FILE_EXT}")
+
+
+def folder_mtime_ns(folder_path):
+    try:
+        return os.stat(folder_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _first_images(folder_path, count):
+    try:
+        with os.scandir(folder_path) as it:
+            names = sorted((entry.name for entry in it
+                            if not entry.name.startswith('.') and entry.name.lower().endswith(IMAGE_EXTENSIONS)),
+                           key=str.lower)
+    except OSError:
+        return []
+    return [{'path': os.path.join(folder_path, name), 'name': name, 'type': 'file'} for name in names[:count]]
+
+
+def compose_folder_mosaic(folder_path, disk_cache, thumbnail_size, PillowImage):
+    """
+    2x2 cover of the first images in folder_path, built from the grid thumbnail cache only: no
+    original is decoded here. Returns (PIL image, or None if none of the images has a cached
+    thumbnail, items whose thumbnail is not cached).
+    """
+    cell_w, cell_h = thumbnail_size[0] // MOSAIC_GRID, thumbnail_size[1] // MOSAIC_GRID
+    cells, missing_items = [], []
+    for item_data in _first_images(folder_path, MOSAIC_GRID * MOSAIC_GRID):
+        thumb = disk_cache.load_image(disk_cache.make_key(item_data['path'], thumbnail_size), PillowImage)
+        if thumb is None: missing_items.append(item_data)
+        else: cells.append(thumb)
+    if not cells: return None, missing_items
+
+    mosaic = PillowImage.new('RGB', (cell_w * MOSAIC_GRID, cell_h * MOSAIC_GRID), (0, 0, 0))
+    for cell_index, thumb in enumerate(cells):
+        if thumb.mode != 'RGB': thumb = thumb.convert('RGB')
+        # Centre-crop each thumbnail to the cell's aspect ratio, then scale it to fill the cell
+        scale = max(cell_w / thumb.width, cell_h / thumb.height)
+        crop_w, crop_h = min(thumb.width, round(cell_w / scale)), min(thumb.height, round(cell_h / scale))
+        left, top = (thumb.width - crop_w) // 2, (thumb.height - crop_h) // 2
+        cell = thumb.crop((left, top, left + crop_w, top + crop_h)).resize((cell_w, cell_h), PillowImage.Resampling.LANCZOS)
+        row, col = divmod(cell_index, MOSAIC_GRID)
+        mosaic.paste(cell, (col * cell_w, row * cell_h))
+    return mosaic, missing_items
+
+
+def build_folder_mosaics_core(folder_paths, mosaic_dir, known_mosaics, disk_cache, thumbnail_size,
+                              PillowImage, cancel_token, on_mosaic, request_thumbnails=None):
+    """
+    Writes a mosaic for every folder in folder_paths whose entry in known_mosaics (folder path ->
+    {'mosaic_path', 'folder_mtime_ns', 'thumbnail_size', 'missing_count'}) is missing, older than
+    the folder, of another size or built while some of its thumbnails were not cached yet.
+    on_mosaic(folder_path, entry) is called from this thread for each folder (re)built; the
+    entry's mosaic_path is None when no image of the folder has a cached thumbnail (an older
+    mosaic is kept while thumbnails are still missing, else removed). Uncached thumbnails are handed to request_thumbnails(folder_path, items),
+    if given, so the thumbnail pool makes them and the caller can build the folder again.
+    Runs in its own thread. Returns the number of folders (re)built.
+    """
+    os.makedirs(mosaic_dir, exist_ok=True)
+    built_count = 0
+    for folder_path in folder_paths:
+        if cancel_token.is_set(): break
+        mtime_ns = folder_mtime_ns(folder_path)
+        if mtime_ns is None: continue
+        known = known_mosaics.get(folder_path) or {}
+        if known.get('folder_mtime_ns') == mtime_ns and known.get('thumbnail_size') == list(thumbnail_size) and \
+           not known.get('missing_count') and (known.get('mosaic_path') is None or os.path.exists(known['mosaic_path'])):
+            continue
+        try:
+            mosaic, missing_items = compose_folder_mosaic(folder_path, disk_cache, thumbnail_size, PillowImage)
+        except Exception as e:
+            print(f"Could not build folder mosaic for {folder_path}: {e}")
+            continue
+        if cancel_token.is_set(): break
+        target_path = mosaic_file_path(mosaic_dir, folder_path, thumbnail_size)
+        entry = {'mosaic_path': None, 'folder_mtime_ns': mtime_ns, 'thumbnail_size': list(thumbnail_size),
+                 'missing_count': len(missing_items)}
+        if mosaic is None and missing_items and known.get('mosaic_path') and os.path.exists(known['mosaic_path']):
+            entry['mosaic_path'] = known['mosaic_path'] # Shown until the thumbnails for the new one are made
+        elif mosaic is not None:
+            tmp_path = f"{target_path}.tmp"
+            try:
+                mosaic.save(tmp_path, format='JPEG', quality=88)
+                os.replace(tmp_path, target_path)
+            except OSError as e:
+                print(f"Could not write folder mosaic {target_path}: {e}")
+                continue
+            entry['mosaic_path'] = target_path
+        for stale_path in {target_path, known.get('mosaic_path')} - {entry['mosaic_path'], None}:
+            try: os.remove(stale_path)
+            except OSError: pass
+        on_mosaic(folder_path, entry)
+        if missing_items and request_thumbnails: request_thumbnails(folder_path, missing_items)
+        built_count += 1
+    return built_count
@@ -0,0 +1,170 @@
+# app_manager_utils/folder_watcher.py
+import os
+import time
+import threading
+
+# watchdog is optional: its Observer class is passed in (None selects polling)
+
+
+class FolderWatcher:
+    """
+    Watches one folder (not its subfolders) and reports what changed in it, in debounced batches.
+
+    With a watchdog observer (inotify on Linux) events arrive as they happen; without one the
+    folder is re-listed whenever its mtime changes, every poll_interval_s. Either way only the
+    touched paths are collected, and a batch is delivered debounce_s after the last event (or
+    max_delay_s after the first one, so a long sync shows progress). At delivery each path is
+    checked against the disk, which folds created-then-deleted bursts away:
+    on_changes(folder_path, present_paths, absent_paths, renamed_pairs, modified_paths) is called
+    from the watcher thread. renamed_pairs are (old, new) moves inside the folder whose result is
+    still true on disk; modified_paths are present paths whose content was written or replaced by
+    a rename onto them. Polling sees neither: renames come as absent + present, and content
+    changes are not reported.
+    """
+
+    def __init__(self, on_changes, debounce_s, max_delay_s, poll_interval_s, observer_class=None):
+        self.on_changes = on_changes
+        self.debounce_s = debounce_s
+        self.max_delay_s = max_delay_s
+        self.poll_interval_s = poll_interval_s
+        self.observer_class = observer_class
+        self._observer = None
+        self._folder_path = None
+        self._folder_norm_path = None
+        self._touched_paths = set()
+        self._modified_paths = set()
+        self._renamed_pairs = []
+        self._first_event_at = self._last_event_at = None
+        self._condition = threading.Condition()
+        self._is_shut_down = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def uses_polling(self):
+        return self._observer is None
+
+    def watch(self, folder_path):
+        """Switches to folder_path (None stops watching); events still pending for the old folder are dropped."""
+        with self._condition:
+            if folder_path == self._folder_path: return
+            self._folder_path = folder_path
+            self._folder_norm_path = os.path.normpath(folder_path) if folder_path else None
+            self._touched_paths.clear()
+            self._modified_paths.clear()
+            self._renamed_pairs.clear()
+            self._first_event_at = self._last_event_at = None
+            self._condition.notify()
+        if self.observer_class is None or folder_path is None:
+            self._stop_observer()
+            return
+        try:
+            if self._observer is None:
+                self._observer = self.observer_class()
+                self._observer.start()
+            self._observer.unschedule_all()
+            self._observer.schedule(self, folder_path, recursive=False)
+        except Exception as e:
+            print(f"Folder watcher: falling back to polling for {folder_path}: {e}")
+            self._stop_observer()
+
+    def shutdown(self):
+        with self._condition:
+            self._is_shut_down = True
+            self._condition.notify()
+        self._stop_observer()
+
+    def _stop_observer(self):
+        observer, self._observer = self._observer, None
+        if observer is None: return
+        try:
+            observer.stop()
+        except Exception as e:
+            print(f"Error stopping folder observer: {e}")
+
+    def dispatch(self, event):
+        # Called by the watchdog observer thread
+        if event.event_type not in ('created', 'deleted', 'moved', 'modified', 'closed'): return
+        with self._condition:
+            if self._folder_path is None: return
+            # Reported paths are built from the folder path as given, so they match the app's item paths
+            src_path = self._path_in_folder(event.src_path)
+            if src_path: self._touched_paths.add(src_path)
+            if src_path and event.event_type in ('modified', 'closed'): self._modified_paths.add(src_path)
+            dest_path = self._path_in_folder(getattr(event, 'dest_path', None)) if event.event_type == 'moved' else None
+            if dest_path:
+                self._touched_paths.add(dest_path)
+                self._modified_paths.add(dest_path) # An atomic save renames a temp file onto the image
+                if src_path: self._renamed_pairs.append((src_path, dest_path))
+            if src_path or dest_path: self._note_event()
+
+    def _path_in_folder(self, event_path):
+        if not event_path: return None
+        event_path = os.path.normpath(event_path)
+        if os.path.dirname(event_path) != self._folder_norm_path: return None
+        return os.path.join(self._folder_path, os.path.basename(event_path))
+
+    def _note_event(self):
+        now = time.monotonic()
+        if self._first_event_at is None: self._first_event_at = now
+        self._last_event_at = now
+        self._condition.notify()
+
+    def _due_in(self, now):
+        """Seconds until the pending batch is due (<= 0: now), or None if nothing is pending."""
+        if self._first_event_at is None: return None
+        return min(self._last_event_at + self.debounce_s, self._first_event_at + self.max_delay_s) - now
+
+    def _run(self):
+        polled_folder = polled_mtime_ns = None
+        polled_names = set()
+        next_poll_at = 0.0
+        while True:
+            with self._condition:
+                while True:
+                    if self._is_shut_down: return
+                    now = time.monotonic()
+                    due_in = self._due_in(now)
+                    if due_in is not None and due_in <= 0: break
+                    poll_in = next_poll_at - now if self._observer is None and self._folder_path else None
+                    if poll_in is not None and poll_in <= 0: break
+                    waits = [t for t in (due_in, poll_in) if t is not None]
+                    self._condition.wait(min(waits) if waits else None)
+                folder_path = self._folder_path
+                batch = None
+                if due_in is not None and due_in <= 0:
+                    batch = (self._touched_paths, self._renamed_pairs, self._modified_paths)
+                    self._touched_paths, self._renamed_pairs, self._modified_paths = set(), [], set()
+                    self._first_event_at = self._last_event_at = None
+
+            if batch is not None:
+                self._deliver(folder_path, *batch)
+                continue
+
+            next_poll_at = time.monotonic() + self.poll_interval_s
+            if folder_path != polled_folder:
+                polled_folder, polled_mtime_ns, polled_names = folder_path, None, None
+            try:
+                mtime_ns = os.stat(folder_path).st_mtime_ns
+                if mtime_ns == polled_mtime_ns: continue
+                with os.scandir(folder_path) as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                continue
+            if polled_names is not None:
+                changed_names = names ^ polled_names
+                with self._condition:
+                    if self._folder_path == folder_path and changed_names:
+                        self._touched_paths.update(os.path.join(folder_path, name) for name in changed_names)
+                        self._note_event()
+            polled_mtime_ns, polled_names = mtime_ns, names
+
+    def _deliver(self, folder_path, touched_paths, renamed_pairs, modified_paths):
+        if folder_path is None or not touched_paths: return
+        present_paths = {path for path in touched_paths if os.path.lexists(path)}
+        renamed_pairs = [(old, new) for old, new in renamed_pairs if old not in present_paths and new in present_paths]
+        try:
+            self.on_changes(folder_path, present_paths, touched_paths - present_paths, renamed_pairs,
+                            modified_paths & present_paths)
+        except Exception as e:
+            print(f"Error delivering folder changes for {folder_path}: {e}")
@@ -0,0 +1,102 @@
+# app_manager_utils/grid_layout.py
+import math
+
+
+class GridLayout:
+    """
+    Arithmetic geometry of the item grid: as many equal-width cells per row as fit the width
+    at `min_cell_width` or more, every row `cell_height` pixels tall, inside a `margin` on each
+    side. Item index <-> canvas coordinates and the scroll region are computed from the item
+    count alone, so no widget needs to exist (or be queried) for items outside the viewport.
+    """
+
+    def __init__(self, min_cell_width, cell_height, cell_padding, margin):
+        self.min_cell_width = min_cell_width
+        self.cell_height = cell_height
+        self.cell_padding = cell_padding
+        self.margin = margin
+        self.width = 0
+        self.columns = 1
+        self.cell_width = 1
+
+    def set_width(self, width):
+        """Returns True if the column count or cell width changed (tiles need repositioning)."""
+        self.width = max(1, width)
+        usable_width = self.width - 2 * self.margin
+        columns = max(1, usable_width // self.min_cell_width)
+        cell_width = max(1, usable_width // columns)
+        changed = columns != self.columns or cell_width != self.cell_width
+        self.columns, self.cell_width = columns, cell_width
+        return changed
+
+    def set_cell_size(self, min_cell_width, cell_height):
+        """For a new zoom level; returns True if the geometry changed."""
+        changed = cell_height != self.cell_height
+        self.min_cell_width, self.cell_height = min_cell_width, cell_height
+        return self.set_width(self.width) or changed
+
+    def row_count(self, item_count):
+        return math.ceil(item_count / self.columns)
+
+    def total_height(self, item_count):
+        return 2 * self.margin + self.row_count(item_count) * self.cell_height
+
+    def scroll_region(self, item_count):
+        return (0, 0, self.width, self.total_height(item_count))
+
+    def tile_bbox(self, index):
+        """(x1, y1, x2, y2) of the tile at index, inside its cell padding."""
+        row, col = divmod(index, self.columns)
+        x1 = self.margin + col * self.cell_width + self.cell_padding
+        y1 = self.margin + row * self.cell_height + self.cell_padding
+        return (x1, y1,
+                x1 + self.cell_width - 2 * self.cell_padding,
+                y1 + self.cell_height - 2 * self.cell_padding)
+
+    def index_range(self, y_top, y_bottom, item_count, margin_rows=0):
+        """Indexes of the first and last item in rows overlapping [y_top, y_bottom] (last < first when empty)."""
+        if item_count <= 0: return 0, -1
+        last_row_of_grid = self.row_count(item_count) - 1
+        first_row = int((y_top - self.margin) // self.cell_height) - margin_rows
+        last_row = int((y_bottom - self.margin) // self.cell_height) + margin_rows
+        first_row = min(max(0, first_row), last_row_of_grid)
+        last_row = min(max(0, last_row), last_row_of_grid)
+        return first_row * self.columns, min(item_count, (last_row + 1) * self.columns) - 1
+
+    def index_at(self, x, y, item_count):
+        """Index of the tile under canvas point (x, y), or None for the gaps between tiles."""
+        if x < self.margin or y < self.margin: return None
+        col = int((x - self.margin) // self.cell_width)
+        row = int((y - self.margin) // self.cell_height)
+        if col >= self.columns: return None
+        index = row * self.columns + col
+        if index >= item_count: return None
+        x1, y1, x2, y2 = self.tile_bbox(index)
+        return index if x1 <= x <= x2 and y1 <= y <= y2 else None
+
+    def cells_in_rect(self, x1, y1, x2, y2, item_count):
+        """(first_row, last_row, first_col, last_col) of the tiles overlapping the rectangle, or None."""
+        if item_count <= 0: return None
+        span = self.cell_padding
+        first_col = max(0, math.ceil((x1 - self.margin + span) / self.cell_width - 1))
+        last_col = min(self.columns - 1, math.floor((x2 - self.margin - span) / self.cell_width))
+        first_row = max(0, math.ceil((y1 - self.margin + span) / self.cell_height - 1))
+        last_row = min(self.row_count(item_count) - 1, math.floor((y2 - self.margin - span) / self.cell_height))
+        if first_col > last_col or first_row > last_row: return None
+        return first_row, last_row, first_col, last_col
+
+    def indexes_in_cells(self, cells, item_count):
+        """Item indexes covered by a cells_in_rect() result, row by row."""
+        if cells is None: return []
+        first_row, last_row, first_col, last_col = cells
+        indexes = []
+        for row in range(first_row, last_row + 1):
+            row_start = row * self.columns
+            indexes.extend(range(row_start + first_col, min(item_count, row_start + last_col + 1)))
+        return indexes
+
+    def visible_rows(self, viewport_height):
+        return max(1, math.ceil(viewport_height / self.cell_height))
+
+    def row_top(self, index):
+        return self.margin + (index // self.columns) * self.cell_height
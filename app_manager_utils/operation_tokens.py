@@ -0,0 +1,68 @@
+# app_manager_utils/operation_tokens.py
+import threading
+import itertools
+
+
+class CancellationToken:
+    """
+    Cancellation flag of one long-running job, scoped to its operation (and folder, if any).
+    Offers is_set() like threading.Event, so it can be passed wherever the *_core
+    functions expect a cancel_event.
+    """
+
+    def __init__(self, scope, context, generation):
+        self.scope = scope
+        self.context = context
+        self.generation = generation
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def is_set(self):
+        return self._event.is_set()
+
+    def __repr__(self):
+        state = "cancelled" if self.is_set() else "active"
+        return f"<CancellationToken {self.scope}#{self.generation} {state} {self.context!r}>"
+
+
+class OperationTokens:
+    """
+    Hands out one token per operation scope ('folder', 'similarity', 'consolidate', ...).
+    Starting a new job in a scope cancels the previous job of that scope only, so navigating
+    folders no longer interrupts a consolidation running over the root, and vice versa.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generations = itertools.count(1)
+        self._current = {}
+
+    def begin(self, scope, context=None):
+        with self._lock:
+            previous = self._current.get(scope)
+            token = CancellationToken(scope, context, next(self._generations))
+            self._current[scope] = token
+        if previous: previous.cancel()
+        return token
+
+    def current(self, scope):
+        with self._lock:
+            return self._current.get(scope)
+
+    def is_current(self, token):
+        with self._lock:
+            return self._current.get(token.scope) is token and not token.is_set()
+
+    def cancel(self, scope):
+        with self._lock:
+            token = self._current.pop(scope, None)
+        if token: token.cancel()
+
+    def cancel_all(self):
+        with self._lock:
+            tokens = list(self._current.values())
+            self._current.clear()
+        for token in tokens:
+            token.cancel()
@@ -0,0 +1,10 @@
+# app_manager_utils/perf_stats.py
+import time
+
+from constants import PERF_LOGGING_ENABLED
+
+
+def perf_log(message):
+    """Prints a timing/telemetry line when PERF_LOGGING_ENABLED is set in constants.py."""
+    if PERF_LOGGING_ENABLED:
+        print(f"[perf {time.strftime('%H:%M:%S')}] {message}")
@@ -0,0 +1,120 @@
+# app_manager_utils/photo_image_cache.py
+import os
+import collections
+
+
+def estimate_photo_image_bytes(width, height):
+    # Tk keeps every photo image as 32-bit RGBA, whatever the source format
+    return width * height * 4
+
+
+class PhotoImageLRU:
+    """
+    Keeps the Tk PhotoImages of grid tiles within a count and byte budget.
+
+    Entries are keyed by item path, least recently used first. When the budget is exceeded,
+    trim() releases the oldest entries that the caller does not want to keep (typically the
+    tiles in and around the viewport): on_release(key) is called so the tile can drop its
+    reference and show its placeholder again; the tile is rebuilt from the disk thumbnail
+    cache when it scrolls back into view. Tk-thread only.
+    """
+
+    def __init__(self, max_count, max_bytes, on_release):
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.on_release = on_release
+        self._entries = collections.OrderedDict() # key -> (PhotoImage, estimated bytes)
+        self._total_bytes = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def add(self, key, photo_image):
+        self.discard(key)
+        size = estimate_photo_image_bytes(photo_image.width(), photo_image.height())
+        self._entries[key] = (photo_image, size)
+        self._total_bytes += size
+
+    def touch(self, keys):
+        for key in keys:
+            if key in self._entries: self._entries.move_to_end(key)
+
+    def items(self):
+        """(key, PhotoImage) pairs, least recently used first."""
+        return [(key, entry[0]) for key, entry in self._entries.items()]
+
+    def discard(self, key):
+        """Forgets key without calling on_release (the tile is gone or is being replaced)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None: self._total_bytes -= entry[1]
+
+    def clear(self):
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def is_over_budget(self):
+        return len(self._entries) > self.max_count or self._total_bytes > self.max_bytes
+
+    def trim(self, keep_fn=None):
+        """Releases least recently used entries until within budget. Returns the number released."""
+        if not self.is_over_budget(): return 0
+        released = 0
+        for key in list(self._entries):
+            if not self.is_over_budget(): break
+            if keep_fn and keep_fn(key): continue
+            self.discard(key)
+            released += 1
+            try:
+                self.on_release(key)
+            except Exception as e:
+                print(f"Error releasing thumbnail image for {key}: {e}")
+        return released
+
+    def stats(self):
+        """Returns (image count, estimated bytes)."""
+        return len(self._entries), self._total_bytes
+
+
+class ResizedIconCache:
+    """
+    Custom folder icons, decoded and shrunk once per (icon path, mtime, box size) and shared by
+    every folder tile and the preview pane. An icon file that changed on disk misses the cache
+    by its mtime; invalidate() drops an icon explicitly. Tk-thread only.
+    """
+
+    def __init__(self, max_entries, PillowImage, ImageTkModule):
+        self.max_entries = max_entries
+        self.Image = PillowImage
+        self.ImageTk = ImageTkModule
+        self._entries = collections.OrderedDict() # (icon path, mtime_ns, box size) -> PhotoImage
+
+    def get(self, icon_path, box_size):
+        """PhotoImage of icon_path fitted into box_size, or None if it cannot be read."""
+        try:
+            mtime_ns = os.stat(icon_path).st_mtime_ns
+        except OSError:
+            return None
+        key = (icon_path, mtime_ns, tuple(box_size))
+        photo_image = self._entries.get(key)
+        if photo_image is not None:
+            self._entries.move_to_end(key)
+            return photo_image
+        try:
+            img_pil = self.Image.open(icon_path)
+            img_pil.thumbnail(key[2], self.Image.Resampling.LANCZOS)
+            photo_image = self.ImageTk.PhotoImage(img_pil)
+        except Exception as e:
+            print(f"Error loading custom folder icon {icon_path}: {e}")
+            return None
+        self._entries[key] = photo_image
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return photo_image
+
+    def invalidate(self, icon_path):
+        for key in [key for key in self._entries if key[0] == icon_path]:
+            del self._entries[key]
@@ -0,0 +1,83 @@
+# app_manager_utils/preview_prefetch.py
+import os
+import threading
+import collections
+
+
+class PreviewPrefetcher:
+    """
+    Loads side-panel previews off the Tk thread and keeps the most recent ones.
+
+    request(paths) replaces whatever was still waiting: the first path is the one the user is
+    looking at, the rest are speculative (the next items in the direction of travel), so holding
+    an arrow key never builds up a backlog of previews nobody will see. load_fn(path) runs in the
+    loader thread and returns a result dict (PIL image and labels, no Tk objects); results are
+    kept per (path, mtime) in a small LRU. on_ready(path) is called from the loader thread.
+    """
+
+    def __init__(self, load_fn, on_ready, max_entries):
+        self.load_fn = load_fn
+        self.on_ready = on_ready
+        self.max_entries = max_entries
+        self._results = collections.OrderedDict() # path -> (mtime_ns, result)
+        self._wanted = collections.deque()
+        self._condition = threading.Condition()
+        self._is_shut_down = False
+        self._thread = threading.Thread(target=self._load_loop, daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _mtime_ns(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, path):
+        """The cached result for path if the file has not changed since, else None."""
+        with self._condition:
+            entry = self._results.get(path)
+            if entry is None: return None
+            self._results.move_to_end(path)
+        if entry[0] != self._mtime_ns(path):
+            self.discard(path)
+            return None
+        return entry[1]
+
+    def discard(self, path):
+        with self._condition:
+            self._results.pop(path, None)
+
+    def request(self, paths):
+        with self._condition:
+            self._wanted = collections.deque(path for path in paths if path not in self._results)
+            self._condition.notify()
+
+    def shutdown(self):
+        with self._condition:
+            self._is_shut_down = True
+            self._wanted.clear()
+            self._condition.notify()
+
+    def _load_loop(self):
+        while True:
+            with self._condition:
+                while not self._is_shut_down and not self._wanted:
+                    self._condition.wait()
+                if self._is_shut_down: return
+                path = self._wanted.popleft()
+                if path in self._results: continue
+            mtime_ns = self._mtime_ns(path)
+            try:
+                result = self.load_fn(path)
+            except Exception as e:
+                print(f"Error loading preview for {path}: {e}")
+                continue
+            with self._condition:
+                self._results[path] = (mtime_ns, result)
+                while len(self._results) > self.max_entries:
+                    self._results.popitem(last=False)
+            try:
+                self.on_ready(path)
+            except Exception as e:
+                print(f"Error delivering preview for {path}: {e}")
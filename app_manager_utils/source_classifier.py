@@ -0,0 +1,113 @@
+# app_manager_utils/source_classifier.py
+import os
+import threading
+import collections
+
+
+class SourceTypeClassifier:
+    """
+    Screenshot/download classification of images, off the Tk thread and only on demand.
+
+    classify_fn(path) opens the file and parses its EXIF, so nothing is classified while a
+    folder is listed: callers request() the paths they need (the screenshot filter, the
+    preview's Source label) and peek() at what is known. Results are kept per (path, mtime)
+    and handed to on_ready([(path, source_type, mtime_ns), ...]) from the classifier thread in batches
+    of up to batch_size, so the filter view can grow as they arrive.
+    """
+
+    def __init__(self, classify_fn, on_ready, max_entries, batch_size):
+        self.classify_fn = classify_fn
+        self.on_ready = on_ready
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        self._results = collections.OrderedDict() # path -> (mtime_ns, source_type or None)
+        self._wanted = collections.deque()
+        self._wanted_set = set()
+        self._condition = threading.Condition()
+        self._is_shut_down = False
+        self._thread = threading.Thread(target=self._classify_loop, daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _mtime_ns(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def peek(self, path, mtime_ns=None):
+        """(True, source_type) if path was classified and has not changed since, else (False, None)."""
+        with self._condition:
+            entry = self._results.get(path)
+        if entry is None: return False, None
+        if entry[0] != (mtime_ns if mtime_ns is not None else self._mtime_ns(path)):
+            return False, None
+        return True, entry[1]
+
+    def request(self, paths, urgent=False):
+        """Queues paths for classification; urgent ones (the selected item) jump the queue."""
+        with self._condition:
+            for path in paths:
+                if path in self._wanted_set:
+                    if not urgent: continue
+                    self._wanted.remove(path)
+                self._wanted_set.add(path)
+                if urgent: self._wanted.appendleft(path)
+                else: self._wanted.append(path)
+            self._condition.notify()
+
+    def clear_pending(self):
+        with self._condition:
+            self._wanted.clear()
+            self._wanted_set.clear()
+
+    def pending_count(self):
+        with self._condition:
+            return len(self._wanted)
+
+    def shutdown(self):
+        with self._condition:
+            self._is_shut_down = True
+            self._wanted.clear()
+            self._wanted_set.clear()
+            self._condition.notify()
+
+    def _deliver(self, batch):
+        try:
+            self.on_ready(batch)
+        except Exception as e:
+            print(f"Error delivering source types: {e}")
+
+    def _classify_loop(self):
+        batch = []
+        while True:
+            with self._condition:
+                if batch and (not self._wanted or len(batch) >= self.batch_size):
+                    ready, batch = batch, []
+                else:
+                    ready = None
+                    while not self._is_shut_down and not self._wanted:
+                        self._condition.wait()
+                    if self._is_shut_down: return
+                    path = self._wanted.popleft()
+                    self._wanted_set.discard(path)
+            if ready:
+                self._deliver(ready)
+                continue
+            mtime_ns = self._mtime_ns(path)
+            if mtime_ns is None: continue
+            is_known, source_type = self.peek(path, mtime_ns)
+            if is_known:
+                batch.append((path, source_type, mtime_ns))
+                continue
+            try:
+                source_type = self.classify_fn(path)
+            except Exception as e:
+                print(f"Error classifying {path}: {e}")
+                source_type = None
+            with self._condition:
+                self._results[path] = (mtime_ns, source_type)
+                self._results.move_to_end(path)
+                while len(self._results) > self.max_entries:
+                    self._results.popitem(last=False)
+            batch.append((path, source_type, mtime_ns))
@@ -0,0 +1,221 @@
+# app_manager_utils/thumbnail_cache.py
+import os
+import io
+import json
+import hashlib
+import threading
+import collections
+
+# PIL is passed in as an argument (same convention as file_operations.py)
+# from PIL import Image
+
+
+TMP_FILE_EXT = ".tmp"
+THUMBNAIL_FILE_EXT = ".thumb"
+METADATA_FILE_EXT = ".meta" # Small JSON sidecar, e.g. video duration/resolution or a remembered failure
+CACHE_FILE_EXTS = (THUMBNAIL_FILE_EXT, METADATA_FILE_EXT)
+
+
+def encode_thumbnail(pil_image):
+    """
+    Encodes a small PIL thumbnail into bytes for on-disk storage.
+    JPEG for opaque images (small and fast to decode), PNG when there is an alpha channel.
+    """
+    buffer = io.BytesIO()
+    if pil_image.mode == 'RGBA':
+        pil_image.save(buffer, format='PNG', optimize=False)
+    else:
+        if pil_image.mode != 'RGB': pil_image = pil_image.convert('RGB')
+        pil_image.save(buffer, format='JPEG', quality=88)
+    return buffer.getvalue()
+
+
+def decode_thumbnail(encoded_bytes, PillowImage):
+    img = PillowImage.open(io.BytesIO(encoded_bytes))
+    img.load()
+    return img
+
+
+class ThumbnailDiskCache:
+    """
+    Persistent store of encoded grid thumbnails under CONFIG_DIR.
+
+    Entries are keyed by (absolute path, file size, mtime_ns, thumbnail size), so an edited
+    or replaced file simply misses the cache. Each entry is one small file named after the
+    hash of its key, plus an optional JSON metadata sidecar. Recency is kept in memory and
+    mirrored to the entry's mtime on every hit, which lets the LRU order survive restarts
+    without a separate index file. That index is rebuilt from the directory in a background
+    thread (which also removes temp files of interrupted writes); until it is done, lookups
+    check the disk directly and nothing is evicted.
+    """
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict() # entry file name -> size in bytes, oldest first
+        self._total_bytes = 0
+        self._is_indexed = False
+        self._dropped_while_indexing = set()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        threading.Thread(target=self._load_existing_entries, daemon=True).start()
+
+    def _load_existing_entries(self):
+        found = []
+        own_tmp_marker = f".{os.getpid()}." # Temp files of this process may still be being written
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(TMP_FILE_EXT) and own_tmp_marker not in entry.name:
+                        try: os.remove(entry.path) # Left behind by an interrupted write
+                        except OSError: pass
+                        continue
+                    if not entry.name.endswith(CACHE_FILE_EXTS): continue
+                    try:
+                        st = entry.stat()
+                    except OSError: continue
+                    found.append((st.st_mtime_ns, entry.name, st.st_size))
+        except OSError as e:
+            print(f"Could not read thumbnail cache directory {self.cache_dir}: {e}")
+        found.sort()
+        with self._lock:
+            # Entries read or written during the scan are the most recent ones
+            entries = collections.OrderedDict()
+            for _, entry_name, size in found:
+                if entry_name in self._entries or entry_name in self._dropped_while_indexing: continue
+                entries[entry_name] = size
+            entries.update(self._entries)
+            self._entries = entries
+            self._total_bytes = sum(entries.values())
+            self._dropped_while_indexing.clear()
+            self._is_indexed = True
+            self._evict_if_needed()
+
+    @staticmethod
+    def make_key(file_path, thumbnail_size):
+        """Returns the cache key for file_path, or None if the file cannot be stat'ed."""
+        abs_path = os.path.abspath(file_path)
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            return None
+        raw_key = f"{abs_path}|{st.st_size}|{st.st_mtime_ns}|{thumbnail_size[0]}x{thumbnail_size[1]}"
+        return hashlib.sha1(raw_key.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def _entry_path(self, entry_name):
+        return os.path.join(self.cache_dir, entry_name)
+
+    def _read_entry(self, entry_name):
+        with self._lock:
+            if entry_name in self._entries:
+                self._entries.move_to_end(entry_name)
+            elif self._is_indexed:
+                return None
+            # else: not indexed yet, the file may be on disk from an earlier session
+        entry_path = self._entry_path(entry_name)
+        try:
+            with open(entry_path, 'rb') as f:
+                data = f.read()
+            os.utime(entry_path, None) # Persist recency for the next session
+        except OSError:
+            with self._lock:
+                size = self._entries.pop(entry_name, None)
+                if size is not None: self._total_bytes -= size
+            return None
+        with self._lock:
+            if entry_name not in self._entries and entry_name not in self._dropped_while_indexing:
+                self._entries[entry_name] = len(data)
+                self._total_bytes += len(data)
+        return data
+
+    def _write_entry(self, entry_name, data):
+        entry_path = self._entry_path(entry_name)
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}{TMP_FILE_EXT}"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            print(f"Could not write thumbnail cache entry {entry_path}: {e}")
+            try: os.remove(tmp_path)
+            except OSError: pass
+            return
+        with self._lock:
+            old_size = self._entries.pop(entry_name, None)
+            if old_size is not None: self._total_bytes -= old_size
+            self._entries[entry_name] = len(data)
+            self._total_bytes += len(data)
+            self._dropped_while_indexing.discard(entry_name)
+            self._evict_if_needed()
+
+    def _drop_entry(self, entry_name):
+        with self._lock:
+            size = self._entries.pop(entry_name, None)
+            if size is not None: self._total_bytes -= size
+            if not self._is_indexed: self._dropped_while_indexing.add(entry_name)
+        try: os.remove(self._entry_path(entry_name))
+        except OSError: pass
+
+    def contains(self, key_hash):
+        """Cheap in-memory check for a cached thumbnail; does not touch recency."""
+        if key_hash is None: return False
+        with self._lock:
+            if key_hash + THUMBNAIL_FILE_EXT in self._entries: return True
+            if self._is_indexed: return False
+        return os.path.exists(self._entry_path(key_hash + THUMBNAIL_FILE_EXT))
+
+    def load_bytes(self, key_hash):
+        if key_hash is None: return None
+        return self._read_entry(key_hash + THUMBNAIL_FILE_EXT)
+
+    def load_image(self, key_hash, PillowImage):
+        data = self.load_bytes(key_hash)
+        if data is None: return None
+        try:
+            return decode_thumbnail(data, PillowImage)
+        except Exception as e:
+            print(f"Discarding unreadable cached thumbnail {key_hash}: {e}")
+            self.discard(key_hash)
+            return None
+
+    def store_bytes(self, key_hash, data):
+        if key_hash is None or not data: return
+        self._write_entry(key_hash + THUMBNAIL_FILE_EXT, data)
+
+    def load_metadata(self, key_hash):
+        if key_hash is None: return None
+        data = self._read_entry(key_hash + METADATA_FILE_EXT)
+        if data is None: return None
+        try:
+            return json.loads(data.decode('utf-8'))
+        except ValueError:
+            self._drop_entry(key_hash + METADATA_FILE_EXT)
+            return None
+
+    def store_metadata(self, key_hash, metadata):
+        if key_hash is None or not metadata: return
+        self._write_entry(key_hash + METADATA_FILE_EXT, json.dumps(metadata).encode('utf-8'))
+
+    def store_image(self, key_hash, pil_image):
+        if key_hash is None or pil_image is None: return
+        try:
+            self.store_bytes(key_hash, encode_thumbnail(pil_image))
+        except Exception as e:
+            print(f"Could not encode thumbnail for cache: {e}")
+
+    def discard(self, key_hash):
+        for ext in CACHE_FILE_EXTS:
+            self._drop_entry(key_hash + ext)
+
+    def _evict_if_needed(self):
+        # Caller holds self._lock. Until the index is built, the oldest entries are not known yet
+        if not self._is_indexed: return
+        while self._total_bytes > self.max_bytes and self._entries:
+            entry_name, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try: os.remove(self._entry_path(entry_name))
+            except OSError: pass
+
+    def stats(self):
+        with self._lock:
+            return len(self._entries), self._total_bytes
@@ -0,0 +1,391 @@
+# app_manager_utils/thumbnail_pool.py
+import os
+import time
+import heapq
+import itertools
+import collections
+import threading
+import multiprocessing
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+
+from constants import VIDEO_EXTENSIONS
+from .file_operations import generate_encoded_thumbnail, generate_encoded_video_thumbnail, downscale_encoded_thumbnail
+
+
+def _video_worker_main(conn):
+    """Entry point of an isolated video worker process: one (item_data, size) job at a time."""
+    while True:
+        try:
+            item_data, thumbnail_size = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            result = generate_encoded_video_thumbnail(item_data, thumbnail_size)
+        except Exception as e:
+            result = (None, True, {'error': str(e) or type(e).__name__})
+        try:
+            conn.send(result)
+        except (EOFError, OSError):
+            return
+
+
+class IsolatedVideoWorker:
+    """
+    One child process extracting video frames. A file that hangs the decoder (a corrupt MKV,
+    a stalled network read) costs at most timeout_s: the process is then killed and a fresh
+    one is started for the next job.
+    """
+
+    def __init__(self, timeout_s):
+        self.timeout_s = timeout_s
+        self._process = None
+        self._conn = None
+
+    def _ensure_started(self):
+        if self._process is not None and self._process.is_alive(): return
+        self.stop()
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=_video_worker_main, args=(child_conn,), daemon=True)
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+    def run(self, item_data, thumbnail_size):
+        """Returns (encoded_bytes or None, error_flag, metadata or None)."""
+        try:
+            self._ensure_started()
+            self._conn.send((item_data, thumbnail_size))
+            if self._conn.poll(self.timeout_s):
+                return self._conn.recv()
+        except (EOFError, OSError) as e:
+            print(f"Video worker died while processing {item_data['path']}: {e}")
+            self.stop()
+            return None, True, {'error': 'worker crashed'}
+        print(f"Video thumbnail timed out after {self.timeout_s}s: {item_data['path']}")
+        self.stop()
+        return None, True, {'error': f'timed out after {self.timeout_s}s', 'timed_out_at': time.time()}
+
+    def stop(self):
+        if self._conn is not None:
+            try: self._conn.close()
+            except OSError: pass
+            self._conn = None
+        if self._process is not None:
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1)
+            self._process = None
+
+
+class ThumbnailWorkerPool:
+    """
+    Long-lived pool of worker processes that turns thumbnail jobs into encoded thumbnail bytes.
+
+    Every job belongs to a group, the CancellationToken of the folder load that asked for it.
+    Jobs are queued here (not in the executor) and handed to the processes only as they free up,
+    so cancelling a group drops everything that has not started yet, and results of jobs that
+    were already running are not delivered once their token is cancelled. Pending jobs are
+    served lowest priority value first; the UI re-ranks them with reprioritize() when the viewport
+    moves, and a priority of None drops a job. A dispatcher thread serves disk cache hits
+    directly and stores freshly generated thumbnails in the cache.
+    Videos go to a separate lane of IsolatedVideoWorker processes with a per-file timeout; their
+    duration/resolution (or the failure) is kept as cache metadata, so a video that fails to
+    decode is tried once; one that only timed out is tried again after video_timeout_retry_s.
+    When a worker process dies, every job running in the pool fails with it; those jobs are
+    retried one at a time on a new pool, so only the file that crashes a worker on its own is
+    reported as failed.
+    On a cache miss for one of thumbnail_sizes, a cached thumbnail of a larger size is shrunk
+    in a worker instead of decoding the original file. load_video_preview() gives the side
+    panel the same isolation through a worker of its own.
+    result_callback(group, item_data, encoded_bytes_or_None, error_flag) is called from
+    background threads; it must not touch Tk widgets.
+    """
+
+    def __init__(self, disk_cache, result_callback, worker_count=0, video_worker_count=1, video_timeout_s=10,
+                 thumbnail_sizes=(), video_timeout_retry_s=24 * 60 * 60):
+        self.disk_cache = disk_cache
+        self.video_timeout_retry_s = video_timeout_retry_s
+        self.thumbnail_sizes = sorted(thumbnail_sizes)
+        self.result_callback = result_callback
+        self.worker_count = worker_count if worker_count > 0 else max(1, (os.cpu_count() or 2) - 1)
+        self.max_in_flight = self.worker_count * 2
+
+        self._executor = None
+        # Per lane heap of (priority, sequence_no, group, item_data, thumbnail_size)
+        self._pending = {'image': [], 'video': []}
+        self._suspects = collections.deque() # (group, item_data, thumbnail_size) running when a worker died
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._is_shut_down = False
+        self._condition = threading.Condition()
+
+        self._dispatcher_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatcher_thread.start()
+        self._video_workers = [IsolatedVideoWorker(video_timeout_s) for _ in range(max(1, video_worker_count))]
+        for video_worker in self._video_workers:
+            threading.Thread(target=self._video_dispatch_loop, args=(video_worker,), daemon=True).start()
+        self._preview_video_worker = IsolatedVideoWorker(video_timeout_s)
+        self._preview_video_lock = threading.Lock()
+
+    @staticmethod
+    def _lane_for(item_data):
+        return 'video' if item_data['path'].lower().endswith(VIDEO_EXTENSIONS) else 'image'
+
+    def submit(self, group, items, thumbnail_size, priority_fn=None):
+        with self._condition:
+            for item_data in items:
+                priority = priority_fn(item_data) if priority_fn else 0
+                if priority is None: continue
+                heapq.heappush(self._pending[self._lane_for(item_data)],
+                               (priority, next(self._sequence), group, item_data, thumbnail_size))
+            self._condition.notify_all()
+
+    def reprioritize(self, priority_fn, only_group=None):
+        """Re-ranks pending jobs (of only_group, if given) with priority_fn(item_data); None drops the job."""
+        with self._condition:
+            for lane, jobs in self._pending.items():
+                reranked = []
+                for job in jobs:
+                    priority, sequence_no, group, item_data, thumbnail_size = job
+                    if only_group is None or group is only_group:
+                        priority = priority_fn(item_data)
+                        if priority is None: continue
+                    reranked.append((priority, sequence_no, group, item_data, thumbnail_size))
+                heapq.heapify(reranked)
+                self._pending[lane] = reranked
+
+    def cancel_group(self, group):
+        group.cancel()
+        with self._condition:
+            for lane, jobs in self._pending.items():
+                remaining = [job for job in jobs if job[2] is not group]
+                heapq.heapify(remaining)
+                self._pending[lane] = remaining
+            self._suspects = collections.deque(job for job in self._suspects if job[0] is not group)
+
+    def pending_count(self):
+        with self._condition:
+            return sum(len(jobs) for jobs in self._pending.values()) + len(self._suspects) + self._in_flight
+
+    def shutdown(self):
+        with self._condition:
+            self._is_shut_down = True
+            for jobs in self._pending.values(): jobs.clear()
+            self._suspects.clear()
+            self._condition.notify_all()
+            executor = self._executor # Kept, so a late submit fails on it instead of starting a new pool
+        if executor:
+            executor.shutdown(wait=False)
+        for video_worker in self._video_workers:
+            video_worker.stop()
+        self._preview_video_worker.stop()
+
+    def load_video_preview(self, item_data, preview_size):
+        """
+        Frame of a video for the side-panel preview; blocks the calling (preview loader) thread.
+        An earlier preview or a cached grid thumbnail at least as large is reused; otherwise the
+        frame is extracted by the preview's own IsolatedVideoWorker, so a file that hangs the
+        decoder costs one timeout instead of the loader thread. A video that failed to decode
+        before is not retried. Returns (encoded_bytes or None, error_flag, metadata or None).
+        """
+        preview_key = self.disk_cache.make_key(item_data['path'], preview_size)
+        if preview_key is None: return None, True, None
+        large_enough_sizes = [size for size in self.thumbnail_sizes[::-1]
+                              if size != preview_size and size[0] >= preview_size[0] and size[1] >= preview_size[1]]
+        for size in [preview_size] + large_enough_sizes:
+            cache_key = preview_key if size == preview_size else self.disk_cache.make_key(item_data['path'], size)
+            cached_bytes = self.disk_cache.load_bytes(cache_key)
+            if cached_bytes is not None:
+                return cached_bytes, False, self.disk_cache.load_metadata(cache_key)
+            cached_metadata = self.disk_cache.load_metadata(cache_key)
+            if self._is_lasting_failure(cached_metadata):
+                return None, True, cached_metadata
+        with self._preview_video_lock:
+            encoded_bytes, error_flag, metadata = self._preview_video_worker.run(item_data, preview_size)
+        if encoded_bytes and not error_flag:
+            self.disk_cache.store_bytes(preview_key, encoded_bytes)
+        self.disk_cache.store_metadata(preview_key, metadata)
+        return encoded_bytes, error_flag, metadata
+
+    def _is_lasting_failure(self, metadata):
+        """True for cached error metadata that should not be retried yet (timeouts expire, decode failures do not)."""
+        if not metadata or not metadata.get('error'): return False
+        timed_out_at = metadata.get('timed_out_at')
+        return timed_out_at is None or time.time() - timed_out_at < self.video_timeout_retry_s
+
+    def _load_larger_cached(self, item_data, thumbnail_size):
+        """Returns (cache key, encoded bytes) of the smallest cached size above thumbnail_size, or (None, None)."""
+        for larger_size in self.thumbnail_sizes:
+            if larger_size[0] <= thumbnail_size[0] and larger_size[1] <= thumbnail_size[1]: continue
+            larger_key = self.disk_cache.make_key(item_data['path'], larger_size)
+            if not self.disk_cache.contains(larger_key): continue
+            larger_bytes = self.disk_cache.load_bytes(larger_key)
+            if larger_bytes is not None:
+                return larger_key, larger_bytes
+        return None, None
+
+    def _get_executor(self):
+        # The image and video dispatchers both submit here; the lock keeps them on one pool
+        with self._condition:
+            if self._executor is None:
+                self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.worker_count)
+            return self._executor
+
+    def _discard_broken_executor(self, executor):
+        """Shuts a broken process pool down (its manager thread and processes too); the next submit starts a new one."""
+        with self._condition:
+            if self._executor is not executor: return # Already replaced after an earlier failure
+            self._executor = None
+        try:
+            executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError: # cancel_futures needs Python 3.9
+            executor.shutdown(wait=False)
+        except Exception as e:
+            print(f"Error shutting down the broken thumbnail worker pool: {e}")
+
+    def _can_dispatch_image_job(self):
+        # Suspects run alone, so a second crash can only come from the suspect itself
+        if self._suspects: return self._in_flight == 0
+        return self._pending['image'] and self._in_flight < self.max_in_flight
+
+    def _dispatch_loop(self):
+        while True:
+            with self._condition:
+                while not self._is_shut_down and not self._can_dispatch_image_job():
+                    self._condition.wait()
+                if self._is_shut_down: return
+                if self._suspects:
+                    job = None
+                    group, item_data, thumbnail_size = self._suspects.popleft()
+                else:
+                    job = heapq.heappop(self._pending['image'])
+                    _, _, group, item_data, thumbnail_size = job
+            if group.is_set(): continue
+
+            cache_key = self.disk_cache.make_key(item_data['path'], thumbnail_size)
+            cached_bytes = self.disk_cache.load_bytes(cache_key)
+            if cached_bytes is not None:
+                self._deliver(group, item_data, cached_bytes, False)
+                continue
+
+            _, larger_bytes = self._load_larger_cached(item_data, thumbnail_size)
+            with self._condition:
+                self._in_flight += 1
+            executor = self._get_executor()
+            try:
+                if larger_bytes is not None:
+                    future = executor.submit(downscale_encoded_thumbnail, larger_bytes, thumbnail_size)
+                else:
+                    future = executor.submit(generate_encoded_thumbnail, item_data, thumbnail_size)
+            except (BrokenProcessPool, RuntimeError) as e:
+                print(f"Thumbnail worker pool unavailable, restarting it: {e}")
+                self._discard_broken_executor(executor)
+                with self._condition:
+                    self._in_flight -= 1
+                    if isinstance(e, BrokenProcessPool): # The job never ran: put it back for the new pool
+                        if job is None: self._suspects.appendleft((group, item_data, thumbnail_size))
+                        else: heapq.heappush(self._pending['image'], job)
+                if not isinstance(e, BrokenProcessPool): self._deliver(group, item_data, None, True)
+                continue
+            future.add_done_callback(
+                lambda f, g=group, d=item_data, s=thumbnail_size, k=cache_key, e=executor, alone=job is None:
+                    self._on_job_done(f, g, d, s, k, e, alone))
+
+    def _video_dispatch_loop(self, video_worker):
+        while True:
+            with self._condition:
+                while not self._is_shut_down and not self._pending['video']:
+                    self._condition.wait()
+                if self._is_shut_down: return
+                _, _, group, item_data, thumbnail_size = heapq.heappop(self._pending['video'])
+            if group.is_set(): continue
+
+            cache_key = self.disk_cache.make_key(item_data['path'], thumbnail_size)
+            cached_bytes = self.disk_cache.load_bytes(cache_key)
+            if cached_bytes is not None:
+                self._deliver(group, item_data, cached_bytes, False)
+                continue
+            cached_metadata = self.disk_cache.load_metadata(cache_key)
+            if self._is_lasting_failure(cached_metadata):
+                self._deliver(group, item_data, None, True) # Failed (or recently timed out) before: don't retry
+                continue
+            larger_key, larger_bytes = self._load_larger_cached(item_data, thumbnail_size)
+            if larger_bytes is not None and \
+               self._submit_video_downscale(group, item_data, thumbnail_size, cache_key, larger_key, larger_bytes):
+                continue
+
+            encoded_bytes, error_flag, metadata = video_worker.run(item_data, thumbnail_size)
+            if encoded_bytes and not error_flag:
+                self.disk_cache.store_bytes(cache_key, encoded_bytes)
+            self.disk_cache.store_metadata(cache_key, metadata)
+            self._deliver(group, item_data, encoded_bytes, error_flag)
+
+    def _submit_video_downscale(self, group, item_data, thumbnail_size, cache_key, larger_key, larger_bytes):
+        """Shrinks a cached larger video thumbnail in the process pool, like an image job; False if the pool is unavailable."""
+        with self._condition:
+            self._in_flight += 1
+        executor = self._get_executor()
+        try:
+            future = executor.submit(downscale_encoded_thumbnail, larger_bytes, thumbnail_size)
+        except (BrokenProcessPool, RuntimeError) as e:
+            print(f"Thumbnail worker pool unavailable for downscaling: {e}")
+            self._discard_broken_executor(executor)
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+            return False
+        future.add_done_callback(
+            lambda f, g=group, d=item_data, s=thumbnail_size, k=cache_key, lk=larger_key, e=executor:
+                self._on_video_downscale_done(f, g, d, s, k, lk, e))
+        return True
+
+    def _on_video_downscale_done(self, future, group, item_data, thumbnail_size, cache_key, larger_key, executor):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+        encoded_bytes, error_flag = None, True
+        try:
+            encoded_bytes, error_flag = future.result()
+        except BrokenProcessPool:
+            print(f"Thumbnail worker crashed while downscaling {item_data['path']}")
+            self._discard_broken_executor(executor)
+        except Exception as e:
+            print(f"Thumbnail downscale error for {item_data['path']}: {e}")
+        if encoded_bytes and not error_flag:
+            self.disk_cache.store_bytes(cache_key, encoded_bytes)
+            self.disk_cache.store_metadata(cache_key, self.disk_cache.load_metadata(larger_key))
+            self._deliver(group, item_data, encoded_bytes, error_flag)
+            return
+        # Drop the unusable larger thumbnail and queue the job again: the video worker extracts it this time
+        self.disk_cache.discard(larger_key)
+        if not group.is_set():
+            self.submit(group, [item_data], thumbnail_size)
+
+    def _on_job_done(self, future, group, item_data, thumbnail_size, cache_key, executor, ran_alone):
+        encoded_bytes, error_flag, is_crash = None, True, False
+        try:
+            encoded_bytes, error_flag = future.result()
+        except BrokenProcessPool:
+            is_crash = True
+            self._discard_broken_executor(executor)
+        except Exception as e:
+            print(f"Thumbnail worker error for {item_data['path']}: {e}")
+        with self._condition:
+            self._in_flight -= 1
+            if is_crash and not ran_alone and not group.is_set():
+                self._suspects.append((group, item_data, thumbnail_size))
+            self._condition.notify_all()
+        if is_crash:
+            if not ran_alone: return # Retried alone; it may not be the job that killed the worker
+            print(f"Thumbnail worker crashed while processing {item_data['path']}")
+        if encoded_bytes and not error_flag:
+            self.disk_cache.store_bytes(cache_key, encoded_bytes)
+        self._deliver(group, item_data, encoded_bytes, error_flag)
+
+    def _deliver(self, group, item_data, encoded_bytes, error_flag):
+        if group.is_set() or self._is_shut_down: return
+        try:
+            self.result_callback(group, item_data, encoded_bytes, error_flag)
+        except Exception as e:
+            print(f"Error delivering thumbnail for {item_data['path']}: {e}")
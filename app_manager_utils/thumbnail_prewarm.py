@@ -0,0 +1,54 @@
+# app_manager_utils/thumbnail_prewarm.py
+import os
+import time
+import collections
+
+from constants import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, PREWARM_IDLE_POLL_S
+
+PREWARM_PRIORITY = float('inf') # Behind every foreground job in the pool's queue
+
+
+def _iter_media_breadth_first(root_dir, skip_dirs, cancel_token):
+    """Yields {'path', 'name', 'type'} items for media files, shallow folders first."""
+    folders = collections.deque([root_dir])
+    while folders and not cancel_token.is_set():
+        folder = folders.popleft()
+        try:
+            with os.scandir(folder) as it:
+                entries = sorted(it, key=lambda e: e.name.lower())
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith('.'): continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if os.path.abspath(entry.path) not in skip_dirs: folders.append(entry.path)
+                    continue
+                if not entry.is_file(): continue
+            except OSError:
+                continue
+            if entry.name.lower().endswith(IMAGE_EXTENSIONS + VIDEO_EXTENSIONS):
+                yield {'path': entry.path, 'name': entry.name, 'type': 'file'}
+
+
+def prewarm_thumbnails_core(root_dir, thumbnail_pool, disk_cache, thumbnail_size, skip_dirs,
+                            cancel_token, is_foreground_busy):
+    """
+    Walks root_dir and feeds every media file without a cached thumbnail to thumbnail_pool,
+    under cancel_token as the job group and at the lowest priority. It only tops the pool up
+    to one queued job per worker and waits while is_foreground_busy() (scrolling, a folder
+    still loading), so foreground thumbnails never queue behind it.
+    Runs in its own thread. Returns (files seen, files submitted).
+    """
+    skip_dirs = {os.path.abspath(d) for d in skip_dirs}
+    seen_count = submitted_count = 0
+    for item_data in _iter_media_breadth_first(root_dir, skip_dirs, cancel_token):
+        seen_count += 1
+        if disk_cache.contains(disk_cache.make_key(item_data['path'], thumbnail_size)): continue
+        while not cancel_token.is_set() and \
+              (is_foreground_busy() or thumbnail_pool.pending_count() >= thumbnail_pool.worker_count):
+            time.sleep(PREWARM_IDLE_POLL_S)
+        if cancel_token.is_set(): break
+        thumbnail_pool.submit(cancel_token, [item_data], thumbnail_size, lambda _item: PREWARM_PRIORITY)
+        submitted_count += 1
+    return seen_count, submitted_count
@@ -6,7 +6,7 @@ import sys
 import os
 
 from constants import (
-    PICSNEST_ACCENT_BLUE, PREVIEW_CONTAINER_SIZE, GRID_COLUMNS,
+    PICSNEST_ACCENT_BLUE, PREVIEW_CONTAINER_SIZE, GRID_ZOOM_SIZES,
     PICSNEST_BG_DARK, PICSNEST_BG_MEDIUM, PICSNEST_BG_LIGHT,
     PICSNEST_TEXT_LIGHT, PICSNEST_ACCENT_GREEN, PICSNEST_ACCENT_YELLOW, PICSNEST_ACCENT_RED,
     PICSNEST_BORDER_LIGHT, PICSNEST_FOLDER_REPRESENTATION_BG, PICSNEST_ITEM_PLACEHOLDER_BG,
@@ -38,6 +38,7 @@ def create_menu(app_instance):
     menubar.add_cascade(label="Edit", menu=app_instance.edit_menu)
     app_instance.edit_menu.add_command(label="Undo", command=app_instance._undo_last_action, state=tk.DISABLED)
     app_instance.edit_menu.add_command(label="Rename Selected (F2)", command=app_instance.on_f2_key_press)
+    app_instance.edit_menu.add_command(label="Select All (Ctrl+A)", command=app_instance.select_all_items)
 
     app_instance.view_menu = tk.Menu(menubar, **menu_options)
     menubar.add_cascade(label="View", menu=app_instance.view_menu)
@@ -46,6 +47,15 @@ def create_menu(app_instance):
     app_instance.view_menu.add_separator(background=PICSNEST_BORDER_LIGHT)
     app_instance.view_menu.add_checkbutton(label="Show Only Similar Images", variable=app_instance.show_only_similar_var, command=app_instance.handle_show_similar_toggle)
     app_instance.view_menu.add_checkbutton(label="Show Only Screenshots/Downloads", variable=app_instance.show_only_screenshots_downloads_var, command=app_instance.apply_all_filters_and_refresh)
+    app_instance.view_menu.add_separator(background=PICSNEST_BORDER_LIGHT)
+    zoom_menu = tk.Menu(app_instance.view_menu, **menu_options)
+    app_instance.view_menu.add_cascade(label="Thumbnail Size", menu=zoom_menu)
+    for zoom_size in GRID_ZOOM_SIZES:
+        zoom_menu.add_radiobutton(label=f"{zoom_size} px", value=zoom_size, variable=app_instance.thumbnail_size_var,
+                                  command=app_instance.set_grid_thumbnail_size)
+    zoom_menu.add_separator(background=PICSNEST_BORDER_LIGHT)
+    zoom_menu.add_command(label="Zoom In (Ctrl++)", command=lambda: app_instance.step_grid_zoom(1))
+    zoom_menu.add_command(label="Zoom Out (Ctrl+-)", command=lambda: app_instance.step_grid_zoom(-1))
 
 
     tools_menu = tk.Menu(menubar, **menu_options)
@@ -62,6 +72,9 @@ def create_menu(app_instance):
     settings_menu = tk.Menu(menubar, **menu_options)
     menubar.add_cascade(label="Settings", menu=settings_menu)
     settings_menu.add_command(label="Change Accent Color...", command=app_instance.change_accent_color_action)
+    settings_menu.add_checkbutton(label="Pre-generate Thumbnails in Background", variable=app_instance.prewarm_thumbnails_var, command=app_instance.toggle_thumbnail_prewarm)
+    settings_menu.add_checkbutton(label="Show Folder Cover Mosaics", variable=app_instance.folder_mosaics_var, command=app_instance.toggle_folder_mosaics)
+    settings_menu.add_checkbutton(label="Draw Grid Tiles on Canvas", variable=app_instance.canvas_tile_renderer_var, command=app_instance.toggle_canvas_tile_renderer)
 
 
 def create_top_bar(app_instance):
@@ -130,23 +143,24 @@ def create_main_content_area(app_instance):
     app_instance.canvas_content_frame.grid_rowconfigure(0, weight=1)
     app_instance.canvas_content_frame.grid_columnconfigure(0, weight=1)
 
+    # Item tiles are recycled canvas windows placed by app_instance.grid_layout (see _bind_tile)
     app_instance.canvas = tk.Canvas(app_instance.canvas_content_frame, borderwidth=0, background=PICSNEST_BG_DARK, highlightthickness=0)
-    app_instance.item_frame = ttk.Frame(app_instance.canvas, padding="10", style="PicsNest.Dark.TFrame")
-    app_instance.canvas.create_window((0, 0), window=app_instance.item_frame, anchor="nw", tags="self.item_frame")
 
     app_instance.canvas_vsb = ttk.Scrollbar(app_instance.canvas_content_frame, orient="vertical", command=app_instance.canvas.yview, style="PicsNest.Vertical.TScrollbar")
     app_instance.canvas_hsb = ttk.Scrollbar(app_instance.canvas_content_frame, orient="horizontal", command=app_instance.canvas.xview, style="PicsNest.Horizontal.TScrollbar")
-    app_instance.canvas.configure(yscrollcommand=app_instance.canvas_vsb.set, xscrollcommand=app_instance.canvas_hsb.set)
+    app_instance.canvas.configure(yscrollcommand=app_instance._on_canvas_yscroll, xscrollcommand=app_instance.canvas_hsb.set)
 
     app_instance.canvas.grid(row=0, column=0, sticky="nsew")
     app_instance.canvas_vsb.grid(row=0, column=1, sticky="ns")
     app_instance.canvas_hsb.grid(row=1, column=0, sticky="ew")
 
-    app_instance.item_frame.bind("<Configure>", app_instance.on_frame_configure)
+    app_instance.canvas.bind("<Configure>", app_instance.on_canvas_configure)
 
     app_instance.canvas.bind("<ButtonPress-1>", app_instance._on_canvas_press_for_rubber_band)
     app_instance.canvas.bind("<B1-Motion>", app_instance._on_canvas_motion_for_rubber_band)
     app_instance.canvas.bind("<ButtonRelease-1>", app_instance._on_canvas_release_for_rubber_band)
+    app_instance.canvas.bind("<Double-Button-1>", app_instance._on_canvas_double_click)
+    app_instance.canvas.bind("<Button-3>", app_instance._on_canvas_right_click)
 
     app_instance.canvas_content_frame.grid_remove()
 
@@ -0,0 +1,83 @@
+# benchmarks/thumbnail_decode_bench.py
+"""
+Per-thumbnail latency of the grid thumbnail decode, before and after reduced-resolution decoding.
+
+Usage:
+    python benchmarks/thumbnail_decode_bench.py <folder_with_large_jpegs>
+    python benchmarks/thumbnail_decode_bench.py --generate 10 <empty_folder>   # synthesize 24 MP JPEGs first
+"""
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, UnidentifiedImageError
+
+from constants import GRID_THUMBNAIL_SIZE, IMAGE_EXTENSIONS
+from app_manager_utils import file_operations
+
+
+def full_decode_thumbnail(path, size):
+    """The original path: full-resolution decode, rotate, then a single LANCZOS thumbnail."""
+    img = Image.open(path)
+    orientation = img.getexif().get(274)
+    if orientation == 3: img = img.rotate(180, expand=True)
+    elif orientation == 6: img = img.rotate(-90, expand=True)
+    elif orientation == 8: img = img.rotate(90, expand=True)
+    img.thumbnail(size, Image.Resampling.LANCZOS)
+    if img.mode not in ('RGB', 'RGBA'): img = img.convert('RGB')
+    return img
+
+
+def reduced_decode_thumbnail(path, size):
+    item_data = {'path': path, 'name': os.path.basename(path), 'type': 'file'}
+    img, _ = file_operations.generate_single_thumbnail(item_data, size, Image, UnidentifiedImageError, None)
+    return img
+
+
+def generate_sample_jpegs(folder, count, size=(6000, 4000)):
+    os.makedirs(folder, exist_ok=True)
+    for i in range(count):
+        img = Image.effect_mandelbrot(size, (-2.0 + i * 0.01, -1.0, 1.0, 1.0), 100).convert('RGB')
+        exif = Image.Exif()
+        exif[274] = 6 if i % 2 else 1 # Mix of rotated and upright shots
+        img.save(os.path.join(folder, f"bench_{i:03d}.jpg"), quality=92, exif=exif)
+
+
+def time_per_file(fn, paths, size):
+    timings = []
+    for path in paths:
+        start = time.perf_counter()
+        fn(path, size)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return timings
+
+
+def main(argv):
+    if len(argv) >= 3 and argv[0] == '--generate':
+        generate_sample_jpegs(argv[2], int(argv[1]))
+        argv = argv[2:]
+    if not argv:
+        print(__doc__)
+        return 1
+    folder = argv[0]
+    paths = sorted(
+        os.path.join(folder, name) for name in os.listdir(folder)
+        if name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+    if not paths:
+        print(f"No images found in {folder}")
+        return 1
+
+    print(f"{len(paths)} images, target {GRID_THUMBNAIL_SIZE[0]}x{GRID_THUMBNAIL_SIZE[1]}")
+    for label, fn in (("full decode", full_decode_thumbnail), ("reduced decode", reduced_decode_thumbnail)):
+        timings = time_per_file(fn, paths, GRID_THUMBNAIL_SIZE)
+        print(f"{label:>15}: mean {statistics.mean(timings):7.1f} ms  "
+              f"median {statistics.median(timings):7.1f} ms  max {max(timings):7.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -7,14 +7,48 @@ IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp')
 VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv')
 
 # --- UI Sizes ---
-GRID_THUMBNAIL_SIZE = (120, 120)
+GRID_THUMBNAIL_SIZE = (120, 120) # Default grid zoom level
+GRID_ZOOM_SIZES = (96, 120, 160, 256) # Selectable grid thumbnail sizes (square), each cached separately on disk
 PREVIEW_THUMBNAIL_SIZE = (350, 350)
 PREVIEW_CONTAINER_SIZE = (350, 350)
-GRID_COLUMNS = 5
+GRID_TILE_EXTRA_WIDTH = 60 # Minimum cell width beyond the thumbnail; as many columns as fit the canvas width are shown
+GRID_TILE_EXTRA_HEIGHT = 64 # Row pitch beyond the thumbnail (name area plus tile padding), in pixels
+GRID_TILE_PADDING = 7 # Gap around each tile inside its grid cell
+GRID_FRAME_MARGIN = 10 # Space between the grid and the canvas edges
 
 # --- Performance & Limits ---
-LAZY_LOAD_BATCH_SIZE = 20
+LAZY_LOAD_BATCH_SIZE = 20 # Tiles bound per idle step until the cost of binding a tile has been measured
+LAZY_LOAD_FRAME_BUDGET_MS = 8 # Idle tile binding is sized from the measured per-tile cost to take about this long per step
+VIRTUAL_GRID_MARGIN_ROWS = 2 # Minimum rows above and below the viewport that keep bound tiles (at least half a screen is kept)
 UNDO_STACK_MAX_SIZE = 10
+THUMBNAIL_WORKER_PROCESSES = 0 # Thumbnail worker processes; 0 = one per CPU core, minus one for the UI
+VIDEO_THUMBNAIL_WORKERS = 1 # Isolated processes extracting video frames (each killed and restarted on timeout)
+VIDEO_THUMBNAIL_TIMEOUT_S = 10 # Per-file limit before a video is marked as errored
+VIDEO_TIMEOUT_RETRY_AFTER_S = 24 * 60 * 60 # A timed-out video is tried again after this long (decode failures are final)
+VIDEO_THUMBNAIL_SEEK_LIMIT_S = 2.0 # Video thumbnails come from 10% into the clip, but no later than this
+THUMBNAIL_CACHE_MAX_BYTES = 512 * 1024 * 1024 # On-disk grid thumbnail cache, least recently used entries evicted first
+THUMBNAIL_READ_AHEAD_ROWS = 3 # Rows past the viewport (in the scroll direction) thumbnailed right after the visible ones
+THUMBNAIL_REPRIORITIZE_DELAY_MS = 50 # Debounce for re-ranking thumbnail jobs while scrolling
+THUMBNAIL_DRAIN_BUDGET_MS = 8 # Max time per frame spent applying finished thumbnails to the grid
+TILE_IMAGE_CACHE_MAX_COUNT = 600 # Decoded grid thumbnails (Tk PhotoImages) kept alive; far off-screen ones are released
+TILE_IMAGE_CACHE_MAX_BYTES = 48 * 1024 * 1024 # Same budget in (estimated) bytes of Tk image memory
+TILE_IMAGE_KEEP_ROWS = 6 # Rows above and below the viewport whose thumbnails are never released
+PREWARM_IDLE_POLL_S = 0.25 # Background thumbnail pre-warming re-checks this often whether the UI is idle again
+PREWARM_IDLE_AFTER_SCROLL_S = 1.0 # Pre-warming stays paused this long after the last scroll
+PREVIEW_PREFETCH_COUNT = 3 # Side-panel previews decoded ahead of the keyboard cursor, in the direction of travel
+PREVIEW_CACHE_MAX_ITEMS = 16 # Decoded side-panel previews kept for going back and forth
+FOLDER_LISTING_FIRST_CHUNK = 256 # Entries in the first sorted run from the folder lister (about a screenful or two)
+FOLDER_LISTING_MAX_CHUNK = 8192 # Later runs double up to this, keeping the number of merges on the Tk thread small
+FOLDER_LISTING_CACHE_MAX_FOLDERS = 32 # Recently left folders whose listing is reused when going back/up (if unchanged)
+FOLDER_LISTING_CACHE_MAX_ITEMS = 200000 # Same cache bounded by the total number of entries
+FOLDER_SNAPSHOT_MAX_FOLDERS = 2 # Of those, the newest few also keep their loaded thumbnails for an instant return
+FOLDER_WATCH_DEBOUNCE_S = 0.3 # Changes in the current folder are applied this long after the last one...
+FOLDER_WATCH_MAX_DELAY_S = 2.0 # ...or at least this often while a copy/sync keeps going
+FOLDER_WATCH_POLL_INTERVAL_S = 2.0 # Without watchdog, the current folder's mtime is checked this often
+SOURCE_TYPE_CACHE_MAX_ITEMS = 50000 # Screenshot/download classifications kept per (path, mtime); each is a few bytes
+SOURCE_TYPE_BATCH_SIZE = 64 # Classifications handed to the Tk thread at once while the filtered view streams in
+FOLDER_ICON_CACHE_MAX_ITEMS = 256 # Resized custom folder icons (Tk images) shared by tiles and the preview
+PERF_LOGGING_ENABLED = False # Print timing/telemetry lines from the grid and thumbnail pipeline
 
 # --- PicsNest Theme Colors ---
 PICSNEST_BG_DARK = "#2C3E50"
@@ -56,7 +90,10 @@ IMAGE_VIEWER_BG = PICSNEST_VIEWER_BG
 # --- Configuration Paths & Names ---
 THEME_SETTINGS_FILENAME = "theme_settings.json"
 FOLDER_THUMB_DB_FILENAME = "folder_thumbs.json"
+FOLDER_MOSAIC_DB_FILENAME = "folder_mosaics.json" # Auto-generated folder covers: folder path -> mosaic file and folder mtime
+FOLDER_MOSAIC_DIR_NAME = ".folder_mosaics"
 CUSTOM_FOLDER_ICONS_DIR_NAME = ".custom_folder_icons" # New directory for storing custom icons
+THUMBNAIL_CACHE_DIR_NAME = ".thumbnail_cache" # Persistent encoded grid thumbnails
 TRASH_DIR_NAME = ".app_trash_v3" # Changed to v3 to avoid conflict if user had v2
 
 # --- Trash Settings ---
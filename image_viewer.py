@@ -220,9 +220,7 @@ class ImageViewerWindow(tk.Toplevel):
         
         if self.main_app and self.main_app.root.winfo_exists():
             if self.items_deleted_from_viewer: 
-                current_folder = self.main_app.current_folder.get()
-                if isinstance(current_folder, str) and os.path.isdir(current_folder):
-                     self.main_app.load_items(current_folder) 
-            else:
-                self.main_app.update_ui_state() 
+                # Deleted items already left the grid one by one; only the side panel is stale
+                self.main_app.update_preview_and_info()
+            self.main_app.update_ui_state() 
         self.destroy()
\ No newline at end of file
@@ -3,6 +3,7 @@
 import tkinter as tk
 from app_manager import PhotoVideoManagerApp # Assuming app_manager.py is in the same directory
 import sys
+import multiprocessing
 from tkinter import messagebox
 
 # Critical dependency check (Pillow)
@@ -21,6 +22,7 @@ except ImportError:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # Thumbnail worker processes in the frozen (PyInstaller) build
     root = tk.Tk()
     app = PhotoVideoManagerApp(root)
     root.mainloop()
\ No newline at end of file
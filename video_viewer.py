@@ -382,11 +382,9 @@ class VideoViewerWindow(tk.Toplevel):
         # preventing direct calls during Toplevel destruction.
         if hasattr(self, 'main_app') and self.main_app and self.main_app.root.winfo_exists():
             if self.items_deleted_from_viewer:
-                current_f = self.main_app.current_folder.get()
-                if isinstance(current_f, str) and os.path.isdir(current_f):
-                    self.main_app.root.after(0, lambda cf=current_f: self.main_app.load_items(cf))
-            else:
-                self.main_app.root.after(0, self.main_app.update_ui_state)
+                # Deleted items already left the grid one by one; only the side panel is stale
+                self.main_app.root.after(0, self.main_app.update_preview_and_info)
+            self.main_app.root.after(0, self.main_app.update_ui_state)
 
         if self.winfo_exists():
             try: